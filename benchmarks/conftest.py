@@ -0,0 +1,97 @@
+"""Shared fixtures for the pytest-benchmark suite.
+
+The plugin is wired up with the same OctoPrint stubs the unit tests use, so
+benchmarks run without an OctoPrint installation.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import pytest
+
+from octoprint_temp_eta import TempETAPlugin
+from octoprint_temp_eta.history import HeaterHistory
+from tests.test_print_temp_eta import (
+    DummyLogger,
+    DummyPluginManager,
+    DummyPrinter,
+    DummyPrinterProfileManager,
+    DummySettings,
+)
+
+HISTORY_SIZES = (60, 300, 1000, 5000)
+HEATER_COUNTS = (1, 4, 10)
+
+
+def heater_names(count: int) -> list[str]:
+    """Return *count* heater names: bed, chamber, then tool0..toolN."""
+    names = ["bed", "chamber"] + [f"tool{i}" for i in range(8)]
+    return names[:count]
+
+
+def heating_history(size: int, target: float = 200.0) -> HeaterHistory:
+    """Return a full 2 Hz first-order heat-up history with *size* samples.
+
+    The time constant scales with *size* so the newest samples are still
+    well below target and every algorithm takes its full code path.
+    """
+    tau = size / 2.0
+    rows = (
+        (1_700_000_000.0 + 0.5 * i, target - 180.0 * math.exp(-i / tau), target)
+        for i in range(size)
+    )
+    return HeaterHistory(maxlen=size, rows=rows)
+
+
+def cooldown_history(size: int) -> HeaterHistory:
+    """Return a full 2 Hz Newton cooldown history with *size* samples."""
+    tau = float(size)
+    rows = (
+        (1_700_000_000.0 + 0.5 * i, 25.0 + 175.0 * math.exp(-i / tau))
+        for i in range(size)
+    )
+    return HeaterHistory(maxlen=size, fields=2, rows=rows)
+
+
+def build_plugin(tmp_path: Any, heater_count: int) -> TempETAPlugin:
+    """Create a plugin with every heater from :func:`heater_names` configured."""
+    plugin: Any = TempETAPlugin()
+    plugin._identifier = "temp_eta"
+    plugin._plugin_version = "0.0.0"
+    plugin._logger = DummyLogger()
+    plugin._plugin_manager = DummyPluginManager()
+    plugin._printer = DummyPrinter(printing=False)
+    plugin._printer_profile_manager = DummyPrinterProfileManager(
+        {
+            "id": "default",
+            "name": "Default",
+            "heatedBed": True,
+            "heatedChamber": True,
+            "extruder": {"count": max(1, heater_count - 2)},
+        }
+    )
+    plugin._settings = DummySettings(
+        {
+            "enabled": True,
+            "enable_heating_eta": True,
+            "enable_cooldown_eta": True,
+            "suppress_while_printing": False,
+            "threshold_start": 5.0,
+            "update_interval": 1.0,
+            "algorithm": "exponential",
+            "history_size": 60,
+            "debug_logging": False,
+        }
+    )
+    plugin._active_profile_id = "default"
+    plugin.get_plugin_data_folder = lambda: str(tmp_path)
+    plugin._refresh_runtime_caches()
+    return plugin
+
+
+@pytest.fixture(name="plugin_factory")
+def fixture_plugin_factory(tmp_path: Any):
+    """Return a callable building a stubbed plugin for N heaters."""
+    return lambda heater_count: build_plugin(tmp_path, heater_count)
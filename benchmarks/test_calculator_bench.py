@@ -0,0 +1,89 @@
+"""Benchmarks for the calculator functions across history sizes and heaters.
+
+Each benchmark evaluates one function for every heater of a simulated printer,
+which is what the plugin does once per ETA tick.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from octoprint_temp_eta import calculator
+
+from .conftest import (
+    HEATER_COUNTS,
+    HISTORY_SIZES,
+    cooldown_history,
+    heater_names,
+    heating_history,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend() -> Iterator[None]:
+    original = calculator.BACKEND
+    yield
+    calculator.use_backend(original)
+
+
+@pytest.mark.parametrize("backend", calculator.available_backends())
+@pytest.mark.parametrize("heaters", HEATER_COUNTS)
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+@pytest.mark.parametrize(
+    "name", ["calculate_linear_eta", "calculate_exponential_eta"]
+)
+def test_heating_eta(benchmark, name, size, heaters, backend) -> None:
+    """Heating ETA for *heaters* histories of *size* samples each."""
+    calculator.use_backend(backend)
+    func = getattr(calculator, name)
+    histories = [heating_history(size) for _ in range(heaters)]
+    benchmark.group = f"{name}-{size}"
+    benchmark.extra_info.update(size=size, heaters=heaters, backend=backend)
+
+    results = benchmark(lambda: [func(history, 200.0) for history in histories])
+
+    assert all(result is not None for result in results)
+
+
+@pytest.mark.parametrize("backend", calculator.available_backends())
+@pytest.mark.parametrize("heaters", HEATER_COUNTS)
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+@pytest.mark.parametrize(
+    "name", ["calculate_cooldown_linear_eta", "calculate_cooldown_exponential_eta"]
+)
+def test_cooldown_eta(benchmark, name, size, heaters, backend) -> None:
+    """Cooldown ETA for *heaters* histories of *size* samples each."""
+    calculator.use_backend(backend)
+    func = getattr(calculator, name)
+    histories = [cooldown_history(size) for _ in range(heaters)]
+    if name == "calculate_cooldown_linear_eta":
+        args: tuple = (40.0, 60.0)
+    else:
+        args = (25.0, 40.0, 60.0)
+    benchmark.group = f"{name}-{size}"
+    benchmark.extra_info.update(size=size, heaters=heaters, backend=backend)
+
+    results = benchmark(lambda: [func(history, *args) for history in histories])
+
+    assert all(result is not None for result in results)
+
+
+@pytest.mark.parametrize("backend", calculator.available_backends())
+@pytest.mark.parametrize("heaters", HEATER_COUNTS)
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+@pytest.mark.parametrize("algorithm", ["linear", "exponential"])
+def test_batch_eta(benchmark, algorithm, size, heaters, backend) -> None:
+    """All heaters in one calculate_batch call."""
+    calculator.use_backend(backend)
+    names = heater_names(heaters)
+    histories = {name: heating_history(size) for name in names}
+    targets = dict.fromkeys(names, 200.0)
+    config = {"algorithm": algorithm}
+    benchmark.group = f"calculate_batch-{algorithm}-{size}"
+    benchmark.extra_info.update(size=size, heaters=heaters, backend=backend)
+
+    results = benchmark(calculator.calculate_batch, histories, targets, config)
+
+    assert all(result is not None for result in results.values())
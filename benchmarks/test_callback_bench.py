@@ -0,0 +1,130 @@
+"""Benchmarks for the temperature callback hot path.
+
+Drives ``TempETAPlugin.on_printer_add_temperature`` with a simulated clock at
+the callback rates OctoPrint produces on typical and fast setups. With the
+default 1 s update interval, every ``rate``-th call also computes and
+broadcasts ETAs, so the mean reflects the amortized per-callback cost.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+import pytest
+
+import octoprint_temp_eta
+from octoprint_temp_eta import calculator
+
+from .conftest import HEATER_COUNTS, cooldown_history, heater_names
+
+
+class _SimulatedPrinter:
+    """Simulated clock plus heat-up curves for every heater."""
+
+    def __init__(self, names: list[str], rate_hz: float) -> None:
+        self.names = names
+        self.step = 1.0 / rate_hz
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def tick(self) -> dict:
+        """Advance the clock by one callback period and return temperatures."""
+        self.now += self.step
+        # Restart the heat-up every 300 s so heaters never settle at target.
+        phase = math.exp(-(self.now % 300.0) / 200.0)
+        return {
+            name: {"actual": 200.0 - 150.0 * phase, "target": 200.0}
+            for name in self.names
+        }
+
+
+@pytest.mark.parametrize("heaters", HEATER_COUNTS)
+@pytest.mark.parametrize("rate_hz", [2.0, 10.0, 50.0])
+def test_on_printer_add_temperature(
+    benchmark, monkeypatch, plugin_factory, rate_hz, heaters
+) -> None:
+    """Per-callback cost including amortized ETA ticks and persistence."""
+    plugin = plugin_factory(heaters)
+    printer = _SimulatedPrinter(heater_names(heaters), rate_hz)
+    monkeypatch.setattr(octoprint_temp_eta.time, "time", printer.time)
+
+    # Fill the history so the benchmark measures the steady state.
+    for _ in range(int(60 * rate_hz)):
+        plugin.on_printer_add_temperature(printer.tick())
+
+    benchmark.group = f"on_printer_add_temperature-{heaters}"
+    benchmark.extra_info.update(rate_hz=rate_hz, heaters=heaters)
+    benchmark(lambda: plugin.on_printer_add_temperature(printer.tick()))
+
+    assert plugin._plugin_manager.messages
+
+
+def _scan_cooldown(history: deque, now: float, window: float) -> tuple:
+    """Previous path: ambient estimate and linear ETA from full history scans."""
+    ambient = None
+    ambient_cutoff = now - max(window, 60.0)
+    recent = [t for ts, t in history if ts > ambient_cutoff and math.isfinite(t)]
+    if len(recent) >= 3 and min(recent) < recent[-1] - 2.0:
+        ambient = min(recent) - 0.5
+    fit_rows = deque(
+        (ts, t)
+        for ts, t in history
+        if math.isfinite(ts) and math.isfinite(t) and ts > now - window
+    )
+    eta = None
+    if len(fit_rows) >= 2:
+        eta = calculator.calculate_cooldown_linear_eta(fit_rows, 40.0, window)
+    return ambient, eta
+
+
+@pytest.mark.parametrize("heaters", HEATER_COUNTS)
+@pytest.mark.parametrize("variant", ["scan", "incremental"])
+def test_cooldown_display(
+    benchmark, monkeypatch, plugin_factory, variant, heaters
+) -> None:
+    """Ambient estimate plus linear cooldown ETA per heater for one tick.
+
+    ``scan`` is the previous path, which filtered plain-deque histories in
+    full on every call; ``incremental`` is the plugin with ``HeaterHistory``
+    and the per-heater ``CooldownFit``.
+    """
+    plugin = plugin_factory(heaters)
+    names = heater_names(heaters)
+    window = plugin._get_runtime_config().cooldown_fit_window_s
+    clock = {"now": 0.0}
+    for name in names:
+        history = cooldown_history(600)
+        clock["now"] = history[-1][0]
+        plugin._heaters.state(name).cooldown_history = (
+            deque(history, maxlen=600) if variant == "scan" else history
+        )
+    monkeypatch.setattr(octoprint_temp_eta.time, "time", lambda: clock["now"])
+
+    def tick() -> list:
+        clock["now"] += 0.5
+        results = []
+        for name in names:
+            state = plugin._heaters.state(name)
+            temp = 25.0 + (state.cooldown_history[-1][1] - 25.0) * 0.9999
+            state.cooldown_history.append((clock["now"], temp))
+            if variant == "scan":
+                results.append(
+                    _scan_cooldown(state.cooldown_history, clock["now"], window)
+                )
+            else:
+                results.append(
+                    (
+                        plugin._get_cooldown_ambient_c(name),
+                        plugin._calculate_cooldown_linear_eta(name, 40.0),
+                    )
+                )
+        return results
+
+    benchmark.group = f"cooldown_display-{heaters}"
+    benchmark.extra_info.update(variant=variant, heaters=heaters)
+    results = benchmark(tick)
+
+    assert len(results) == heaters
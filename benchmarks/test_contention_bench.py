@@ -0,0 +1,132 @@
+"""Lock contention stress benchmark.
+
+Runs temperature callbacks on several threads next to profile events, history
+persists and Simple API reads. The plugin lock and every per-heater lock are
+wrapped so each acquire records how long it waited; the wait percentiles are
+stored in ``extra_info`` next to the wall time of the whole run.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+import octoprint_temp_eta
+
+from .conftest import heater_names
+
+CALLBACK_THREADS = 2
+CALLBACKS_PER_THREAD = 200
+
+
+class _WaitTimingLock:
+    """threading.Lock that records the wait time of every acquire."""
+
+    def __init__(self, waits: list[float]) -> None:
+        self._lock = threading.Lock()
+        self._waits = waits
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        start = time.perf_counter()
+        acquired = self._lock.acquire(blocking, timeout)
+        self._waits.append(time.perf_counter() - start)
+        return acquired
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+def _percentile_ms(waits: list[float], fraction: float) -> float:
+    if not waits:
+        return 0.0
+    ordered = sorted(waits)
+    return 1000.0 * ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@pytest.mark.parametrize("heaters", [4, 10])
+def test_concurrent_callbacks_events_and_api(
+    benchmark, monkeypatch, plugin_factory, heaters
+) -> None:
+    """Wall time and lock waits of a concurrent callback/event/API workload."""
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+    plugin = plugin_factory(heaters)
+    plugin._settings.set(["update_interval"], 0.0)
+    plugin._refresh_runtime_caches()
+    names = heater_names(heaters)
+
+    def temperatures(step: int) -> dict:
+        phase = step % 100
+        return {
+            name: {"actual": 50.0 + phase, "target": 200.0 if phase < 80 else 0.0}
+            for name in names
+        }
+
+    plugin.on_printer_add_temperature(temperatures(0))
+    global_waits: list[float] = []
+    heater_waits: list[float] = []
+    plugin._lock = _WaitTimingLock(global_waits)
+    for state in plugin._heaters:
+        state.lock = _WaitTimingLock(heater_waits)
+
+    errors: list[BaseException] = []
+
+    def run() -> None:
+        done = threading.Event()
+
+        def callbacks() -> None:
+            try:
+                for step in range(CALLBACKS_PER_THREAD):
+                    plugin.on_printer_add_temperature(temperatures(step))
+            except BaseException as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        def until_done(fn) -> None:
+            try:
+                while not done.is_set():
+                    fn()
+                    time.sleep(0.001)
+            except BaseException as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        workers = [threading.Thread(target=callbacks) for _ in range(CALLBACK_THREADS)]
+        background = [
+            threading.Thread(
+                target=until_done,
+                args=(lambda: plugin.on_event("PrinterProfileModified", {}),),
+            ),
+            threading.Thread(
+                target=until_done, args=(plugin._persist_current_profile_history,)
+            ),
+            threading.Thread(target=until_done, args=(lambda: plugin.on_api_get(None),)),
+        ]
+        for thread in workers + background:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        done.set()
+        for thread in background:
+            thread.join()
+
+    benchmark.group = "lock-contention"
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info.update(
+        heaters=heaters,
+        callbacks=CALLBACK_THREADS * CALLBACKS_PER_THREAD,
+        global_lock_acquires=len(global_waits),
+        global_lock_wait_p99_ms=_percentile_ms(global_waits, 0.99),
+        global_lock_wait_max_ms=_percentile_ms(global_waits, 1.0),
+        heater_lock_acquires=len(heater_waits),
+        heater_lock_wait_p99_ms=_percentile_ms(heater_waits, 0.99),
+        heater_lock_wait_max_ms=_percentile_ms(heater_waits, 1.0),
+    )
+
+    assert not errors
+    assert plugin._plugin_manager.messages
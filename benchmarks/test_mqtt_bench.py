@@ -0,0 +1,78 @@
+"""Benchmarks for MQTT topic building and payload encoding.
+
+Measures what the MQTT publisher does per tick for every heater: resolve the
+ETA topic and encode the ETA document. ``baseline`` is the previous path (an
+f-string topic and ``json.dumps(..., ensure_ascii=False)`` per publish); the
+other variants use the wrapper's topic table with each available
+:class:`~octoprint_temp_eta.mqtt_payload.PayloadEncoder`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from octoprint_temp_eta.mqtt_client import MQTTClientWrapper
+from octoprint_temp_eta.mqtt_payload import PayloadEncoder, available_encoders
+
+from .conftest import DummyLogger
+
+MQTT_HEATER_COUNTS = (1, 8, 16)
+BASE_TOPIC = "octoprint/temp_eta/printer"
+
+
+def _documents(count: int) -> dict[str, dict[str, Any]]:
+    """Return one ETA document per heater, as the MQTT wrapper builds them."""
+    names = ["bed", "chamber"] + [f"tool{i}" for i in range(count)]
+    return {
+        name: {
+            "heater": name,
+            "eta_seconds": 42.5 + i,
+            "eta_kind": "heating",
+            "target": 210.0,
+            "actual": 150.2 + i / 10.0,
+            "cooldown_target": None,
+            "timestamp": 1_767_225_600.125,
+            "state": "heating",
+        }
+        for i, name in enumerate(names[:count])
+    }
+
+
+def _baseline(documents: dict[str, dict[str, Any]]) -> list:
+    return [
+        (f"{BASE_TOPIC}/{heater}/eta", json.dumps(doc, ensure_ascii=False))
+        for heater, doc in documents.items()
+    ]
+
+
+@pytest.mark.parametrize("heaters", MQTT_HEATER_COUNTS)
+@pytest.mark.parametrize("variant", ("baseline",) + available_encoders())
+def test_mqtt_topic_and_encode(benchmark, variant, heaters) -> None:
+    """Topic lookup plus payload encoding for one tick of *heaters* documents."""
+    documents = _documents(heaters)
+
+    if variant == "baseline":
+        tick = lambda: _baseline(documents)  # noqa: E731
+    else:
+        wrapper: Any = MQTTClientWrapper(DummyLogger(), "temp_eta")
+        wrapper._base_topic = BASE_TOPIC
+        encoder = PayloadEncoder(variant)
+
+        def tick() -> list:
+            with wrapper._lock:
+                return [
+                    (wrapper._topics_for(heater)[0], encoder.encode(doc))
+                    for heater, doc in documents.items()
+                ]
+
+    benchmark.group = f"mqtt_topic_and_encode-{heaters}"
+    benchmark.extra_info.update(variant=variant, heaters=heaters)
+    result = benchmark(tick)
+
+    assert [json.loads(payload) for _, payload in result] == list(documents.values())
+    assert [topic for topic, _ in result] == [
+        f"{BASE_TOPIC}/{heater}/eta" for heater in documents
+    ]
@@ -12,7 +12,6 @@ import math
 import re
 import threading
 import time
-from collections import deque
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any, Dict, Optional, Protocol, Type, runtime_checkable
@@ -132,6 +131,19 @@ except ImportError as e:  # pragma: no cover
     logging.getLogger("octoprint_temp_eta").error("Calculator module missing: %s", e)
     raise
 
+from .heater_state import HeaterFieldView, HeaterRegistry, HeaterState
+from .history import HeaterHistory
+from .metrics import MetricsRegistry, timed
+from .persistence import (
+    FSYNC_NONE,
+    FSYNC_POLICIES,
+    RECORD_SIZE,
+    HistoryFile,
+    read_history_file,
+)
+from .runtime_config import RuntimeConfig
+from .worker import CoalescingWorker
+
 
 @runtime_checkable
 class LoggerLike(Protocol):
@@ -192,6 +204,75 @@ class PrinterLike(Protocol):
     def get_state_id(self) -> str: ...
 
 
+# Smallest change of a heater's actual temperature worth sending to the
+# frontend, which displays one decimal.
+_ACTUAL_DELTA_C = 0.1
+# The frontend counts a sent ETA down on its own. A new ETA is only sent once
+# it deviates from that countdown by this many seconds, or by this fraction
+# of the ETA if that is larger.
+_ETA_DEVIATION_S = 2.0
+_ETA_DEVIATION_RATIO = 0.05
+
+
+def _eta_on_countdown(sent: Dict[str, Any], entry: Dict[str, Any]) -> bool:
+    """Return whether the ETA of *entry* matches the countdown of the *sent* one."""
+    eta = entry.get("eta")
+    sent_eta = sent.get("eta")
+    sent_ts = sent.get("eta_ts")
+    if eta is None or sent_eta is None or sent_ts is None:
+        return False
+    if entry.get("eta_kind") != sent.get("eta_kind"):
+        return False
+    predicted = sent_eta - (entry["eta_ts"] - sent_ts)
+    return abs(eta - predicted) < max(_ETA_DEVIATION_S, _ETA_DEVIATION_RATIO * eta)
+
+
+def _entry_delta(sent: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields of *entry* that differ from the previously *sent* ones.
+
+    The actual temperature only counts as changed once it moved by at least
+    ``_ACTUAL_DELTA_C`` from the sent value, so sensor noise around a steady
+    temperature does not produce updates. The ETA only counts as changed when
+    it left the countdown the frontend interpolates from the sent ETA and its
+    ``eta_ts``; ``eta_ts`` is sent along with every new ETA.
+    """
+    delta = {}
+    for key, value in entry.items():
+        if key == "eta_ts":
+            continue
+        if key not in sent:
+            delta[key] = value
+            continue
+        previous = sent[key]
+        if key == "actual" and value is not None and previous is not None:
+            if abs(value - previous) < _ACTUAL_DELTA_C:
+                continue
+        elif key == "eta" and _eta_on_countdown(sent, entry):
+            continue
+        elif value == previous:
+            continue
+        delta[key] = value
+    if "eta" in delta and "eta_ts" in entry:
+        delta["eta_ts"] = entry["eta_ts"]
+    return delta
+
+
+def _heater_field_property(field: str, doc: str) -> property:
+    """Dict-style attribute over one HeaterState field of every heater.
+
+    Reading returns a live view; assigning a mapping replaces the field on
+    all heaters (heaters missing from the mapping get None).
+    """
+
+    def fget(self: "TempETAPlugin") -> HeaterFieldView:
+        return self._heaters.field(field)
+
+    def fset(self: "TempETAPlugin", value: Any) -> None:
+        self._heaters.assign(field, value)
+
+    return property(fget, fset, doc=doc)
+
+
 class TempETAPlugin(
     PrinterCallbackBase,
     StartupPluginBase,
@@ -217,9 +298,31 @@ class TempETAPlugin(
     _identifier: str
     _plugin_version: str
 
+    # Per-field views over self._heaters for code that works on one field
+    # across all heaters (persistence, resets). Hot paths use the registry.
+    _temp_history = _heater_field_property(
+        "history", "Heating (ts, actual, target) history by heater name."
+    )
+    _cooldown_history = _heater_field_property(
+        "cooldown_history", "Cooldown (ts, actual) history by heater name."
+    )
+    _cooldown_ambient_baseline = _heater_field_property(
+        "ambient_baseline", "Learned ambient baseline by heater name."
+    )
+    _last_target_by_heater = _heater_field_property(
+        "last_target", "Last seen target by heater name."
+    )
+    _last_heater_support_decision = _heater_field_property(
+        "support_logged", "Last logged heater support decision by heater name."
+    )
+
     def __init__(self):
         """Initialize plugin with temperature history tracking."""
         super().__init__()
+        # Guards the active profile id, which history containers belong to the
+        # heaters (replaced on profile switch) and the dirty flags. Per-heater
+        # data is guarded by each HeaterState.lock; take self._lock first when
+        # both are needed and never hold it across ETA calculations.
         self._lock = threading.Lock()
         # Serializes profile-switch sequences against each other. Acquired
         # around the persist -> id-swap -> history-replace flow performed
@@ -230,12 +333,40 @@ class TempETAPlugin(
 
         self._debug_logging_enabled = False
         self._last_debug_log_time = 0.0
-        self._last_heater_support_decision = {}
-        self._heater_supported_cache: dict[str, bool] = {}
+        # One slotted state object per heater (histories, last target, ambient
+        # baseline, support decision, last ETA, heating fit), keyed by interned
+        # name. The hot path looks a heater up once per tick.
+        self._heaters = HeaterRegistry()
+        # Bumped by printer profile/connection events. The temperature callback
+        # only re-checks the active profile when this moved past the value it
+        # last synced, and _is_heater_supported drops its cache on a change.
+        self._profile_generation = 0
+        self._profile_synced_generation = -1
+        self._heater_supported_generation = 0
+
+        # The websocket broadcast only carries heater fields that changed
+        # since the last message. Every _eta_keyframe_interval_s seconds, and
+        # whenever _eta_keyframe_due is set (new client, cleared heaters), it
+        # sends all fields instead so clients resynchronize. Guarded by
+        # self._lock.
+        self._eta_keyframe_interval_s = 30.0
+        self._eta_keyframe_time = 0.0
+        self._eta_keyframe_due = True
+        self._sent_cooldown_mode: Optional[str] = None
 
         # MQTT client (initialized in on_after_startup when logger is available)
         self._mqtt_client: Optional[Any] = None
 
+        # Always-on per-stage latency histograms, reported by on_api_get.
+        self._metrics = MetricsRegistry()
+
+        # Background worker running ETA ticks off the temperature callback
+        # thread (started in on_after_startup). Without it, ticks run inline.
+        self._eta_worker: Optional[CoalescingWorker] = None
+        # Writes history files off the ETA worker; persist requests coalesce
+        # because each write snapshots the newest in-memory history.
+        self._persist_worker: Optional[CoalescingWorker] = None
+
         # Number of temperature samples to keep per heater.
         # This is configurable via settings (history_size). We cache the active
         # value here for fast access in the 2Hz callback.
@@ -262,7 +393,26 @@ class TempETAPlugin(
         # with the history lock taken by _persist_current_profile_history.
         self._persist_state_lock = threading.Lock()
         self._last_persist_size_warning_time = 0.0
+        # Hard cap for the binary history file (the setting predates the
+        # binary format, hence the name).
         self._persist_max_json_bytes = 256 * 1024
+        # Append state of the active profile's history file. None forces the
+        # next persist to compact (rewrite) the file from memory.
+        self._history_file: Optional[HistoryFile] = None
+        # Checkpoint (compact) after this many journal entries even if the
+        # file is below its size threshold, bounding replay work on load.
+        self._persist_checkpoint_entries = 64
+        # Durability policy for history writes (see persistence.FSYNC_POLICIES).
+        self._persist_fsync = FSYNC_NONE
+        # Upper bound for the synchronous persist on shutdown.
+        self._persist_flush_timeout_s = 5.0
+        # (profile id, [(heater, lock, history)]) snapshots detached from the
+        # heaters on disconnect/error and not yet written (an empty list when
+        # there was nothing unsaved); guarded by self._lock.
+        self._pending_persist: list = []
+        # Serializes history file I/O (append/compact/delete). Taken before,
+        # never while holding, self._lock.
+        self._persist_io_lock = threading.Lock()
         self._persist_max_age_seconds = 180.0
         self._history_dirty = False
         # Monotonic counter bumped whenever new history data is recorded.
@@ -270,40 +420,25 @@ class TempETAPlugin(
         # flag if it is unchanged after the write (no concurrent update).
         self._history_dirty_epoch = 0
 
-        self._temp_history = {
-            "bed": deque(maxlen=self._history_maxlen),
-            "tool0": deque(maxlen=self._history_maxlen),
-            "chamber": deque(maxlen=self._history_maxlen),
-        }
-
-        # Cooldown history (target==0). Kept separate from heating history so
-        # the heat-up ETA fit doesn't get polluted by cooldown samples.
-        self._cooldown_history = {
-            "bed": deque(maxlen=self._history_maxlen),
-            "tool0": deque(maxlen=self._history_maxlen),
-            "chamber": deque(maxlen=self._history_maxlen),
-        }
-
-        # Ambient baseline per heater for ambient-mode cooldown.
-        # If the user doesn't provide an ambient temperature, we rely on the
-        # lowest temperature observed while the heater target is OFF (within a
-        # reasonable range) as a proxy for ambient.
-        self._cooldown_ambient_baseline: dict[str, Optional[float]] = {
-            "bed": None,
-            "tool0": None,
-            "chamber": None,
-        }
+        # Cooldown history (target==0) is kept separate from heating history
+        # so the heat-up ETA fit doesn't get polluted by cooldown samples.
+        #
+        # The ambient baseline is used by ambient-mode cooldown when the user
+        # doesn't provide an ambient temperature: the lowest temperature
+        # observed while the heater target is OFF (within a reasonable range).
+        #
+        # Heating fits are synchronized lazily from the heating history so
+        # per-tick cost scales with new samples only.
+        for heater in ("bed", "tool0", "chamber"):
+            state = self._heaters.state(heater)
+            state.history = self._new_heater_history()
+            state.cooldown_history = self._new_heater_history(fields=2)
         self._last_update_time = 0.0
 
-        # Cache hot-path settings values for fast access in the ~2Hz callback.
-        # Refreshed on startup and on settings save.
-        self._threshold_start_c = 5.0
-        self._update_interval_s = 1.0
-        self._last_runtime_cache_refresh_time = 0.0
-
-        # Track last seen target per heater so we can detect transitions like
-        # heating -> off (cooldown start).
-        self._last_target_by_heater: dict[str, float] = {}
+        # Validated hot-path settings for the ~2Hz callback. Rebuilt on
+        # startup and on settings save and swapped in as a whole; built on
+        # first use if a callback arrives before startup.
+        self._runtime_config: Optional[RuntimeConfig] = None
 
         # When enabled, suppress ETA updates while a print job is active.
         # This keeps the UI focused on the pre-print heat-up phase.
@@ -314,6 +449,16 @@ class TempETAPlugin(
 
         self._last_settings_snapshot_log_time = 0.0
 
+    def _new_heater_history(self, fields: int = 3, rows=None) -> HeaterHistory:
+        """Create an empty per-heater history sized to the active maxlen.
+
+        Args:
+            fields (int): Floats per sample: 3 for (ts, actual, target)
+                heating rows, 2 for (ts, actual) cooldown rows.
+            rows: Optional initial rows.
+        """
+        return HeaterHistory(self._history_maxlen, fields=fields, rows=rows)
+
     def _debug_log_settings_snapshot(self, now: float) -> None:
         """Throttled debug log of key plugin settings.
 
@@ -440,8 +585,21 @@ class TempETAPlugin(
         self._set_history_maxlen(self._read_history_maxlen_setting())
 
         # Load persisted history for the active printer profile.
+        self._profile_synced_generation = self._profile_generation
         self._switch_active_profile_if_needed(force=True)
 
+        self._eta_worker = CoalescingWorker(
+            self._process_eta_tick, self._logger, name="temp_eta-eta"
+        )
+        self._eta_worker.start()
+        self._persist_worker = CoalescingWorker(
+            self._process_persist_request,
+            self._logger,
+            name="temp_eta-persist",
+            maxsize=1,
+        )
+        self._persist_worker.start()
+
         # Initialize MQTT client
         if MQTTClientWrapper is not None:
             self._mqtt_client = MQTTClientWrapper(self._logger, self._identifier)
@@ -473,6 +631,12 @@ class TempETAPlugin(
             "mqtt_publish_interval": self._settings.get_float(
                 ["mqtt_publish_interval"]
             ),
+            "mqtt_topic_mode": self._settings.get(["mqtt_topic_mode"]),
+            "mqtt_eta_deadband_s": self._settings.get_float(["mqtt_eta_deadband_s"]),
+            "mqtt_actual_deadband_c": self._settings.get_float(
+                ["mqtt_actual_deadband_c"]
+            ),
+            "mqtt_heartbeat_s": self._settings.get_float(["mqtt_heartbeat_s"]),
         }
 
         self._mqtt_client.configure(mqtt_settings)
@@ -482,20 +646,7 @@ class TempETAPlugin(
         if not getattr(self, "_settings", None):
             return
 
-        try:
-            v = float(self._settings.get_float(["threshold_start"]))
-            if math.isfinite(v) and v > 0:
-                self._threshold_start_c = v
-        except (AttributeError, RuntimeError, TypeError, ValueError):
-            pass
-
-        try:
-            v = float(self._settings.get_float(["update_interval"]))
-            # Allow 0.0 as a special case meaning "update on every callback".
-            if math.isfinite(v) and v >= 0:
-                self._update_interval_s = v
-        except (AttributeError, RuntimeError, TypeError, ValueError):
-            pass
+        self._runtime_config = self._build_runtime_config()
 
         # Persistence tuning (advanced settings; safe defaults apply).
         # These values are not exposed in the UI, but can be configured via config.yaml.
@@ -543,6 +694,76 @@ class TempETAPlugin(
         except (AttributeError, RuntimeError, TypeError, ValueError):
             pass
 
+        try:
+            fsync = str(self._settings.get(["persist_fsync"]) or "").strip().lower()
+            if fsync in FSYNC_POLICIES:
+                self._persist_fsync = fsync
+        except (AttributeError, RuntimeError, TypeError, ValueError):
+            pass
+
+    def _build_runtime_config(self) -> RuntimeConfig:
+        """Read and validate the hot-path settings into a new snapshot.
+
+        Invalid or unreadable values fall back to the previous snapshot's
+        value (or the default on first build).
+        """
+        previous = self._runtime_config or RuntimeConfig()
+        threshold_start_c = previous.threshold_start_c
+        update_interval_s = previous.update_interval_s
+        settings = getattr(self, "_settings", None)
+        if settings is None:
+            return previous
+
+        try:
+            v = float(settings.get_float(["threshold_start"]))
+            if math.isfinite(v) and v > 0:
+                threshold_start_c = v
+        except (AttributeError, RuntimeError, TypeError, ValueError):
+            pass
+
+        try:
+            v = float(settings.get_float(["update_interval"]))
+            # Allow 0.0 as a special case meaning "update on every callback".
+            if math.isfinite(v) and v >= 0:
+                update_interval_s = v
+        except (AttributeError, RuntimeError, TypeError, ValueError):
+            pass
+
+        try:
+            enabled = bool(settings.get_boolean(["enabled"]))
+        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
+            enabled = previous.enabled
+
+        try:
+            algorithm = str(settings.get(["algorithm"]) or "")
+        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
+            algorithm = previous.algorithm
+
+        return RuntimeConfig(
+            enabled=enabled,
+            suppress_while_printing=self._suppress_while_printing_enabled(),
+            algorithm=algorithm,
+            threshold_start_c=threshold_start_c,
+            update_interval_s=update_interval_s,
+            heating_enabled=self._heating_enabled(),
+            cooldown_enabled=self._cooldown_enabled(),
+            cooldown_mode=self._cooldown_mode(),
+            cooldown_hysteresis_c=self._cooldown_hysteresis_c(),
+            cooldown_fit_window_s=self._cooldown_fit_window_seconds(),
+            cooldown_target_tool_c=self._get_cooldown_threshold_target_c("tool0"),
+            cooldown_target_bed_c=self._get_cooldown_threshold_target_c("bed"),
+            cooldown_target_chamber_c=self._get_cooldown_threshold_target_c("chamber"),
+            cooldown_ambient_c=self._read_cooldown_ambient_setting(),
+        )
+
+    def _get_runtime_config(self) -> RuntimeConfig:
+        """Return the current hot-path settings snapshot."""
+        config = self._runtime_config
+        if config is None:
+            config = self._build_runtime_config()
+            self._runtime_config = config
+        return config
+
     def _reset_persist_backoff(self, now: float, reason: str) -> None:
         """Reset persistence backoff schedule.
 
@@ -599,7 +820,11 @@ class TempETAPlugin(
         return "default"
 
     def _get_profile_history_path(self, profile_id: str) -> Path:
-        """Return the history file path for a given profile id."""
+        """Return the binary history file path for a given profile id."""
+        return self._get_legacy_profile_history_path(profile_id).with_suffix(".bin")
+
+    def _get_legacy_profile_history_path(self, profile_id: str) -> Path:
+        """Return the pre-binary JSON history file path for a profile id."""
         safe = re.sub(r"[^a-zA-Z0-9_.-]+", "_", profile_id or "default")
         folder = Path(self.get_plugin_data_folder())
         folder.mkdir(parents=True, exist_ok=True)
@@ -615,22 +840,32 @@ class TempETAPlugin(
             bool: True if a file was deleted, False if nothing was deleted.
         """
         deleted = False
-        try:
-            path = self._get_profile_history_path(profile_id)
-            if path.exists():
-                path.unlink()
-                deleted = True
-        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
-            self._logger.debug(
-                "Failed to delete history file for profile '%s'",
-                str(profile_id),
-                exc_info=True,
-            )
+        with self._persist_io_lock:
+            self._history_file = None
+            try:
+                for path in (
+                    self._get_profile_history_path(profile_id),
+                    self._get_legacy_profile_history_path(profile_id),
+                ):
+                    if path.exists():
+                        path.unlink()
+                        deleted = True
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                self._logger.debug(
+                    "Failed to delete history file for profile '%s'",
+                    str(profile_id),
+                    exc_info=True,
+                )
 
         with self._lock:
-            heaters = list(self._temp_history.keys())
-            for h in heaters:
-                self._temp_history[h].clear()
+            heaters = self._clear_heater_histories()
             self._history_dirty = False
 
         self._send_clear_messages(heaters)
@@ -649,33 +884,46 @@ class TempETAPlugin(
         folder = Path(self.get_plugin_data_folder())
         deleted_count = 0
 
-        try:
-            folder.mkdir(parents=True, exist_ok=True)
-            for path in folder.glob("history_*.json"):
-                try:
-                    if path.is_file():
-                        path.unlink()
-                        deleted_count += 1
-                except (
-                    AttributeError,
-                    KeyError,
-                    OSError,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
-                ):
-                    self._logger.debug(
-                        "Failed to delete history file '%s'", str(path), exc_info=True
-                    )
-        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
-            self._logger.debug(
-                "Failed to enumerate history files in '%s'", str(folder), exc_info=True
-            )
+        with self._persist_io_lock:
+            self._history_file = None
+            try:
+                folder.mkdir(parents=True, exist_ok=True)
+                paths = list(folder.glob("history_*.bin"))
+                paths.extend(folder.glob("history_*.json"))
+                for path in paths:
+                    try:
+                        if path.is_file():
+                            path.unlink()
+                            deleted_count += 1
+                    except (
+                        AttributeError,
+                        KeyError,
+                        OSError,
+                        RuntimeError,
+                        TypeError,
+                        ValueError,
+                    ):
+                        self._logger.debug(
+                            "Failed to delete history file '%s'",
+                            str(path),
+                            exc_info=True,
+                        )
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                self._logger.debug(
+                    "Failed to enumerate history files in '%s'",
+                    str(folder),
+                    exc_info=True,
+                )
 
         with self._lock:
-            heaters = list(self._temp_history.keys())
-            for h in heaters:
-                self._temp_history[h].clear()
+            heaters = self._clear_heater_histories()
             self._history_dirty = False
 
         self._send_clear_messages(heaters)
@@ -722,33 +970,74 @@ class TempETAPlugin(
         self._refresh_runtime_caches()
         self._set_history_maxlen(self._read_history_maxlen_setting())
 
-    def _load_profile_history(self, profile_id: str) -> dict[str, deque]:
+    def _load_profile_history(self, profile_id: str) -> dict[str, HeaterHistory]:
         """Load persisted history for a profile id.
 
-        Returns a dict mapping heater name to a deque with current maxlen.
+        Returns a dict mapping heater name to a history with current maxlen.
         """
-        path = self._get_profile_history_path(profile_id)
-        if not path.exists():
-            return {}
+        return self._replay_profile_history(profile_id)[0]
 
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
-            self._logger.debug(
-                "Failed to read history file for profile '%s'",
-                profile_id,
-                exc_info=True,
-            )
-            return {}
+    def _replay_profile_history(
+        self, profile_id: str
+    ) -> tuple[dict[str, HeaterHistory], Optional[HistoryFile]]:
+        """Replay the history file of a profile (checkpoint plus journal).
 
-        samples = payload.get("samples") if isinstance(payload, dict) else None
-        if not isinstance(samples, dict):
-            return {}
+        If only a legacy ``version: 1`` JSON file exists, it is loaded and
+        migrated to the binary format once.
+
+        Returns:
+            Tuple of (heater name to history with current maxlen, append
+            state to resume journaling into the file, or None if the next
+            persist has to checkpoint)
+        """
+        path = self._get_profile_history_path(profile_id)
+        legacy_path = None
+        history_file: Optional[HistoryFile] = None
+        if path.exists():
+            try:
+                history_file, samples = HistoryFile.open(path)
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                self._logger.debug(
+                    "Failed to read history file for profile '%s'",
+                    profile_id,
+                    exc_info=True,
+                )
+                return {}, None
+        else:
+            legacy_path = self._get_legacy_profile_history_path(profile_id)
+            if not legacy_path.exists():
+                return {}, None
+            try:
+                payload = json.loads(legacy_path.read_text(encoding="utf-8"))
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                self._logger.debug(
+                    "Failed to read history file for profile '%s'",
+                    profile_id,
+                    exc_info=True,
+                )
+                return {}, None
+            samples = payload.get("samples") if isinstance(payload, dict) else None
+            if not isinstance(samples, dict):
+                return {}, None
 
         now = time.time()
         min_ts = now - self._persist_max_age_seconds
 
-        loaded: dict[str, deque] = {}
+        loaded: dict[str, HeaterHistory] = {}
         for heater, points in samples.items():
             if not isinstance(heater, str) or not isinstance(points, list):
                 continue
@@ -776,125 +1065,288 @@ class TempETAPlugin(
                 cleaned.append((ts, actual, target))
 
             if cleaned:
-                loaded[heater] = deque(
-                    cleaned[-self._history_maxlen :], maxlen=self._history_maxlen
+                # HeaterHistory only accepts rows in timestamp order.
+                cleaned.sort(key=lambda row: row[0])
+                loaded[heater] = self._new_heater_history(
+                    rows=cleaned[-self._history_maxlen :]
                 )
 
-        return loaded
+        if legacy_path is not None:
+            history_file = self._migrate_legacy_history(profile_id, legacy_path, loaded)
+        elif history_file is not None:
+            # Journaling resumes only if every row at or below a heater's mark
+            # is in memory; a row dropped as "from the future" would otherwise
+            # hide newer samples until the clock caught up with it.
+            for heater, (mark_ts, _) in history_file.marks.items():
+                history = loaded.get(heater)
+                if mark_ts > (history[-1][0] if history else min_ts):
+                    history_file = None
+                    break
+
+        return loaded, history_file
+
+    def _migrate_legacy_history(
+        self, profile_id: str, legacy_path: Path, loaded: dict[str, HeaterHistory]
+    ) -> Optional[HistoryFile]:
+        """Write *loaded* JSON history as a binary file and drop the JSON file.
+
+        Returns:
+            The append state of the new file, or None if migration failed
+        """
+        with self._persist_io_lock:
+            try:
+                path = self._get_profile_history_path(profile_id)
+                history_file = HistoryFile(path)
+                history_file.compact(
+                    {heater: list(history) for heater, history in loaded.items()}
+                )
+                legacy_path.unlink()
+                self._logger.info(
+                    "Migrated history for profile '%s' to binary format",
+                    str(profile_id),
+                )
+                return history_file
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                self._logger.debug(
+                    "Failed to migrate history file for profile '%s'",
+                    str(profile_id),
+                    exc_info=True,
+                )
+        return None
 
+    @timed("persist_history")
     def _persist_current_profile_history(self) -> None:
-        """Persist current in-memory history to the active profile's file."""
-        with self._lock:
-            profile_id = getattr(self, "_active_profile_id", None)
-            if not profile_id:
-                return
-            if not self._history_dirty:
-                return
-            # Snapshot the history and the dirty epoch atomically. Any sample
-            # appended after this point increments _history_dirty_epoch, so we
-            # can detect a concurrent update and avoid clearing its dirty signal.
-            dirty_epoch = self._history_dirty_epoch
-            samples = {
-                heater: [[ts, actual, target] for (ts, actual, target) in history]
-                for heater, history in self._temp_history.items()
-            }
-        try:
-            path = self._get_profile_history_path(profile_id)
+        """Persist in-memory history to the active profile's binary file.
+
+        Samples above each heater's high-water mark are appended as one
+        journal entry. The file is checkpointed (rewritten from the full
+        in-memory history) when there is no append state for it, when a heater
+        not yet in the file shows up, every ``_persist_checkpoint_entries``
+        journal entries, or once appending would grow it past
+        :meth:`_persist_compact_threshold`.
+        """
+        with self._persist_io_lock:
+            with self._lock:
+                pending = self._pending_persist
+                self._pending_persist = []
+            for pending_profile_id, pending_sources in pending:
+                # History detached on disconnect/error: write it before the
+                # (by then mostly empty) live history.
+                if pending_profile_id and pending_sources:
+                    self._persist_history_sources(
+                        pending_profile_id, pending_sources, None
+                    )
+            if pending:
+                # The journal marks describe the detached containers, not the
+                # fresh ones; checkpoint the live history on its next write.
+                self._history_file = None
 
-            total_samples = sum(len(v) for v in samples.values())
-            if total_samples <= 0:
+            profile_id = None
+            try:
+                with self._lock:
+                    profile_id = getattr(self, "_active_profile_id", None)
+                    if not profile_id:
+                        return
+                    if not self._history_dirty:
+                        return
+                    # Capture the dirty epoch before copying rows. Any sample
+                    # appended after this point increments _history_dirty_epoch,
+                    # so we can detect a concurrent update and avoid clearing its
+                    # dirty signal.
+                    dirty_epoch = self._history_dirty_epoch
+                    # The profile id and history containers are captured together;
+                    # a profile switch replaces the containers under this lock.
+                    sources = [
+                        (state.name, state.lock, state.history)
+                        for state in self._heaters
+                        if state.history is not None
+                    ]
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                self._logger.debug(
+                    "Failed to persist history for profile '%s'",
+                    str(profile_id),
+                    exc_info=True,
+                )
                 return
+            self._persist_history_sources(profile_id, sources, dirty_epoch)
 
-            payload = {
-                "version": 1,
-                "saved_at": time.time(),
-                "profile_id": profile_id,
-                "history_size": self._history_maxlen,
-                "samples": samples,
-            }
+    def _persist_history_sources(self, profile_id, sources, dirty_epoch) -> None:
+        """Write the rows of *sources* to *profile_id*'s history file.
 
-            # Serialize first so we can enforce a hard size cap.
-            # This is a safety net; primary size bounding happens via maxlen.
-            json_text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-            json_bytes = json_text.encode("utf-8")
+        Caller holds ``self._persist_io_lock``.
 
-            max_bytes = int(getattr(self, "_persist_max_json_bytes", 256 * 1024))
-            if 0 < max_bytes < len(json_bytes):
-                now = time.time()
-                # Throttle warnings to avoid log spam in pathological cases.
-                if (
-                    now - float(getattr(self, "_last_persist_size_warning_time", 0.0))
-                ) >= 300.0:
-                    self._last_persist_size_warning_time = now
-                    self._logger.warning(
-                        "Persisted history JSON exceeds cap (%d > %d bytes); trimming history",
-                        int(len(json_bytes)),
-                        int(max_bytes),
-                    )
-
-                # Aggressively trim older samples while keeping most recent data for ETA.
-                # Limit to a few iterations to keep this bounded.
-                for _ in range(5):
-                    trimmed_any = False
-                    for heater, points in list(samples.items()):
-                        if not isinstance(points, list) or len(points) <= 2:
-                            continue
-                        # Keep at least 2 points, otherwise ETA cannot work reliably.
-                        keep = max(2, int(len(points) * 0.5))
-                        if keep < len(points):
-                            samples[heater] = points[-keep:]
-                            trimmed_any = True
-
-                    if not trimmed_any:
-                        break
-
-                    payload["samples"] = samples
-                    json_text = json.dumps(
-                        payload, ensure_ascii=False, separators=(",", ":")
-                    )
-                    json_bytes = json_text.encode("utf-8")
-                    if len(json_bytes) <= max_bytes:
-                        break
+        Args:
+            profile_id (str): Profile whose file is written.
+            sources (list): ``(heater, lock, history)`` tuples; each history
+                is read under its lock.
+            dirty_epoch (int): Dirty epoch captured with *sources*; the dirty
+                flag is cleared after the write if it is unchanged. None
+                leaves the flag alone.
+        """
+        try:
+            path = self._get_profile_history_path(profile_id)
 
-            # Atomic write: write to tmp file in same directory and replace.
-            tmp_path = path.with_name(path.name + ".tmp")
-            try:
-                tmp_path.write_bytes(json_bytes)
-                tmp_path.replace(path)
-            finally:
-                # Best-effort cleanup if something went wrong before replace.
-                try:
-                    if tmp_path.exists():
-                        tmp_path.unlink()
-                except (
-                    AttributeError,
-                    KeyError,
-                    OSError,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
+            # Journal path: copy only the rows above each heater's
+            # high-water mark, which is O(new samples). Each heater is
+            # locked only while its own rows are copied.
+            history_file = self._history_file
+            lengths = {}
+            rows = None
+            if (
+                history_file is not None
+                and history_file.path == path
+                and history_file.entries < self._persist_checkpoint_entries
+            ):
+                rows = {}
+                for heater, lock, history in sources:
+                    with lock:
+                        lengths[heater] = len(history)
+                        rows.update(history_file.new_rows({heater: history}))
+                if not history_file.can_append(rows) or (
+                    history_file.size
+                    + RECORD_SIZE * sum(len(v) for v in rows.values())
+                    > self._persist_compact_threshold(lengths)
                 ):
-                    pass
+                    rows = None
+            else:
+                history_file = HistoryFile(path)
+
+            # Checkpoint path: snapshot the full history.
+            samples = None
+            if rows is None:
+                samples = {}
+                for heater, lock, history in sources:
+                    with lock:
+                        samples[heater] = [
+                            (ts, actual, target) for (ts, actual, target) in history
+                        ]
+                        lengths[heater] = len(samples[heater])
+
+            total_samples = sum(lengths.values())
+            if total_samples <= 0:
+                return
+
+            # Drop the append state up front so a failed write forces a
+            # checkpoint instead of appending after a torn record.
+            self._history_file = None
+            fsync = self._persist_fsync
+            if rows is not None:
+                written = history_file.append(rows, fsync)
+                mode = "append"
+            else:
+                written = history_file.compact(
+                    self._trim_persist_samples(samples), fsync
+                )
+                mode = "compact"
+            self._history_file = history_file
 
             # Only clear the dirty flag if no new sample landed during the
             # write. If the epoch advanced, a concurrent callback recorded data
             # not in this snapshot; leave the flag set so it persists next time.
-            with self._lock:
-                if self._history_dirty_epoch == dirty_epoch:
-                    self._history_dirty = False
+            if dirty_epoch is not None:
+                with self._lock:
+                    if self._history_dirty_epoch == dirty_epoch:
+                        self._history_dirty = False
             self._debug_log(
-                "Persisted history profile=%s samples=%d path=%s",
+                "Persisted history profile=%s mode=%s samples=%d bytes=%d path=%s",
                 profile_id,
+                mode,
                 total_samples,
+                written,
                 str(path),
             )
-        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
+        except (
+            AttributeError,
+            KeyError,
+            OSError,
+            RuntimeError,
+            TypeError,
+            ValueError,
+        ):
             self._logger.debug(
                 "Failed to persist history for profile '%s'",
                 str(profile_id),
                 exc_info=True,
             )
 
+    def _persist_compact_threshold(self, lengths) -> int:
+        """Return the file size above which the history file is compacted.
+
+        Four times the size of a full snapshot (at least 16 KiB) keeps
+        rewrites rare, capped by the configured maximum file size.
+
+        Args:
+            lengths (dict): Heater name to number of in-memory samples
+        """
+        snapshot_bytes = HistoryFile.encoded_size(
+            [heater for heater, count in lengths.items() if count],
+            sum(lengths.values()),
+        )
+        threshold = max(4 * snapshot_bytes, 16 * 1024)
+        max_bytes = int(getattr(self, "_persist_max_json_bytes", 256 * 1024))
+        if max_bytes > 0:
+            threshold = min(threshold, max_bytes)
+        return threshold
+
+    def _trim_persist_samples(self, samples):
+        """Trim oldest samples so a compacted file fits the size cap.
+
+        This is a safety net; primary size bounding happens via maxlen.
+        """
+        max_bytes = int(getattr(self, "_persist_max_json_bytes", 256 * 1024))
+
+        def _size() -> int:
+            return HistoryFile.encoded_size(
+                [heater for heater, rows in samples.items() if rows],
+                sum(len(rows) for rows in samples.values()),
+            )
+
+        size = _size()
+        if not 0 < max_bytes < size:
+            return samples
+
+        now = time.time()
+        # Throttle warnings to avoid log spam in pathological cases.
+        if (now - float(getattr(self, "_last_persist_size_warning_time", 0.0))) >= 300.0:
+            self._last_persist_size_warning_time = now
+            self._logger.warning(
+                "Persisted history exceeds cap (%d > %d bytes); trimming history",
+                int(size),
+                int(max_bytes),
+            )
+
+        # Aggressively trim older samples while keeping most recent data for ETA.
+        # Limit to a few iterations to keep this bounded.
+        for _ in range(5):
+            trimmed_any = False
+            for heater, points in list(samples.items()):
+                if len(points) <= 2:
+                    continue
+                # Keep at least 2 points, otherwise ETA cannot work reliably.
+                keep = max(2, int(len(points) * 0.5))
+                if keep < len(points):
+                    samples[heater] = points[-keep:]
+                    trimmed_any = True
+
+            if not trimmed_any or _size() <= max_bytes:
+                break
+
+        return samples
+
     def _maybe_persist_history(self, now: float) -> None:
         """Persist history using backoff to reduce disk wear."""
         # Lock-free fast path: a missed True only defers the persist by one
@@ -913,9 +1365,9 @@ class TempETAPlugin(
             if float(now) < float(self._next_persist_time):
                 return
 
-        # Persist outside the backoff lock: _persist_current_profile_history
+        # Request the persist outside the backoff lock: an inline fallback
         # acquires self._lock, and the two locks must never nest.
-        self._persist_current_profile_history()
+        self._request_persist()
 
         with self._persist_state_lock:
             # Increase interval (backoff) for ongoing phases.
@@ -966,7 +1418,10 @@ class TempETAPlugin(
             # On startup we restore persisted history for the active profile.
             # On runtime profile switches we intentionally start with an empty
             # history so the ETA uses only live samples from the new profile.
-            loaded = self._load_profile_history(profile_id) if force else {}
+            if force:
+                loaded, history_file = self._replay_profile_history(profile_id)
+            else:
+                loaded, history_file = {}, None
             self._debug_log(
                 "Profile switch %s -> %s (force=%s, restore_persisted=%s)",
                 str(old_profile_id),
@@ -1014,11 +1469,19 @@ class TempETAPlugin(
                 # IMPORTANT: Do not carry over samples from the previous profile.
                 # Start strictly from what's persisted for this profile (or empty).
                 self._active_profile_id = profile_id
-                new_history: dict[str, deque] = {}
+                new_history: dict[str, HeaterHistory] = {}
                 for heater, history in loaded.items():
-                    new_history[heater] = deque(history, maxlen=self._history_maxlen)
-
-                self._temp_history = new_history
+                    new_history[heater] = self._new_heater_history(rows=history)
+                    self._heaters.state(heater)
+
+                for state in self._heaters:
+                    with state.lock:
+                        state.history = new_history.get(state.name)
+                        # Drop fits that still reference the previous profile's
+                        # history and support decisions made for its heaters.
+                        state.fit = None
+                        state.supported = None
+                        state.support_logged = None
                 # Loaded state is considered clean until we append new samples.
                 self._history_dirty = False
                 self._history_dirty_epoch += 1
@@ -1028,9 +1491,10 @@ class TempETAPlugin(
                     "Cleared live (RAM) history for new profile=%s", str(profile_id)
                 )
 
-            # Reset cached heater support decisions for the new profile.
-            self._last_heater_support_decision = {}
-            self._heater_supported_cache = {}
+            # Resume journaling into the replayed file; otherwise the next
+            # persist checkpoints the new profile's file from memory.
+            with self._persist_io_lock:
+                self._history_file = history_file
 
             # Clear any stale UI values that might linger across profile switches.
             self._send_clear_messages(old_heaters)
@@ -1059,10 +1523,10 @@ class TempETAPlugin(
         return max(10, min(300, value))
 
     def _set_history_maxlen(self, maxlen: int) -> None:
-        """Update internal history queues to a new maxlen.
+        """Update internal history buffers to a new maxlen.
 
-        Rebuilds existing queues to apply the new maxlen and trims old samples if
-        needed. Must be fast and thread-safe.
+        Resizes existing buffers in place (keeping the newest samples) and
+        trims old samples if needed. Must be fast and thread-safe.
 
         Args:
             maxlen (int): New maximum length for all heater histories.
@@ -1078,9 +1542,20 @@ class TempETAPlugin(
 
             self._debug_log("Updated history_size maxlen=%d", self._history_maxlen)
 
-            for heater, history in self._temp_history.items():
-                new_history = deque(history, maxlen=maxlen)
-                self._temp_history[heater] = new_history
+            for state in self._heaters:
+                with state.lock:
+                    for field, fields in (("history", 3), ("cooldown_history", 2)):
+                        history = getattr(state, field)
+                        if history is None:
+                            continue
+                        if isinstance(history, HeaterHistory):
+                            history.resize(maxlen)
+                        else:
+                            setattr(
+                                state,
+                                field,
+                                self._new_heater_history(fields=fields, rows=history),
+                            )
 
             # Persist trimmed/expanded histories.
             self._history_dirty = True
@@ -1098,17 +1573,37 @@ class TempETAPlugin(
             bool: True if heater is supported by current profile
         """
 
-        heater_key = str(heater_name)
-        cached = self._heater_supported_cache.get(heater_key)
-        if cached is not None:
-            return bool(cached)
+        return self._is_state_supported(self._heaters.state(heater_name))
+
+    def _is_state_supported(self, state: HeaterState) -> bool:
+        """Cached :meth:`_is_heater_supported` for an already looked-up heater."""
+        generation = self._profile_generation
+        if generation != self._heater_supported_generation:
+            # A profile may change heaters without changing its id.
+            self._reset_heater_support()
+            self._heater_supported_generation = generation
+        if state.supported is not None:
+            return state.supported
+
+        supported = self._check_heater_supported(state)
+        state.supported = supported
+        return supported
+
+    def _reset_heater_support(self) -> None:
+        """Drop cached heater support decisions (e.g. after a profile change)."""
+        for state in self._heaters:
+            state.supported = None
+
+    def _check_heater_supported(self, state: HeaterState) -> bool:
+        """Uncached support decision for *state* against the active profile."""
+        heater_name = state.name
 
         def _log_support_if_changed(supported: bool, details: str) -> None:
             if not self._debug_logging_enabled:
                 return
-            prev = self._last_heater_support_decision.get(heater_key)
+            prev = state.support_logged
             if prev is None or bool(prev) != bool(supported):
-                self._last_heater_support_decision[heater_key] = bool(supported)
+                state.support_logged = bool(supported)
                 self._debug_log(
                     "Heater support heater=%s supported=%s %s",
                     str(heater_name),
@@ -1120,7 +1615,6 @@ class TempETAPlugin(
             profile = self._printer_profile_manager.get_current_or_default()
             if not isinstance(profile, dict) or not profile:
                 _log_support_if_changed(False, "(no profile)")
-                self._heater_supported_cache[heater_key] = False
                 return False
 
             profile_name = profile.get("name", "unknown")
@@ -1138,25 +1632,22 @@ class TempETAPlugin(
                 _log_support_if_changed(
                     supported, f"profile={profile_name} heatedBed={heated_bed}"
                 )
-                self._heater_supported_cache[heater_key] = bool(supported)
-                return supported
+                return bool(supported)
 
             if heater_name == "chamber":
                 supported = heated_chamber
                 _log_support_if_changed(
                     supported, f"profile={profile_name} heatedChamber={heated_chamber}"
                 )
-                self._heater_supported_cache[heater_key] = bool(supported)
-                return supported
+                return bool(supported)
 
-            if isinstance(heater_name, str) and heater_name.startswith("tool"):
+            if heater_name.startswith("tool"):
                 try:
                     tool_idx = int(heater_name.replace("tool", ""))
                 except (ValueError, TypeError):
                     _log_support_if_changed(
                         False, f"profile={profile_name} invalid_tool_index"
                     )
-                    self._heater_supported_cache[heater_key] = False
                     return False
 
                 supported = tool_idx < extruder_count
@@ -1164,18 +1655,16 @@ class TempETAPlugin(
                     supported,
                     f"profile={profile_name} tool_idx={tool_idx} extruder_count={extruder_count}",
                 )
-                self._heater_supported_cache[heater_key] = bool(supported)
-                return supported
+                return bool(supported)
 
             _log_support_if_changed(False, f"profile={profile_name} unknown_heater")
-            self._heater_supported_cache[heater_key] = False
             return False
         except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
             if self._debug_logging_enabled:
                 self._debug_log("Heater support error heater=%s", str(heater_name))
-            self._heater_supported_cache[heater_key] = False
             return False
 
+    @timed("on_printer_add_temperature")
     def on_printer_add_temperature(self, data):
         """Called when new temperature data is available (~2Hz).
 
@@ -1187,14 +1676,19 @@ class TempETAPlugin(
                     ...
                 }
         """
-        if not self._settings.get_boolean(["enabled"]):
+        config = self._get_runtime_config()
+        if not config.enabled:
             return
 
-        # Ensure we are tracking the right profile's history.
-        self._switch_active_profile_if_needed()
+        # Ensure we are tracking the right profile's history. Only after a
+        # profile/connection event; the steady state is one int comparison.
+        generation = self._profile_generation
+        if generation != self._profile_synced_generation:
+            self._profile_synced_generation = generation
+            self._switch_active_profile_if_needed()
 
         # If enabled, suppress ETA completely while OctoPrint considers a print job active.
-        if self._suppress_while_printing_enabled() and self._is_print_job_active():
+        if config.suppress_while_printing and self._is_print_job_active():
             # Clear once when suppression starts to avoid stale countdowns.
             # Check-and-set under the lock so the one-shot clear cannot be
             # triggered twice by concurrent callbacks/events.
@@ -1211,19 +1705,13 @@ class TempETAPlugin(
 
         current_time = time.time()
 
-        # Keep cached settings reasonably fresh even if settings change outside
-        # of the normal save flow (e.g. tests or edge-case integrations).
-        if (current_time - self._last_runtime_cache_refresh_time) >= 5.0:
-            self._last_runtime_cache_refresh_time = current_time
-            self._refresh_runtime_caches()
-
         # Periodic settings snapshot for debugging.
         self._debug_log_settings_snapshot(current_time)
 
-        threshold = float(getattr(self, "_threshold_start_c", 5.0))
-        update_interval = float(getattr(self, "_update_interval_s", 1.0))
-        heating_enabled = self._heating_enabled()
-        cooldown_enabled = self._cooldown_enabled()
+        threshold = config.threshold_start_c
+        update_interval = config.update_interval_s
+        heating_enabled = config.heating_enabled
+        cooldown_enabled = config.cooldown_enabled
 
         # Avoid eager f-string formatting in the hot path.
         try:
@@ -1248,71 +1736,72 @@ class TempETAPlugin(
         recorded_count = 0
         recorded_cooldown_count = 0
         heaters_seen = 0
-        with self._lock:
-            # Protect shared history state (OctoPrint may call callbacks from worker threads).
-            for heater, temps in data.items():
-                # OctoPrint wraps heater entries in frozendict when
-                # devel.useFrozenDictForPrinterState is enabled, which is not a
-                # dict subclass; accept any Mapping so ETA still works there.
-                if not isinstance(temps, Mapping):
-                    continue
-                heater_key = str(heater)
-                heaters_seen += 1
+        # OctoPrint may call callbacks from worker threads. Each heater is
+        # locked only while its own state is updated.
+        for heater, temps in data.items():
+            # OctoPrint wraps heater entries in frozendict when
+            # devel.useFrozenDictForPrinterState is enabled, which is not a
+            # dict subclass; accept any Mapping so ETA still works there.
+            if not isinstance(temps, Mapping):
+                continue
+            heaters_seen += 1
 
-                # Record samples only while ETA could be shown (active target and above threshold).
-                target_raw = temps.get("target", 0)
-                actual_raw = temps.get("actual")
-                if actual_raw is None:
-                    continue
-                try:
-                    actual = float(actual_raw)
-                except (
-                    AttributeError,
-                    KeyError,
-                    OSError,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
-                ):
-                    continue
+            # Record samples only while ETA could be shown (active target and above threshold).
+            target_raw = temps.get("target", 0)
+            actual_raw = temps.get("actual")
+            if actual_raw is None:
+                continue
+            try:
+                actual = float(actual_raw)
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                continue
 
-                try:
-                    target = float(target_raw or 0)
-                except (
-                    AttributeError,
-                    KeyError,
-                    OSError,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
-                ):
-                    # Some firmwares/virtual printer formats may provide a non-numeric
-                    # target (e.g. "off"). Treat that as OFF for cooldown tracking.
-                    target = 0.0
-                    self._debug_log_throttled(
-                        current_time,
-                        30.0,
-                        "Non-numeric target treated as OFF heater=%s target_raw=%r",
-                        str(heater),
-                        target_raw,
-                    )
+            try:
+                target = float(target_raw or 0)
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                # Some firmwares/virtual printer formats may provide a non-numeric
+                # target (e.g. "off"). Treat that as OFF for cooldown tracking.
+                target = 0.0
+                self._debug_log_throttled(
+                    current_time,
+                    30.0,
+                    "Non-numeric target treated as OFF heater=%s target_raw=%r",
+                    str(heater),
+                    target_raw,
+                )
 
-                prev_target = self._last_target_by_heater.get(str(heater))
-                self._last_target_by_heater[heater_key] = float(target)
+            state = self._heaters.state(heater)
+            with state.lock:
+                prev_target = state.last_target
+                state.last_target = target
 
                 if target <= 0:
                     # Cooldown tracking (target==0).
                     if cooldown_enabled:
-                        if heater_key not in self._cooldown_history:
-                            self._cooldown_history[heater_key] = deque(
-                                maxlen=self._history_maxlen
-                            )
+                        cooldown_history = state.cooldown_history
+                        if cooldown_history is None:
+                            cooldown_history = self._new_heater_history(fields=2)
+                            state.cooldown_history = cooldown_history
 
                         # If we just transitioned from heating to OFF, start a fresh
                         # cooldown history so our linear cooldown fit doesn't include
                         # old OFF samples from before the heat-up phase.
                         if prev_target is not None and prev_target > 0:
-                            self._cooldown_history[heater_key].clear()
+                            cooldown_history.clear()
                             self._debug_log_throttled(
                                 current_time,
                                 10.0,
@@ -1322,18 +1811,20 @@ class TempETAPlugin(
                                 float(actual),
                             )
 
-                        self._cooldown_history[heater_key].append(
-                            (current_time, actual)
-                        )
+                        if not cooldown_history.append((current_time, actual)):
+                            # The wall clock stepped back (NTP/RTC adjustment):
+                            # older samples no longer line up with new ones.
+                            cooldown_history.clear()
+                            cooldown_history.append((current_time, actual))
                         recorded_cooldown_count += 1
 
                         # Track a baseline ambient temp while OFF.
                         # We only learn baseline values in a sane range to
                         # avoid "ambient" being polluted by still-hot cooldown.
                         if math.isfinite(actual) and actual < 120.0:
-                            prev = self._cooldown_ambient_baseline.get(heater_key)
+                            prev = state.ambient_baseline
                             if prev is None or actual < prev:
-                                self._cooldown_ambient_baseline[heater_key] = actual
+                                state.ambient_baseline = actual
                     continue
 
                 if not heating_enabled:
@@ -1358,13 +1849,21 @@ class TempETAPlugin(
                 ):
                     target_changed_in_active_phase = True
 
-                if heater_key not in self._temp_history:
-                    self._temp_history[heater_key] = deque(maxlen=self._history_maxlen)
+                history = state.history
+                if history is None:
+                    history = self._new_heater_history()
+                    state.history = history
+
+                if not history.append((current_time, actual, target)):
+                    # The wall clock stepped back; restart from this sample.
+                    history.clear()
+                    history.append((current_time, actual, target))
+                recorded_count += 1
 
-                self._temp_history[heater_key].append((current_time, actual, target))
+        if recorded_count:
+            with self._lock:
                 self._history_dirty = True
                 self._history_dirty_epoch += 1
-                recorded_count += 1
 
         # Avoid flooding logs while idle/holding temperature: log far less often
         # when we didn't record any samples.
@@ -1389,8 +1888,6 @@ class TempETAPlugin(
             phase_active_prev = self._persist_phase_active
 
         if due:
-            self._calculate_and_broadcast_eta(data)
-
             # Update persistence phase state based on transitions. Decide using
             # the phase snapshot taken above so the branch is consistent.
             if target_changed_in_active_phase:
@@ -1402,7 +1899,57 @@ class TempETAPlugin(
                 # Inactive -> active transition: start backoff sequence.
                 self._enter_persist_phase(current_time, "phase_start")
 
-            self._maybe_persist_history(current_time)
+            # Hand the expensive part to the worker; fall back to running it
+            # here when the worker is not running (before startup, in tests).
+            tick = (dict(data), current_time)
+            worker = self._eta_worker
+            if worker is None or not worker.submit(tick):
+                self._process_eta_tick(tick)
+
+    def _process_eta_tick(self, tick) -> None:
+        """Compute and broadcast ETAs for one tick, then persist if due.
+
+        Runs on the ETA worker thread, or inline when no worker is running.
+
+        Args:
+            tick (tuple): ``(data, current_time)`` captured by the callback
+        """
+        data, current_time = tick
+        self._calculate_and_broadcast_eta(data)
+        self._maybe_persist_history(current_time)
+
+    def _request_persist(self) -> None:
+        """Hand a persist request to the persistence worker.
+
+        Requests coalesce: the worker snapshots the in-memory history when it
+        runs, so one write covers every request queued before it. Persists
+        inline when the worker is not running (before startup, in tests).
+        """
+        worker = self._persist_worker
+        if worker is None or not worker.submit(None):
+            self._persist_current_profile_history()
+
+    def _process_persist_request(self, _request) -> None:
+        """Write the active profile's history (persistence worker thread)."""
+        self._persist_current_profile_history()
+
+    def _flush_history(self, timeout: float) -> bool:
+        """Persist now and wait for the write to finish.
+
+        Args:
+            timeout (float): Maximum seconds to wait for the persistence worker.
+
+        Returns:
+            bool: False if the write did not finish within *timeout*.
+        """
+        self._request_persist()
+        worker = self._persist_worker
+        if worker is None or worker.flush(timeout):
+            return True
+        self._logger.warning(
+            "History persist did not finish within %.1fs", float(timeout)
+        )
+        return False
 
     def on_printer_send_current_data(self, _data):
         """Stub: Called when current printer data is sent (required by callback interface)."""
@@ -1420,27 +1967,58 @@ class TempETAPlugin(
         """Handle OctoPrint events to keep UI state consistent.
 
         Clears all ETAs immediately on disconnect or printer errors so the navbar/tab
-        do not keep showing stale countdowns.
+        do not keep showing stale countdowns. Printer profile and connection
+        events schedule a re-check of the active profile and its heaters, and
+        a newly opened client gets a full keyframe on the next update.
 
         Args:
             event (str): OctoPrint event name
             payload (dict): Event payload
         """
+        if event in (
+            "Connected",
+            "Disconnected",
+            "PrinterProfileAdded",
+            "PrinterProfileModified",
+            "PrinterProfileDeleted",
+        ):
+            # The active profile (or its heaters) may have changed: re-check it
+            # on the next temperature callback instead of on every callback.
+            self._profile_generation += 1
+
+        if event == "ClientOpened":
+            # Heaters that did not change are left out of regular updates, so
+            # a new browser session needs every field on the next tick.
+            self._request_eta_keyframe()
+
         if event in (
             "Disconnected",
             "Error",
             "Shutdown",
         ):  # clear UI on connection loss
-            # Persist what we have before clearing.
-            self._persist_current_profile_history()
-            self._reset_persist_backoff(time.time(), "disconnect_or_error")
-            with self._lock:
-                heaters = list(self._temp_history.keys())
-                for h in heaters:
-                    self._temp_history[h].clear()
-
-                for h in list(self._cooldown_history.keys()):
-                    self._cooldown_history[h].clear()
+            if event == "Shutdown":
+                # Stop the ETA worker first so no tick repopulates the UI after
+                # the clear.
+                worker = self._eta_worker
+                if worker is not None:
+                    worker.stop()
+                # The process is about to exit: persist what we have before
+                # clearing, waiting (bounded) for the write.
+                self._flush_history(self._persist_flush_timeout_s)
+                persist_worker = self._persist_worker
+                if persist_worker is not None:
+                    persist_worker.stop()
+                self._reset_persist_backoff(time.time(), "disconnect_or_error")
+                with self._lock:
+                    heaters = self._clear_heater_histories(cooldown=True)
+            else:
+                # Do not wait for the disk on OctoPrint's event thread: hand
+                # the heaters' histories to the persistence worker and give
+                # the heaters empty ones.
+                self._reset_persist_backoff(time.time(), "disconnect_or_error")
+                with self._lock:
+                    heaters = self._detach_heater_histories()
+                self._request_persist()
 
             self._send_clear_messages(heaters)
 
@@ -1461,6 +2039,7 @@ class TempETAPlugin(
             with self._suppress_lock:
                 self._suppressing_due_to_print = False
 
+    @timed("calculate_and_broadcast_eta")
     def _calculate_and_broadcast_eta(self, data):
         """Calculate ETA for each heater and send to frontend.
 
@@ -1469,53 +2048,60 @@ class TempETAPlugin(
         Args:
             data (dict): Current temperature data with all available heaters
         """
-        algorithm = self._settings.get(["algorithm"])
-        threshold = float(getattr(self, "_threshold_start_c", 5.0))
+        config = self._get_runtime_config()
+        algorithm = config.algorithm
+        threshold = config.threshold_start_c
 
-        heating_enabled = self._heating_enabled()
+        heating_enabled = config.heating_enabled
 
-        cooldown_enabled = self._cooldown_enabled()
-        cooldown_mode = self._cooldown_mode()
-        cooldown_hyst_c = self._cooldown_hysteresis_c()
+        cooldown_enabled = config.cooldown_enabled
+        cooldown_mode = config.cooldown_mode
+        cooldown_hyst_c = config.cooldown_hysteresis_c
 
-        payloads = []
-        with self._lock:
-            for heater, heater_data in data.items():
-                if not isinstance(heater_data, Mapping):
-                    continue
-                if not self._is_heater_supported(heater):
-                    continue
-                if heater not in self._temp_history:
-                    self._temp_history[heater] = deque(maxlen=self._history_maxlen)
+        now = time.time()
+        entries = {}
+        states = []
+        heating_targets = {}
+        for heater, heater_data in data.items():
+            if not isinstance(heater_data, Mapping):
+                continue
+            state = self._heaters.state(heater)
+            if not self._is_state_supported(state):
+                continue
 
-                # OctoPrint may include non-numeric or None values (e.g. during reconnect).
-                # Never allow exceptions to bubble out of the temperature callback.
-                target_raw = heater_data.get("target", 0)
-                actual_raw = heater_data.get("actual", 0)
+            # OctoPrint may include non-numeric or None values (e.g. during reconnect).
+            # Never allow exceptions to bubble out of the temperature callback.
+            target_raw = heater_data.get("target", 0)
+            actual_raw = heater_data.get("actual", 0)
 
-                try:
-                    target = float(target_raw or 0)
-                except (
-                    AttributeError,
-                    KeyError,
-                    OSError,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
-                ):
-                    target = 0.0
+            try:
+                target = float(target_raw or 0)
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                target = 0.0
 
-                try:
-                    actual = float(actual_raw or 0)
-                except (
-                    AttributeError,
-                    KeyError,
-                    OSError,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
-                ):
-                    actual = 0.0
+            try:
+                actual = float(actual_raw or 0)
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                actual = 0.0
+
+            # Only this heater is locked while its ETA is computed.
+            with state.lock:
+                if state.history is None:
+                    state.history = self._new_heater_history()
 
                 if target <= 0:
                     eta = None
@@ -1567,7 +2153,7 @@ class TempETAPlugin(
                             else:
                                 hist_len = 0
                                 try:
-                                    h = self._cooldown_history.get(heater)
+                                    h = state.cooldown_history
                                     hist_len = len(h) if h is not None else 0
                                 except (
                                     AttributeError,
@@ -1594,57 +2180,137 @@ class TempETAPlugin(
                     eta_kind = None
                     cooldown_target = None
                 elif (target - actual) >= threshold and heating_enabled:
-                    if algorithm == "exponential":
-                        eta = self._calculate_exponential_eta(heater, target)
-                    else:
-                        eta = self._calculate_linear_eta(heater, target)
-
-                    if eta is not None and eta < 1:
-                        eta = None
-                    eta_kind = "heating" if eta is not None else None
+                    # Filled in below by one batch calculation for all heaters.
+                    heating_targets[heater] = target
+                    eta = None
+                    eta_kind = None
                     cooldown_target = None
                 else:
                     eta = None
                     eta_kind = None
                     cooldown_target = None
 
-                # Prepare message payload; send outside the lock to keep the critical section small.
-                payloads.append(
-                    {
-                        "type": "eta_update",
-                        "heater": heater,
-                        "eta": eta,
-                        "eta_kind": eta_kind,
-                        "target": target,
-                        "actual": actual,
-                        "cooldown_target": cooldown_target,
-                        "cooldown_mode": cooldown_mode if cooldown_enabled else None,
-                    }
-                )
+            # Prepare the heater's batch entry; send outside the lock to keep
+            # the critical section small.
+            states.append(state)
+            entries[heater] = {
+                "eta": eta,
+                "eta_kind": eta_kind,
+                "eta_ts": now if eta is not None else None,
+                "target": target,
+                "actual": actual,
+                "cooldown_target": cooldown_target,
+            }
+
+        if heating_targets:
+            heating_etas = self._calculate_heating_etas(heating_targets, algorithm)
+            for heater in heating_targets:
+                eta = heating_etas.get(heater)
+                if eta is not None and eta < 1:
+                    eta = None
+                entry = entries[heater]
+                entry["eta"] = eta
+                entry["eta_kind"] = "heating" if eta is not None else None
+                entry["eta_ts"] = now if eta is not None else None
 
         # Snapshot the MQTT client reference once so the null-check and use
         # cannot race a concurrent reassignment from on_settings_save.
         mqtt_client = self._mqtt_client
 
-        # Always send updates so the frontend can clear stale values.
-        for payload in payloads:
-            self._plugin_manager.send_plugin_message(self._identifier, payload)
+        # All heaters go out as one message so each tick costs one JSON
+        # encode and one websocket frame per connected client; heaters that
+        # did not change are left out of it.
+        message = self._build_eta_batch(
+            states, entries, cooldown_mode if cooldown_enabled else None, now
+        )
+        if message is not None:
+            self._plugin_manager.send_plugin_message(self._identifier, message)
 
-            # Publish to MQTT if enabled
-            if mqtt_client is not None:
-                try:
-                    mqtt_client.publish_eta_update(
-                        heater=payload.get("heater"),
-                        eta=payload.get("eta"),
-                        eta_kind=payload.get("eta_kind"),
-                        target=payload.get("target"),
-                        actual=payload.get("actual"),
-                        cooldown_target=payload.get("cooldown_target"),
-                    )
-                except (ConnectionError, OSError) as e:
-                    self._logger.error("MQTT publish failed (connection): %s", str(e))
-                except (AttributeError, RuntimeError, TypeError, ValueError) as e:
-                    self._logger.debug("MQTT publish failed: %s", str(e))
+        # Publish to MQTT if enabled; the client throttles each heater.
+        if mqtt_client is not None and entries:
+            try:
+                mqtt_client.publish_eta_batch(entries)
+            except (ConnectionError, OSError) as e:
+                self._logger.error("MQTT publish failed (connection): %s", str(e))
+            except (AttributeError, RuntimeError, TypeError, ValueError) as e:
+                self._logger.debug("MQTT publish failed: %s", str(e))
+
+    def _build_eta_batch(self, states, entries, cooldown_mode, now):
+        """Build this tick's eta_batch message from the per-heater entries.
+
+        Records each heater's ETA and compares its entry with what the
+        frontend last received. Outside of a keyframe only the changed fields
+        are included, plus every heater's actual temperature once any heater
+        changed; a keyframe carries every field of every heater plus the tick
+        time as ``ts``.
+
+        Args:
+            states (list): HeaterState objects, in the order of *entries*
+            entries (dict): Heater name to full websocket entry
+            cooldown_mode (str): Active cooldown mode, or None when disabled
+            now (float): Time of this tick, in seconds since the epoch
+
+        Returns:
+            dict: Message to send, or None if nothing changed
+        """
+        if not entries:
+            return None
+
+        with self._lock:
+            elapsed = now - self._eta_keyframe_time
+            keyframe = (
+                self._eta_keyframe_due
+                or cooldown_mode != self._sent_cooldown_mode
+                or not 0.0 <= elapsed < self._eta_keyframe_interval_s
+            )
+            if keyframe:
+                self._eta_keyframe_due = False
+                self._eta_keyframe_time = now
+                self._sent_cooldown_mode = cooldown_mode
+
+        heaters = {}
+        for state, (heater, entry) in zip(states, entries.items()):
+            with state.lock:
+                state.last_eta = entry["eta"]
+                state.last_eta_kind = entry["eta_kind"]
+                sent = state.sent
+                if keyframe or sent is None:
+                    state.sent = entry
+                    heaters[heater] = entry
+                    continue
+                delta = _entry_delta(sent, entry)
+                if delta:
+                    # Keep unsent fields at the value the frontend shows.
+                    state.sent = {**sent, **delta}
+                    heaters[heater] = delta
+
+        if not heaters:
+            return None
+        if not keyframe:
+            # The frontend adds a history graph point per heater and message;
+            # the actual temperature is cheap, so every heater carries it and
+            # idle heaters' curves stay as dense as the changing ones.
+            for state, (heater, entry) in zip(states, entries.items()):
+                delta = heaters.setdefault(heater, {})
+                if "actual" not in delta:
+                    delta["actual"] = entry["actual"]
+                    with state.lock:
+                        state.sent = {**state.sent, "actual": entry["actual"]}
+        message = {
+            "type": "eta_batch",
+            "keyframe": keyframe,
+            "cooldown_mode": cooldown_mode,
+            "heaters": heaters,
+        }
+        if keyframe:
+            # Lets the frontend map eta_ts onto its own clock.
+            message["ts"] = now
+        return message
+
+    def _request_eta_keyframe(self) -> None:
+        """Make the next broadcast send every field of every heater."""
+        with self._lock:
+            self._eta_keyframe_due = True
 
     def _heating_enabled(self) -> bool:
         """Return whether heating ETA is enabled."""
@@ -1726,12 +2392,8 @@ class TempETAPlugin(
         except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
             return None
 
-    def _get_cooldown_ambient_c(self, heater_name: str) -> Optional[float]:
-        """Return ambient temperature for ambient-mode.
-
-        If a user-provided ambient temp is not set, fall back to a conservative
-        estimate from the minimum temperature in the recent cooldown history.
-        """
+    def _read_cooldown_ambient_setting(self) -> Optional[float]:
+        """Return the user-provided ambient temperature, or None if unset/invalid."""
         try:
             raw = self._settings.get(["cooldown_ambient_temp"])
             if raw is not None and raw != "":
@@ -1740,31 +2402,37 @@ class TempETAPlugin(
                     return v
         except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
             pass
+        return None
+
+    def _get_cooldown_ambient_c(self, heater_name: str) -> Optional[float]:
+        """Return ambient temperature for ambient-mode.
+
+        If a user-provided ambient temp is not set, fall back to a conservative
+        estimate from the minimum temperature in the recent cooldown history.
+        """
+        config = self._get_runtime_config()
+        if config.cooldown_ambient_c is not None:
+            return config.cooldown_ambient_c
+
+        state = self._heaters.get(heater_name)
+        if state is None:
+            return None
 
-        base = self._cooldown_ambient_baseline.get(heater_name)
+        base = state.ambient_baseline
         if base is not None and math.isfinite(base):
             return float(base)
 
-        hist = self._cooldown_history.get(heater_name)
+        hist = state.cooldown_history
         if not hist:
             return None
 
-        now = time.time()
-        window = max(self._cooldown_fit_window_seconds(), 60.0)
-        recent = [
-            temp for ts, temp in hist if ts > now - window and math.isfinite(temp)
-        ]
-        if len(recent) < 3:
+        fit = self._cooldown_fit(state, config.cooldown_fit_window_s)
+        count, mn, current = fit.ambient_window(time.time())
+        if count < 3:
             return None
-
-        mn = min(recent)
         # If the minimum is essentially "now" (still very hot), it's not a useful
         # ambient estimate. In that case, require the user-provided ambient or an
         # already learned baseline.
-        try:
-            current = float(recent[-1])
-        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError):
-            current = mn
         if mn >= (current - 2.0):
             return None
 
@@ -1789,7 +2457,7 @@ class TempETAPlugin(
             band = max(1.0, hysteresis_c)
             return amb + band
 
-        return self._get_cooldown_threshold_target_c(heater_name)
+        return self._get_runtime_config().cooldown_target_c(heater_name)
 
     def _calculate_cooldown_eta_seconds(
         self,
@@ -1820,27 +2488,22 @@ class TempETAPlugin(
             goal_c=display_target_c,
         )
 
+    @timed("calculator.cooldown_linear")
     def _calculate_cooldown_linear_eta(
         self, heater_name: str, goal_c: float
     ) -> Optional[float]:
         """Linear cooldown ETA from recent slope."""
-        hist = self._cooldown_history.get(heater_name)
+        state = self._heaters.get(heater_name)
+        hist = state.cooldown_history if state is not None else None
         if not hist:
             return None
 
         # Use calculator module if available
         if calculator is not None:
             now = time.time()
-            window = self._cooldown_fit_window_seconds()
-            cutoff = now - window
-            recent = deque(
-                (
-                    (ts, temp)
-                    for ts, temp in hist
-                    if math.isfinite(ts) and math.isfinite(temp) and ts > cutoff
-                ),
-                maxlen=hist.maxlen,
-            )
+            window = self._get_runtime_config().cooldown_fit_window_s
+            fit = self._cooldown_fit(state, window)
+            recent = fit.fit_rows(now)
 
             if len(recent) < 2:
                 self._debug_log_throttled(
@@ -1854,12 +2517,14 @@ class TempETAPlugin(
                 )
                 return None
 
-            result = calculator.calculate_cooldown_linear_eta(recent, goal_c, window)
+            result = calculator.calculate_cooldown_linear_eta_from_fit(
+                fit, goal_c, now
+            )
 
             # Debug log when slope is not negative (calculator returns None)
             if result is None:
-                t0, temp0 = recent[0]
-                t1, temp1 = recent[-1]
+                t0, temp0 = recent[0][0], recent[0][1]
+                t1, temp1 = recent[-1][0], recent[-1][1]
                 dt = t1 - t0
                 dtemp = temp1 - temp0
                 if dt > 0:
@@ -1884,64 +2549,76 @@ class TempETAPlugin(
 
         return None
 
+    @timed("calculator.cooldown_exponential")
     def _calculate_cooldown_exponential_eta(
         self, heater_name: str, ambient_c: float, goal_c: float
     ) -> Optional[float]:
         """Exponential cooldown ETA (Newton's law of cooling)."""
-        hist = self._cooldown_history.get(heater_name)
+        state = self._heaters.get(heater_name)
+        hist = state.cooldown_history if state is not None else None
         if not hist:
             return None
 
         # Use calculator module if available
         if calculator is not None:
-            window = self._cooldown_fit_window_seconds()
+            window = self._get_runtime_config().cooldown_fit_window_s
             return calculator.calculate_cooldown_exponential_eta(
                 hist, ambient_c, goal_c, window
             )
 
         return None
 
-    def _calculate_linear_eta(self, heater, target):
-        """Calculate ETA assuming constant heating rate.
-
-        Args:
-            heater (str): Heater name (bed, tool0, chamber)
-            target (float): Target temperature
-
-        Returns:
-            float: Estimated seconds to target, or None if insufficient data
-        """
-        history = self._temp_history.get(heater)
-        if not history:
-            return None
+    @timed("calculator.batch")
+    def _calculate_heating_etas(self, targets, algorithm):
+        """Calculate heating ETAs for several heaters in one batch.
 
-        # Use calculator module if available, otherwise fallback not implemented
-        if calculator is not None:
-            return calculator.calculate_linear_eta(history, target)
-
-        return None
-
-    def _calculate_exponential_eta(self, heater, target):
-        """Calculate ETA accounting for thermal asymptotic behavior.
-
-        Uses model: T(t) = T_final - (T_final - T_0) * e^(-t/tau)
+        Each heater is locked only while its rolling fit is synchronized and
+        copied; the copies are then evaluated together by
+        :func:`calculator.calculate_batch` without holding any lock.
 
         Args:
-            heater (str): Heater name
-            target (float): Target temperature
+            targets (dict): Heater name to target temperature
+            algorithm (str): Configured algorithm ("linear" or "exponential")
 
         Returns:
-            float: Estimated seconds to target, or None if insufficient data
+            dict: Heater name to estimated seconds, or None if insufficient data
         """
-        history = self._temp_history.get(heater, deque())
-        if not history:
-            return None
-
-        # Use calculator module if available, otherwise fallback not implemented
-        if calculator is not None:
-            return calculator.calculate_exponential_eta(history, target)
+        if calculator is None:
+            return {}
 
-        return None
+        exponential = algorithm == "exponential"
+        fits = {}
+        for heater, target in targets.items():
+            state = self._heaters.get(heater)
+            if state is None:
+                continue
+            with state.lock:
+                if state.history:
+                    fit = self._heating_fit(state)
+                    fits[heater] = fit.copy(target if exponential else None)
+
+        config = {"algorithm": "exponential" if exponential else "linear"}
+        return calculator.calculate_batch(fits, targets, config)
+
+    def _cooldown_fit(
+        self, state: HeaterState, window_seconds: float
+    ) -> "calculator.CooldownFit":
+        """Return the cooldown fit of *state*, synchronized with its history."""
+        fit = state.cooldown_fit
+        if fit is None or fit.window_seconds != float(window_seconds):
+            fit = calculator.CooldownFit(window_seconds)
+            state.cooldown_fit = fit
+        fit.sync(state.cooldown_history)
+        return fit
+
+    def _heating_fit(self, state: HeaterState) -> "calculator.RollingFit":
+        """Return the rolling fit of *state*, synchronized with its history."""
+        fit = state.fit
+        if fit is None:
+            fit = calculator.RollingFit()
+            state.fit = fit
+        fit.sync(state.history)
+        return fit
 
     # SettingsPlugin mixin
     def get_settings_defaults(self):
@@ -1972,6 +2649,8 @@ class TempETAPlugin(
             "persist_backoff_initial_s": 60.0,
             "persist_backoff_max_s": 300.0,
             "persist_max_json_bytes": 256 * 1024,
+            # none | file | file+dir
+            "persist_fsync": "none",
             # Cool Down ETA
             "enable_cooldown_eta": True,
             "cooldown_mode": "threshold",
@@ -2012,6 +2691,10 @@ class TempETAPlugin(
             "mqtt_qos": 0,
             "mqtt_retain": False,
             "mqtt_publish_interval": 1.0,
+            "mqtt_topic_mode": "per_heater",
+            "mqtt_eta_deadband_s": 0.0,
+            "mqtt_actual_deadband_c": 0.0,
+            "mqtt_heartbeat_s": 60.0,
         }
 
     def _get_appearance_name(self) -> Optional[str]:
@@ -2161,7 +2844,7 @@ class TempETAPlugin(
 
         # General / heating ETA
         _clamp_float("threshold_start", 1.0, 50.0)
-        _clamp_float("update_interval", 0.1, 5.0)
+        _clamp_float("update_interval", 0.1, 30.0)
         _clamp_int("history_size", 10, 300)
         _clamp_int("historical_graph_window_seconds", 30, 1800)
 
@@ -2178,6 +2861,17 @@ class TempETAPlugin(
         _clamp_float("cooldown_hysteresis_c", 0.1, 20.0)
         _clamp_int("cooldown_fit_window_seconds", 10, 1800)
 
+        # MQTT
+        _clamp_float("mqtt_eta_deadband_s", 0.0, 600.0)
+        _clamp_float("mqtt_actual_deadband_c", 0.0, 50.0)
+        _clamp_float("mqtt_heartbeat_s", 0.0, 3600.0)
+        if "mqtt_topic_mode" in data and data.get("mqtt_topic_mode") not in (
+            "per_heater",
+            "combined",
+            "both",
+        ):
+            data["mqtt_topic_mode"] = "per_heater"
+
         # Optional ambient: keep None if invalid/out of range.
         if "cooldown_ambient_temp" in data:
             raw = data.get("cooldown_ambient_temp")
@@ -2206,28 +2900,88 @@ class TempETAPlugin(
             return
 
         with self._lock:
-            heaters = list(self._temp_history.keys())
-            for heater in heaters:
-                self._temp_history[heater].clear()
+            heaters = self._clear_heater_histories()
 
         self._send_clear_messages(heaters)
 
+    def _clear_heater_histories(self, cooldown: bool = False) -> list[str]:
+        """Clear the heating (and optionally cooldown) history of every heater.
+
+        Args:
+            cooldown (bool): Also clear cooldown histories
+
+        Returns:
+            list: Names of heaters that have a heating history
+        """
+        heaters = []
+        for state in self._heaters:
+            with state.lock:
+                if state.history is not None:
+                    state.history.clear()
+                    heaters.append(state.name)
+                if cooldown and state.cooldown_history is not None:
+                    state.cooldown_history.clear()
+        return heaters
+
+    def _detach_heater_histories(self) -> list[str]:
+        """Replace every heater's heating history and clear cooldown histories.
+
+        Caller holds ``self._lock``. An entry is queued on ``_pending_persist``
+        for the next persist. When the history has unsaved samples it holds
+        the active profile id and the detached containers, so they are
+        written even though the heaters now start from empty histories.
+        Either way that persist then drops the history file's journal marks,
+        which describe the detached containers rather than the live ones.
+
+        Returns:
+            list: Names of heaters that had a heating history
+        """
+        sources = []
+        for state in self._heaters:
+            with state.lock:
+                if state.history is not None:
+                    sources.append((state.name, state.lock, state.history))
+                    state.history = self._new_heater_history()
+                if state.cooldown_history is not None:
+                    state.cooldown_history.clear()
+        if sources:
+            profile_id = getattr(self, "_active_profile_id", None)
+            if profile_id and self._history_dirty:
+                self._pending_persist.append((profile_id, sources))
+                self._history_dirty = False
+            else:
+                self._pending_persist.append((profile_id, []))
+        return [name for name, _, _ in sources]
+
     def _send_clear_messages(self, heaters) -> None:
-        """Send eta_update clear messages for a list of heaters."""
+        """Send one eta_batch message clearing the given heaters."""
         if not getattr(self, "_plugin_manager", None):
             return
 
-        for heater in heaters or []:
-            self._plugin_manager.send_plugin_message(
-                self._identifier,
-                {
-                    "type": "eta_update",
-                    "heater": heater,
-                    "eta": None,
-                    "target": None,
-                    "actual": None,
+        heaters = list(heaters or [])
+        if not heaters:
+            return
+        # The frontend no longer matches the sent fields of these heaters.
+        self._request_eta_keyframe()
+        self._plugin_manager.send_plugin_message(
+            self._identifier,
+            {
+                "type": "eta_batch",
+                "keyframe": False,
+                "cooldown_mode": None,
+                "heaters": {
+                    heater: {
+                        "eta": None,
+                        "eta_kind": None,
+                        "eta_ts": None,
+                        "target": None,
+                        "actual": None,
+                        "cooldown_target": None,
+                    }
+                    for heater in heaters
                 },
-            )
+            },
+        )
 
     def _send_history_reset_message(
         self,
@@ -2294,8 +3048,12 @@ class TempETAPlugin(
     def on_api_get(self, _request: Any):  # type: ignore[override]
         """Return plugin status for the Simple API GET endpoint.
 
-        Currently exposes whether the MQTT integration is enabled and
-        connected to a broker so the settings UI can show a live status.
+        Exposes whether the MQTT integration is enabled and connected to a
+        broker so the settings UI can show a live status, plus the MQTT
+        outbound queue, MQTT reconnect and offline buffer, ETA and
+        persistence worker queue counters (``None`` before startup),
+        per-stage latency histograms under ``metrics`` and the last broadcast
+        ETA per heater under ``heaters``, read from per-heater snapshots.
         """
         mqtt_client = self._mqtt_client
         mqtt_enabled = bool(self._settings.get_boolean(["mqtt_enabled"]))
@@ -2305,11 +3063,45 @@ class TempETAPlugin(
         mqtt_connected = bool(
             mqtt_enabled and mqtt_client is not None and mqtt_client.is_connected()
         )
+        worker = self._eta_worker
+        persist_worker = self._persist_worker
+        metrics = self._metrics.snapshot()
+        heaters = {
+            snapshot.name: {
+                "target": snapshot.last_target,
+                "eta": snapshot.last_eta,
+                "eta_kind": snapshot.last_eta_kind,
+                "samples": snapshot.samples,
+                "cooldown_samples": snapshot.cooldown_samples,
+            }
+            for snapshot in (state.snapshot() for state in self._heaters)
+        }
+        get_mqtt_metrics = getattr(mqtt_client, "get_metrics", None)
+        if get_mqtt_metrics is not None:
+            metrics.update(get_mqtt_metrics())
+        get_mqtt_queue_stats = getattr(mqtt_client, "get_queue_stats", None)
+        get_mqtt_connection_stats = getattr(
+            mqtt_client, "get_connection_stats", None
+        )
         return jsonify(
             {
                 "mqtt_available": MQTTClientWrapper is not None,
                 "mqtt_enabled": mqtt_enabled,
                 "mqtt_connected": mqtt_connected,
+                "mqtt_queue": (
+                    get_mqtt_queue_stats() if get_mqtt_queue_stats is not None else None
+                ),
+                "mqtt_connection": (
+                    get_mqtt_connection_stats()
+                    if get_mqtt_connection_stats is not None
+                    else None
+                ),
+                "eta_worker": worker.stats() if worker is not None else None,
+                "persist_worker": (
+                    persist_worker.stats() if persist_worker is not None else None
+                ),
+                "metrics": metrics,
+                "heaters": heaters,
             }
         )
 
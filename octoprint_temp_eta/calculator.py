@@ -5,13 +5,25 @@ This module provides pure calculation logic for estimating time remaining
 until a printer heater reaches its target temperature or cools down.
 
 All functions are stateless and independent of OctoPrint plugin mechanics,
-making them easy to test and maintain.
+making them easy to test and maintain. :class:`RollingFit` and
+:class:`CooldownFit` are the stateful helpers: they keep the heating and
+cooldown fits of a single heater up to date incrementally so the plugin does
+not rescan the whole history on every tick.
+
+When NumPy is installed, the public ``calculate_*`` functions are bound to a
+vectorized implementation at import time; otherwise the pure-Python code is
+used. Both produce the same results (see :func:`use_backend`).
 """
 
 import logging
 import math
 from collections import deque
-from typing import Optional
+from typing import Mapping, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None  # type: ignore
 
 _LOG = logging.getLogger("octoprint_temp_eta")
 
@@ -44,6 +56,45 @@ def _filter_recent(pairs, cutoff: float):
     )
 
 
+def _window_start(history, window_seconds: float) -> Optional[int]:
+    """Return the index of the first row of a time-ordered history's window.
+
+    *history* is a ``HeaterHistory``, whose rows are kept in timestamp order.
+    Like :func:`_find_last_ts` + :func:`_filter_recent`, the window ends at the
+    newest row with a finite temperature; its start is found by binary search
+    instead of a scan. Returns None if no row has a finite temperature.
+    """
+    index = len(history) - 1
+    while index >= 0 and not math.isfinite(history[index][1]):
+        index -= 1
+    if index < 0:
+        return None
+    return history.bisect(history[index][0] - window_seconds)
+
+
+def _recent_rows(history, window_seconds: float):
+    """Return the rows of the trailing window, sorted by ts, or None.
+
+    Same result as ``_filter_recent(history, _find_last_ts(history) -
+    window_seconds)`` (None where ``_find_last_ts`` is None). Histories with
+    ``bisect`` (``HeaterHistory``) are time-ordered, so only the window itself
+    is read: O(log n + window) instead of O(n log n).
+    """
+    if getattr(history, "bisect", None) is None:
+        last_ts = _find_last_ts(history)
+        if last_ts is None:
+            return None
+        return _filter_recent(history, last_ts - window_seconds)
+
+    start = _window_start(history, window_seconds)
+    if start is None:
+        return None
+    values = iter(history.rows(start).tolist())
+    return [
+        row for row in zip(*([values] * history.fields)) if math.isfinite(row[1])
+    ]
+
+
 def _dedupe_by_ts(rows):
     """Remove consecutive duplicate timestamps."""
     out = []
@@ -106,12 +157,8 @@ def calculate_linear_eta(
     if not history or len(history) < 2:
         return None
 
-    last_ts = _find_last_ts(history)
-    if last_ts is None:
-        return None
-
-    recent = _filter_recent(history, last_ts - window_seconds)
-    if len(recent) < 2:
+    recent = _recent_rows(history, window_seconds)
+    if recent is None or len(recent) < 2:
         return None
 
     t0, temp0 = recent[0][0], recent[0][1]
@@ -191,11 +238,11 @@ def calculate_exponential_eta(
     if not history or len(history) < 3:
         return None
 
-    last_ts = _find_last_ts(history)
-    if last_ts is None:
+    recent = _recent_rows(history, window_seconds)
+    if recent is None:
         return None
 
-    recent = _dedupe_by_ts(_filter_recent(history, last_ts - window_seconds))
+    recent = _dedupe_by_ts(recent)
     if len(recent) < 6:
         return calculate_linear_eta(history, target)
 
@@ -250,16 +297,17 @@ def calculate_cooldown_linear_eta(
     if not cooldown_history:
         return None
 
-    last_ts = _find_last_ts(cooldown_history)
-    if last_ts is None:
-        return None
-
-    recent = _filter_recent(cooldown_history, last_ts - window_seconds)
-    if len(recent) < 2:
+    recent = _recent_rows(cooldown_history, window_seconds)
+    if recent is None or len(recent) < 2:
         return None
 
     t0, temp0 = recent[0]
     t1, temp1 = recent[-1]
+    return _cooldown_linear_eta(t0, temp0, t1, temp1, goal_c)
+
+
+def _cooldown_linear_eta(t0, temp0, t1, temp1, goal_c: float) -> Optional[float]:
+    """Cooldown ETA from the slope between the first and last window sample."""
     dt = t1 - t0
     if dt <= 0:
         return None
@@ -346,11 +394,10 @@ def calculate_cooldown_exponential_eta(
     if not cooldown_history or len(cooldown_history) < 4:
         return None
 
-    last_ts = _find_last_ts(cooldown_history)
-    if last_ts is None:
+    recent = _recent_rows(cooldown_history, window_seconds)
+    if recent is None:
         return None
 
-    recent = _filter_recent(cooldown_history, last_ts - window_seconds)
     if len(recent) < 6:
         return calculate_cooldown_linear_eta(cooldown_history, goal_c, window_seconds)
 
@@ -362,3 +409,980 @@ def calculate_cooldown_exponential_eta(
     except (ValueError, ArithmeticError) as exc:
         _LOG.debug("Exponential ETA math error: %s", exc)
         return None
+
+
+# ---------------------------------------------------------------------------
+# Incremental fit state
+# ---------------------------------------------------------------------------
+
+# Running sums are kept relative to an origin timestamp so x² stays small.
+# Once the oldest sample drifts this far from the origin the sums are rebuilt,
+# which also discards accumulated add/subtract rounding error.
+_REBASE_AFTER_SECONDS = 300.0
+
+
+class RollingFit:
+    """Incrementally maintained heating fit for a single heater.
+
+    Holds the samples inside the linear and exponential fit windows together
+    with running sums (n, Σx, Σy, Σxy, Σx²) of the log-delta series used by the
+    exponential model. Samples enter via :meth:`push` (or :meth:`sync`) and
+    leave when they fall out of the time window, so evaluating the fit costs
+    O(1) per new sample instead of a full history scan per tick.
+
+    Feed it with :meth:`sync` and evaluate it with
+    :func:`calculate_linear_eta_from_fit` or
+    :func:`calculate_exponential_eta_from_fit`; results match
+    :func:`calculate_linear_eta` / :func:`calculate_exponential_eta` with their
+    default windows.
+    """
+
+    __slots__ = (
+        "linear_window_seconds",
+        "exponential_window_seconds",
+        "epsilon_c",
+        "history_len",
+        "_source",
+        "_last_row",
+        "_consumed",
+        "_last_ts",
+        "_linear",
+        "_recent",
+        "_log_target",
+        "_log_rows",
+        "_origin",
+        "_n",
+        "_sx",
+        "_sy",
+        "_sxy",
+        "_sxx",
+    )
+
+    def __init__(
+        self,
+        linear_window_seconds: float = 10.0,
+        exponential_window_seconds: float = 30.0,
+        epsilon_c: float = 0.5,
+    ):
+        self.linear_window_seconds = float(linear_window_seconds)
+        self.exponential_window_seconds = float(exponential_window_seconds)
+        self.epsilon_c = float(epsilon_c)
+        self._source = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples and running sums."""
+        self.history_len = 0
+        # Last row consumed by sync() and the number of source rows consumed;
+        # together they locate new rows and rows the source has dropped.
+        self._last_row = None
+        self._consumed = 0
+        self._last_ts: Optional[float] = None
+        # (ts, temp, index) rows inside the linear window.
+        self._linear: deque = deque()
+        # (ts, temp, index) rows inside the exponential window, deduplicated by ts.
+        self._recent: deque = deque()
+        # (ts, log(target - temp), index) rows of _recent usable for the fit.
+        self._log_target: Optional[float] = None
+        self._log_rows: deque = deque()
+        self._origin = 0.0
+        self._n = 0
+        self._sx = 0.0
+        self._sy = 0.0
+        self._sxy = 0.0
+        self._sxx = 0.0
+
+    @property
+    def last_ts(self) -> Optional[float]:
+        """Timestamp of the newest sample seen, or None when empty."""
+        return self._last_ts
+
+    def copy(self, target: Optional[float] = None) -> "RollingFit":
+        """Return an independent copy of the fit.
+
+        The copy can be evaluated while the source keeps receiving samples,
+        e.g. outside the lock guarding the source's history. With a finite
+        *target* this fit first tracks the log-delta series for it, as
+        :func:`calculate_exponential_eta_from_fit` would, so neither the copy
+        nor later syncs of this fit rebuild the series.
+        """
+        if target is not None and _validate_scalar(target):
+            self._set_log_target(target)
+        clone = RollingFit.__new__(RollingFit)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone._linear = deque(self._linear)
+        clone._recent = deque(self._recent)
+        clone._log_rows = deque(self._log_rows)
+        return clone
+
+    def sync(self, history) -> None:
+        """Bring the fit up to date with a (ts, actual, ...) history container.
+
+        Only rows appended since the previous sync are pushed, and rows the
+        container has dropped from its front (e.g. through its maxlen) are
+        evicted, so the fit sees exactly what the stateless functions would.
+        A container that was replaced or cleared is replayed from scratch.
+
+        Containers exposing an ``appended`` counter (``HeaterHistory``) are
+        tracked by count; plain deques are tracked by the identity of the last
+        row consumed.
+        """
+        if history is not self._source:
+            self.reset()
+            self._source = history
+
+        size = len(history)
+        appended = getattr(history, "appended", None)
+        if appended is not None:
+            count = min(appended - self._consumed, size)
+            if count > 0 and self._last_ts is not None:
+                if history[size - count][0] < self._last_ts:
+                    # Container was cleared and refilled with older data.
+                    self.reset()
+                    count = size
+            fresh = [history[i] for i in range(size - count, size)]
+            base = appended - count
+            replay = self._last_row is None
+            if not replay and count == size and size:
+                self.reset()
+                replay = True
+        else:
+            seen = self._last_row
+            fresh = []
+            anchored = seen is None
+            for row in reversed(history):
+                if row is seen:
+                    anchored = True
+                    break
+                fresh.append(row)
+            fresh.reverse()
+            replay = not anchored or seen is None
+            if not anchored:
+                self.reset()
+            base = self._consumed
+            appended = base + len(fresh)
+
+        indexed = [(base + offset, row) for offset, row in enumerate(fresh)]
+        if replay:
+            # A full replay must tolerate unsorted input like _filter_recent.
+            indexed.sort(key=lambda item: item[1][0])
+        for index, row in indexed:
+            self._push(row[0], row[1], index)
+        self._consumed = appended
+        self._last_row = history[-1] if size else None
+        self.history_len = size
+
+        self._evict_dropped(appended - size)
+
+    def push(self, ts: float, temp: float) -> None:
+        """Append a sample and evict everything that left the fit windows."""
+        self._push(ts, temp, self._consumed)
+        self._consumed += 1
+        self.history_len += 1
+
+    def _push(self, ts: float, temp: float, index: int) -> None:
+        if not (math.isfinite(ts) and math.isfinite(temp)):
+            return
+        if self._last_ts is not None and ts < self._last_ts:
+            return
+        self._last_ts = ts
+
+        self._linear.append((ts, temp, index))
+        if not self._recent or self._recent[-1][0] != ts:
+            self._recent.append((ts, temp, index))
+            if self._log_target is not None:
+                self._add_log_row(ts, temp, index)
+
+        linear_cutoff = ts - self.linear_window_seconds
+        while self._linear and self._linear[0][0] <= linear_cutoff:
+            self._linear.popleft()
+
+        recent_cutoff = ts - self.exponential_window_seconds
+        while self._recent and self._recent[0][0] <= recent_cutoff:
+            self._recent.popleft()
+        self._evict_log_rows(lambda row: row[0] <= recent_cutoff)
+
+    def _evict_dropped(self, first_index: int) -> None:
+        """Evict rows the source no longer holds (index below *first_index*)."""
+        while self._linear and self._linear[0][2] < first_index:
+            self._linear.popleft()
+        while self._recent and self._recent[0][2] < first_index:
+            self._recent.popleft()
+        self._evict_log_rows(lambda row: row[2] < first_index)
+
+    def _evict_log_rows(self, expired) -> None:
+        rows = self._log_rows
+        evicted = False
+        while rows and expired(rows[0]):
+            ts, y, _ = rows.popleft()
+            x = ts - self._origin
+            self._n -= 1
+            self._sx -= x
+            self._sy -= y
+            self._sxy -= x * y
+            self._sxx -= x * x
+            evicted = True
+
+        if evicted and rows and (rows[0][0] - self._origin) > _REBASE_AFTER_SECONDS:
+            self._resum()
+
+    def _add_log_row(self, ts: float, temp: float, index: int) -> None:
+        delta = self._log_target - temp
+        if delta <= self.epsilon_c:
+            return
+        y = math.log(delta)
+        if not self._log_rows:
+            self._origin = ts
+        self._log_rows.append((ts, y, index))
+        x = ts - self._origin
+        self._n += 1
+        self._sx += x
+        self._sy += y
+        self._sxy += x * y
+        self._sxx += x * x
+
+    def _resum(self) -> None:
+        """Recompute running sums from the retained log rows."""
+        rows = self._log_rows
+        self._origin = rows[0][0] if rows else 0.0
+        self._n = 0
+        self._sx = self._sy = self._sxy = self._sxx = 0.0
+        for ts, y, _ in rows:
+            x = ts - self._origin
+            self._n += 1
+            self._sx += x
+            self._sy += y
+            self._sxy += x * y
+            self._sxx += x * x
+
+    def _set_log_target(self, target: float) -> None:
+        """Rebuild the log-delta series when the heating target changes."""
+        if self._log_target == target:
+            return
+        self._log_target = target
+        self._log_rows = deque()
+        for ts, temp, index in self._recent:
+            delta = target - temp
+            if delta > self.epsilon_c:
+                self._log_rows.append((ts, math.log(delta), index))
+        self._resum()
+
+    def _log_slope(self) -> Optional[float]:
+        """Return the least-squares slope of the log-delta series, or None."""
+        n = self._n
+        if n < 2:
+            return None
+        sxx = self._sxx - self._sx * self._sx / n
+        if sxx <= 0:
+            return None
+        sxy = self._sxy - self._sx * self._sy / n
+        return sxy / sxx
+
+
+def calculate_linear_eta_from_fit(fit: RollingFit, target: float) -> Optional[float]:
+    """
+    Linear heating ETA from an up-to-date :class:`RollingFit`.
+
+    Equivalent to :func:`calculate_linear_eta` with the fit's linear window.
+
+    Args:
+        fit: Rolling fit synchronized with the heater history
+        target: Target temperature in degrees
+
+    Returns:
+        Estimated seconds to target, or None if insufficient data
+    """
+    if not _validate_scalar(target):
+        return None
+    if fit.history_len < 2 or len(fit._linear) < 2:
+        return None
+
+    t0, temp0, _ = fit._linear[0]
+    t1, temp1, _ = fit._linear[-1]
+    time_diff = t1 - t0
+    temp_diff = temp1 - temp0
+    if time_diff <= 0 or temp_diff <= 0:
+        return None
+
+    remaining = target - temp1
+    if remaining <= 0:
+        return None
+
+    return max(0.0, remaining / (temp_diff / time_diff))
+
+
+def calculate_exponential_eta_from_fit(
+    fit: RollingFit, target: float
+) -> Optional[float]:
+    """
+    Exponential heating ETA from an up-to-date :class:`RollingFit`.
+
+    Equivalent to :func:`calculate_exponential_eta` with the fit's exponential
+    window, but reads slope and intercept from running sums.
+
+    Args:
+        fit: Rolling fit synchronized with the heater history
+        target: Target temperature in degrees
+
+    Returns:
+        Estimated seconds to target, or None if insufficient data
+    """
+    if not _validate_scalar(target):
+        return None
+    if fit.history_len < 3 or fit.last_ts is None:
+        return None
+
+    recent = fit._recent
+    if len(recent) < 6:
+        return calculate_linear_eta_from_fit(fit, target)
+
+    temp_now = recent[-1][1]
+    remaining_now = target - temp_now
+    if remaining_now <= 0:
+        return None
+
+    # Guard: window must show meaningful heating; otherwise no ETA is possible.
+    if (temp_now - recent[0][1]) <= 0.2:
+        return None
+
+    epsilon_c = fit.epsilon_c
+    if remaining_now <= epsilon_c:
+        return 0.0
+
+    try:
+        fit._set_log_target(target)
+        eta = None
+        rows = fit._log_rows
+        if fit._n >= 6 and (rows[-1][0] - rows[0][0]) >= 5:
+            slope = fit._log_slope()
+            if slope is not None and slope < -1e-4 and (-1.0 / slope) <= 2000:
+                tau = -1.0 / slope
+                eta = max(0.0, tau * math.log(remaining_now / epsilon_c))
+    except (ValueError, ArithmeticError) as exc:
+        _LOG.debug("Exponential ETA math error: %s", exc)
+        return calculate_linear_eta_from_fit(fit, target)
+
+    if eta is None:
+        return calculate_linear_eta_from_fit(fit, target)
+
+    linear_eta = calculate_linear_eta_from_fit(fit, target)
+    if linear_eta is not None and eta > linear_eta * 5:
+        return linear_eta
+
+    return eta
+
+
+class SlidingWindowMin:
+    """Minimum of the samples in a sliding time window (monotonic deque).
+
+    Samples are pushed in timestamp order. The queue only keeps samples that
+    can still become the minimum: a push first drops every queued sample that
+    is not lower than the new one, so values increase from front to back and
+    the front is the minimum. Eviction pops from the front. Every sample is
+    queued and dropped at most once, so all operations are amortized O(1).
+    """
+
+    __slots__ = ("_queue",)
+
+    def __init__(self) -> None:
+        # (ts, value, index) with strictly increasing values.
+        self._queue: deque = deque()
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Smallest value in the window, or None when empty."""
+        return self._queue[0][1] if self._queue else None
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._queue.clear()
+
+    def push(self, ts: float, value: float, index: int = 0) -> None:
+        """Add a sample no older than the previous one."""
+        queue = self._queue
+        while queue and queue[-1][1] >= value:
+            queue.pop()
+        queue.append((ts, value, index))
+
+    def evict(self, cutoff: float) -> None:
+        """Drop samples with ``ts <= cutoff``."""
+        queue = self._queue
+        while queue and queue[0][0] <= cutoff:
+            queue.popleft()
+
+    def evict_dropped(self, first_index: int) -> None:
+        """Drop samples whose index is below *first_index*."""
+        queue = self._queue
+        while queue and queue[0][2] < first_index:
+            queue.popleft()
+
+
+class CooldownFit:
+    """Incrementally maintained cooldown windows for a single heater.
+
+    Tracks the finite (ts, temp) samples of a cooldown ``HeaterHistory``
+    inside two trailing windows: the fit window used by
+    :func:`calculate_cooldown_linear_eta_from_fit`, and the ambient window
+    (at least 60 s) whose minimum feeds the plugin's ambient estimate. The
+    ambient minimum comes from a :class:`SlidingWindowMin`.
+
+    :meth:`sync` consumes only the rows appended since the previous call and
+    windows are trimmed as they slide, so keeping both up to date costs
+    amortized O(1) per sample. Windows end at the caller's current time;
+    rows that left a window are not restored if that time later moves back.
+    """
+
+    __slots__ = (
+        "window_seconds",
+        "ambient_window_seconds",
+        "_source",
+        "_consumed",
+        "_last_ts",
+        "_fit_rows",
+        "_ambient_rows",
+        "_ambient_min",
+    )
+
+    def __init__(self, window_seconds: float = 60.0) -> None:
+        self.window_seconds = float(window_seconds)
+        self.ambient_window_seconds = max(self.window_seconds, 60.0)
+        self._source = None
+        self._ambient_min = SlidingWindowMin()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._consumed = 0
+        self._last_ts: Optional[float] = None
+        # (ts, temp, index) rows inside the fit and ambient windows.
+        self._fit_rows: deque = deque()
+        self._ambient_rows: deque = deque()
+        self._ambient_min.clear()
+
+    def sync(self, history) -> None:
+        """Bring the windows up to date with a cooldown ``HeaterHistory``.
+
+        Rows appended since the previous sync are pushed, rows the history
+        has dropped from its front are evicted, and a history that was
+        replaced or cleared is replayed from scratch.
+        """
+        if history is not self._source:
+            self.reset()
+            self._source = history
+
+        size = len(history)
+        appended = history.appended
+        count = appended - self._consumed
+        if count >= size:
+            # Every held row is new: the history was cleared, or wrapped
+            # completely since the last sync.
+            self.reset()
+            count = size
+        first_index = appended - size
+        for i in range(size - count, size):
+            row = history[i]
+            self._push(row[0], row[1], first_index + i)
+        self._consumed = appended
+
+        while self._fit_rows and self._fit_rows[0][2] < first_index:
+            self._fit_rows.popleft()
+        while self._ambient_rows and self._ambient_rows[0][2] < first_index:
+            self._ambient_rows.popleft()
+        self._ambient_min.evict_dropped(first_index)
+
+    def _push(self, ts: float, temp: float, index: int) -> None:
+        if not (math.isfinite(ts) and math.isfinite(temp)):
+            return
+        if self._last_ts is not None and ts < self._last_ts:
+            return
+        self._last_ts = ts
+        row = (ts, temp, index)
+        self._fit_rows.append(row)
+        self._ambient_rows.append(row)
+        self._ambient_min.push(ts, temp, index)
+
+    def fit_rows(self, now: float) -> deque:
+        """Return the (ts, temp, index) rows of the fit window ending at *now*.
+
+        Matches filtering the history to ``ts > now - window_seconds`` and
+        passing the result to :func:`calculate_cooldown_linear_eta`. The
+        returned deque is internal state and must not be modified.
+        """
+        cutoff = now if self._last_ts is None else max(now, self._last_ts)
+        cutoff -= self.window_seconds
+        rows = self._fit_rows
+        while rows and rows[0][0] <= cutoff:
+            rows.popleft()
+        return rows
+
+    def ambient_window(self, now: float) -> tuple:
+        """Return ``(count, minimum, newest)`` temperatures of the ambient window.
+
+        The window holds the samples with ``ts > now - ambient_window_seconds``;
+        minimum and newest are None when it is empty.
+        """
+        cutoff = now - self.ambient_window_seconds
+        rows = self._ambient_rows
+        while rows and rows[0][0] <= cutoff:
+            rows.popleft()
+        self._ambient_min.evict(cutoff)
+        if not rows:
+            return 0, None, None
+        return len(rows), self._ambient_min.minimum, rows[-1][1]
+
+
+def calculate_cooldown_linear_eta_from_fit(
+    fit: CooldownFit, goal_c: float, now: float
+) -> Optional[float]:
+    """
+    Linear cooldown ETA from an up-to-date :class:`CooldownFit`.
+
+    Equivalent to :func:`calculate_cooldown_linear_eta` over the history
+    samples newer than ``now - fit.window_seconds``, with the fit's window.
+
+    Args:
+        fit: Cooldown fit synchronized with the cooldown history
+        goal_c: Target cooldown temperature in degrees
+        now: End of the fit window (current wall-clock time)
+
+    Returns:
+        Estimated seconds to goal, or None if insufficient data
+    """
+    if not _validate_scalar(goal_c) or not _validate_window(fit.window_seconds):
+        return None
+    rows = fit.fit_rows(now)
+    if len(rows) < 2:
+        return None
+    t0, temp0, _ = rows[0]
+    t1, temp1, _ = rows[-1]
+    return _cooldown_linear_eta(t0, temp0, t1, temp1, goal_c)
+
+
+# ---------------------------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------------------------
+
+_BATCH_DEFAULTS = {
+    "algorithm": "linear",
+    "linear_window_seconds": 10.0,
+    "exponential_window_seconds": 30.0,
+}
+
+
+def _batch_config(config: Optional[Mapping]):
+    """Merge *config* with the batch defaults and validate it once.
+
+    Returns (algorithm, linear_window, exponential_window, windows_ok).
+    """
+    merged = dict(_BATCH_DEFAULTS)
+    if config:
+        merged.update(config)
+    algorithm = merged["algorithm"]
+    if algorithm not in ("linear", "exponential"):
+        raise ValueError(f"Unknown ETA algorithm: {algorithm}")
+    try:
+        linear_window = float(merged["linear_window_seconds"])
+        exponential_window = float(merged["exponential_window_seconds"])
+    except (TypeError, ValueError):
+        return algorithm, 0.0, 0.0, False
+    windows_ok = _validate_window(linear_window) and _validate_window(
+        exponential_window
+    )
+    return algorithm, linear_window, exponential_window, windows_ok
+
+
+def _batch_target(targets: Mapping, heater) -> Optional[float]:
+    """Return the heater's target as a finite float, or None."""
+    try:
+        target = float(targets.get(heater))
+    except (TypeError, ValueError):
+        return None
+    return target if _validate_scalar(target) else None
+
+
+def _calculate_batch_histories(
+    histories: Mapping,
+    targets: Mapping,
+    algorithm: str,
+    linear_window: float,
+    exponential_window: float,
+) -> dict:
+    """Batch over raw histories: one per-heater call each, on the active backend."""
+    out = {}
+    for heater, history in histories.items():
+        target = _batch_target(targets, heater)
+        if target is None:
+            out[heater] = None
+        elif algorithm == "exponential":
+            out[heater] = calculate_exponential_eta(
+                history, target, exponential_window
+            )
+        else:
+            out[heater] = calculate_linear_eta(history, target, linear_window)
+    return out
+
+
+def calculate_batch(
+    histories: Mapping, targets: Mapping, config: Optional[Mapping] = None
+) -> dict:
+    """
+    Calculate heating ETAs for several heaters in one call.
+
+    The configuration is validated once for the whole batch. Raw histories
+    are evaluated one by one with the active backend's
+    :func:`calculate_linear_eta` or :func:`calculate_exponential_eta`.
+    Values that are :class:`RollingFit` instances are read directly from
+    their running sums and use the windows they were created with.
+
+    Per heater the result equals :func:`calculate_linear_eta` or
+    :func:`calculate_exponential_eta` called with the configured window.
+
+    Args:
+        histories: Mapping of heater name to history deque/HeaterHistory
+            or RollingFit
+        targets: Mapping of heater name to target temperature
+        config: Optional mapping with ``algorithm`` (``"linear"`` or
+            ``"exponential"``), ``linear_window_seconds`` (default 10s) and
+            ``exponential_window_seconds`` (default 30s)
+
+    Returns:
+        Dict mapping every heater in *histories* to its ETA in seconds, or
+        None if insufficient data
+
+    Raises:
+        ValueError: If the algorithm is unknown
+    """
+    algorithm, linear_window, exponential_window, windows_ok = _batch_config(config)
+    if not windows_ok:
+        return dict.fromkeys(histories)
+
+    out = {}
+    raw = {}
+    for heater, source in histories.items():
+        if isinstance(source, RollingFit):
+            target = _batch_target(targets, heater)
+            if target is None:
+                out[heater] = None
+            elif algorithm == "exponential":
+                out[heater] = calculate_exponential_eta_from_fit(source, target)
+            else:
+                out[heater] = calculate_linear_eta_from_fit(source, target)
+        else:
+            raw[heater] = source
+
+    if raw:
+        out.update(
+            _calculate_batch_histories(
+                raw, targets, algorithm, linear_window, exponential_window
+            )
+        )
+    # Preserve the caller's heater order.
+    return {heater: out[heater] for heater in histories}
+
+
+# ---------------------------------------------------------------------------
+# NumPy backend
+# ---------------------------------------------------------------------------
+
+
+def _np_samples(history, start: int = 0):
+    """Return (ts, temp) float64 arrays from the first two columns of *history*.
+
+    *start* skips the oldest rows of a ``HeaterHistory``.
+    """
+    rows = getattr(history, "rows", None)
+    if rows is not None:
+        # HeaterHistory: zero-copy view of the ring buffer.
+        data = np.frombuffer(rows(start), dtype=np.float64)
+        data = data.reshape(-1, history.fields)
+    else:
+        data = np.array([(row[0], row[1]) for row in history], dtype=np.float64)
+        data = data.reshape(-1, 2)
+    return data[:, 0], data[:, 1]
+
+
+def _np_recent(history, window_seconds: float):
+    """Vectorized _find_last_ts + _filter_recent; returns (ts, temp) or None."""
+    if getattr(history, "bisect", None) is not None:
+        # Time-ordered HeaterHistory: read only the window.
+        start = _window_start(history, window_seconds)
+        if start is None:
+            return None
+        ts, temp = _np_samples(history, start)
+        finite = np.isfinite(temp)
+        if not finite.all():
+            ts = ts[finite]
+            temp = temp[finite]
+        return ts, temp
+
+    ts, temp = _np_samples(history)
+    finite = np.isfinite(ts) & np.isfinite(temp)
+    if not finite.any():
+        return None
+    cutoff = ts[finite].max() - window_seconds
+    mask = finite & (ts > cutoff)
+    ts = ts[mask]
+    temp = temp[mask]
+    if ts.size > 1 and (ts[1:] < ts[:-1]).any():
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        temp = temp[order]
+    return ts, temp
+
+
+def _np_dedupe_by_ts(ts, temp):
+    """Vectorized _dedupe_by_ts on sorted arrays."""
+    if ts.size < 2:
+        return ts, temp
+    keep = np.empty(ts.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(ts[1:], ts[:-1], out=keep[1:])
+    return ts[keep], temp[keep]
+
+
+def _np_log_slope(xs, ys) -> Optional[float]:
+    """Least-squares slope of ys over xs, or None if degenerate."""
+    if xs.size < 2:
+        return None
+    dx = xs - xs.mean()
+    sxx = float(np.dot(dx, dx))
+    if sxx <= 0:
+        return None
+    return float(np.dot(dx, ys - ys.mean())) / sxx
+
+
+def _np_calculate_linear_eta(
+    history: deque, target: float, window_seconds: float = 10.0
+) -> Optional[float]:
+    """NumPy implementation of :func:`calculate_linear_eta`."""
+    if not _validate_scalar(target) or not _validate_window(window_seconds):
+        return None
+    if not history or len(history) < 2:
+        return None
+
+    recent = _np_recent(history, window_seconds)
+    if recent is None or recent[0].size < 2:
+        return None
+    ts, temp = recent
+
+    time_diff = float(ts[-1] - ts[0])
+    temp_diff = float(temp[-1] - temp[0])
+    if time_diff <= 0 or temp_diff <= 0:
+        return None
+
+    remaining = target - float(temp[-1])
+    if remaining <= 0:
+        return None
+
+    return max(0.0, remaining / (temp_diff / time_diff))
+
+
+def _np_exponential_fit(ts, temp, target: float, epsilon_c: float):
+    """NumPy implementation of :func:`_exponential_fit` on (ts, temp) arrays."""
+    delta = target - temp
+    x = ts - ts[0]
+    usable = (delta > epsilon_c) & (x >= 0)
+    xs = x[usable]
+    if xs.size < 6 or (xs[-1] - xs[0]) < 5:
+        return None
+
+    if (temp[-1] - temp[0]) <= 0.2:
+        return None
+
+    slope = _np_log_slope(xs, np.log(delta[usable]))
+    if slope is None:
+        return None
+    if slope >= -1e-4 or not (-1.0 / slope) > 0 or (-1.0 / slope) > 2000:
+        return None
+
+    tau = -1.0 / slope
+    remaining_now = target - float(temp[-1])
+    eta = tau * math.log(remaining_now / epsilon_c)
+    return max(0.0, eta)
+
+
+def _np_calculate_exponential_eta(
+    history: deque, target: float, window_seconds: float = 30.0
+) -> Optional[float]:
+    """NumPy implementation of :func:`calculate_exponential_eta`."""
+    if not _validate_scalar(target) or not _validate_window(window_seconds):
+        return None
+    if not history or len(history) < 3:
+        return None
+
+    recent = _np_recent(history, window_seconds)
+    if recent is None:
+        return None
+    ts, temp = _np_dedupe_by_ts(*recent)
+    if ts.size < 6:
+        return calculate_linear_eta(history, target)
+
+    remaining_now = target - float(temp[-1])
+    if remaining_now <= 0:
+        return None
+
+    if float(temp[-1] - temp[0]) <= 0.2:
+        return None
+
+    epsilon_c = 0.5
+    if remaining_now <= epsilon_c:
+        return 0.0
+
+    try:
+        eta = _np_exponential_fit(ts, temp, target, epsilon_c)
+    except (ValueError, ArithmeticError) as exc:
+        _LOG.debug("Exponential ETA math error: %s", exc)
+        return calculate_linear_eta(history, target)
+
+    if eta is None:
+        return calculate_linear_eta(history, target)
+
+    linear_eta = calculate_linear_eta(history, target)
+    if linear_eta is not None and eta > linear_eta * 5:
+        return linear_eta
+
+    return eta
+
+
+def _np_calculate_cooldown_linear_eta(
+    cooldown_history: deque, goal_c: float, window_seconds: float = 60.0
+) -> Optional[float]:
+    """NumPy implementation of :func:`calculate_cooldown_linear_eta`."""
+    if not _validate_scalar(goal_c) or not _validate_window(window_seconds):
+        return None
+    if not cooldown_history:
+        return None
+
+    recent = _np_recent(cooldown_history, window_seconds)
+    if recent is None or recent[0].size < 2:
+        return None
+    ts, temp = recent
+
+    dt = float(ts[-1] - ts[0])
+    if dt <= 0:
+        return None
+
+    slope = float(temp[-1] - temp[0]) / dt
+    if slope >= -1e-3:
+        return None
+
+    remaining = float(temp[-1]) - goal_c
+    if remaining <= 0:
+        return None
+
+    eta = remaining / (-slope)
+    if not math.isfinite(eta) or eta < 0:
+        return None
+
+    return float(min(eta, 24 * 3600))
+
+
+def _np_cooldown_exponential_fit(ts, temp, ambient_c: float, goal_c: float, epsilon: float):
+    """NumPy implementation of :func:`_cooldown_exponential_fit`."""
+    delta = temp - ambient_c
+    x = ts - ts[0]
+    usable = (delta > epsilon) & (x >= 0)
+    xs = x[usable]
+    if xs.size < 4:
+        return None
+
+    slope = _np_log_slope(xs, np.log(delta[usable]))
+    if slope is None or slope >= -1e-4:
+        return None
+
+    tau = -1.0 / slope
+    if tau <= 0 or tau > 20000:
+        return None
+
+    numerator = float(temp[-1]) - ambient_c
+    denominator = goal_c - ambient_c
+    if numerator <= 0 or denominator <= 0:
+        return None
+
+    eta = tau * math.log(numerator / denominator)
+    if not math.isfinite(eta) or eta < 0:
+        return None
+
+    return float(min(eta, 24 * 3600))
+
+
+def _np_calculate_cooldown_exponential_eta(
+    cooldown_history: deque,
+    ambient_c: float,
+    goal_c: float,
+    window_seconds: float = 60.0,
+) -> Optional[float]:
+    """NumPy implementation of :func:`calculate_cooldown_exponential_eta`."""
+    if not (_validate_scalar(ambient_c) and _validate_scalar(goal_c)):
+        return None
+    if not _validate_window(window_seconds):
+        return None
+    if goal_c <= ambient_c:
+        return None
+    if not cooldown_history or len(cooldown_history) < 4:
+        return None
+
+    recent = _np_recent(cooldown_history, window_seconds)
+    if recent is None:
+        return None
+    ts, temp = recent
+    if ts.size < 6:
+        return calculate_cooldown_linear_eta(cooldown_history, goal_c, window_seconds)
+
+    if float(temp[-1]) <= goal_c:
+        return None
+
+    try:
+        return _np_cooldown_exponential_fit(ts, temp, ambient_c, goal_c, epsilon=0.5)
+    except (ValueError, ArithmeticError) as exc:
+        _LOG.debug("Exponential ETA math error: %s", exc)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+_BACKENDS = {
+    "python": {
+        "calculate_linear_eta": calculate_linear_eta,
+        "calculate_exponential_eta": calculate_exponential_eta,
+        "calculate_cooldown_linear_eta": calculate_cooldown_linear_eta,
+        "calculate_cooldown_exponential_eta": calculate_cooldown_exponential_eta,
+    },
+}
+if np is not None:
+    _BACKENDS["numpy"] = {
+        "calculate_linear_eta": _np_calculate_linear_eta,
+        "calculate_exponential_eta": _np_calculate_exponential_eta,
+        "calculate_cooldown_linear_eta": _np_calculate_cooldown_linear_eta,
+        "calculate_cooldown_exponential_eta": _np_calculate_cooldown_exponential_eta,
+    }
+
+BACKEND = "python"
+
+
+def available_backends() -> tuple:
+    """Return the names of the calculator backends usable in this environment."""
+    return tuple(_BACKENDS)
+
+
+def use_backend(name: str) -> None:
+    """Bind the public ``calculate_*`` functions to the named backend.
+
+    Args:
+        name: ``"python"`` or ``"numpy"`` (see :func:`available_backends`)
+
+    Raises:
+        ValueError: If the backend is unknown or NumPy is not installed
+    """
+    global BACKEND  # pylint: disable=global-statement
+    table = _BACKENDS.get(name)
+    if table is None:
+        raise ValueError(f"Calculator backend not available: {name}")
+    globals().update(table)
+    BACKEND = name
+
+
+use_backend("numpy" if np is not None else "python")
@@ -0,0 +1,225 @@
+"""Per-heater runtime state.
+
+Everything the plugin tracks about one heater lives on a single
+:class:`HeaterState` object: heating and cooldown histories, the last seen
+target, the learned ambient baseline, the cached profile support decision,
+the last broadcast ETA, the incremental heating fit and the fields last sent
+to the frontend. A :class:`HeaterRegistry` maps interned heater names to
+these objects, so the temperature callback does one dict lookup per heater
+per tick and reads the rest as slot attributes instead of probing half a
+dozen name-keyed dicts.
+
+Code that works on one field across all heaters (persistence, resets, tests)
+can use :meth:`HeaterRegistry.field`, a dict-like view in which a heater is
+present when that field is not None.
+
+Each state carries its own lock. Writers hold it only while touching that
+heater, and readers copy what they need under it (see
+:meth:`HeaterState.snapshot`) and work on the copy, so no code path has to
+hold one lock across every heater.
+"""
+
+import sys
+import threading
+from typing import Any, Dict, Iterator, MutableMapping, NamedTuple, Optional
+
+
+class HeaterSnapshot(NamedTuple):
+    """Immutable copy of the reportable state of one heater."""
+
+    name: str
+    last_target: Optional[float]
+    last_eta: Optional[float]
+    last_eta_kind: Optional[str]
+    samples: int
+    cooldown_samples: int
+
+
+class HeaterState:
+    """Slotted state of one heater; None marks an absent value.
+
+    The histories, target, baseline, ETA and fit fields are guarded by
+    :attr:`lock`. The support caches are plain single-value stores that may
+    be written without it; a stale read only causes a re-check.
+
+    Attributes:
+        name (str): Interned heater name ("tool0", "bed", ...).
+        lock (threading.Lock): Guards this heater's fields and the contents
+            of its history containers.
+        history: Heating (ts, actual, target) history container.
+        cooldown_history: Cooldown (ts, actual) history container.
+        last_target (float): Target seen on the previous tick.
+        ambient_baseline (float): Lowest plausible temperature seen while
+            the heater was off, used as ambient estimate.
+        supported (bool): Cached "heater is in the active profile" decision.
+        support_logged (bool): Last support decision written to the debug log.
+        last_eta (float): Last broadcast ETA in seconds.
+        last_eta_kind (str): "heating" or "cooling" for :attr:`last_eta`.
+        fit (calculator.RollingFit): Incremental heating fit over
+            :attr:`history`.
+        cooldown_fit (calculator.CooldownFit): Incremental cooldown fit and
+            ambient minimum over :attr:`cooldown_history`.
+        sent (dict): Websocket fields of this heater as the frontend last
+            received them; the next broadcast only sends fields that differ.
+    """
+
+    __slots__ = (
+        "name",
+        "lock",
+        "history",
+        "cooldown_history",
+        "last_target",
+        "ambient_baseline",
+        "supported",
+        "support_logged",
+        "last_eta",
+        "last_eta_kind",
+        "fit",
+        "cooldown_fit",
+        "sent",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.lock = threading.Lock()
+        self.history: Any = None
+        self.cooldown_history: Any = None
+        self.last_target: Optional[float] = None
+        self.ambient_baseline: Optional[float] = None
+        self.supported: Optional[bool] = None
+        self.support_logged: Optional[bool] = None
+        self.last_eta: Optional[float] = None
+        self.last_eta_kind: Optional[str] = None
+        self.fit: Any = None
+        self.cooldown_fit: Any = None
+        self.sent: Optional[Dict[str, Any]] = None
+
+    def __repr__(self) -> str:
+        return f"HeaterState({self.name!r})"
+
+    def snapshot(self) -> HeaterSnapshot:
+        """Return an immutable copy of this heater's reportable state."""
+        with self.lock:
+            history = self.history
+            cooldown_history = self.cooldown_history
+            return HeaterSnapshot(
+                name=self.name,
+                last_target=self.last_target,
+                last_eta=self.last_eta,
+                last_eta_kind=self.last_eta_kind,
+                samples=len(history) if history is not None else 0,
+                cooldown_samples=(
+                    len(cooldown_history) if cooldown_history is not None else 0
+                ),
+            )
+
+
+class HeaterRegistry:
+    """Heater name to :class:`HeaterState`.
+
+    Adding and listing heaters is thread-safe; the returned states are
+    guarded by their own locks.
+    """
+
+    __slots__ = ("_states", "_lock")
+
+    def __init__(self) -> None:
+        self._states: Dict[str, HeaterState] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __iter__(self) -> Iterator[HeaterState]:
+        with self._lock:
+            return iter(list(self._states.values()))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._states
+
+    def get(self, name: str) -> Optional[HeaterState]:
+        """Return the state of *name*, or None if it was never seen."""
+        return self._states.get(name)
+
+    def state(self, name: str) -> HeaterState:
+        """Return the state of *name*, creating it on first use."""
+        state = self._states.get(name)
+        if state is None:
+            key = sys.intern(str(name))
+            with self._lock:
+                state = self._states.get(key)
+                if state is None:
+                    state = HeaterState(key)
+                    self._states[key] = state
+        return state
+
+    def field(self, field: str) -> "HeaterFieldView":
+        """Return a dict-like view of *field* across all heaters."""
+        return HeaterFieldView(self, field)
+
+    def assign(self, field: str, values: Any) -> None:
+        """Replace *field* on every heater with the entries of *values*.
+
+        Heaters missing from *values* get None.
+        """
+        values = dict(values or {})
+        for state in self:
+            setattr(state, field, None)
+        for name, value in values.items():
+            setattr(self.state(name), field, value)
+
+
+class HeaterFieldView(MutableMapping):
+    """Mutable mapping of heater name to one :class:`HeaterState` field.
+
+    Setting a key creates the heater's state if needed; deleting a key sets
+    the field to None. Heaters whose field is None are not listed.
+    """
+
+    __slots__ = ("_registry", "_field")
+
+    def __init__(self, registry: HeaterRegistry, field: str) -> None:
+        if field not in HeaterState.__slots__ or field in ("name", "lock"):
+            raise ValueError(f"unknown heater state field: {field!r}")
+        self._registry = registry
+        self._field = field
+
+    def __getitem__(self, name: str) -> Any:
+        state = self._registry.get(name)
+        value = None if state is None else getattr(state, self._field)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        setattr(self._registry.state(name), self._field, value)
+
+    def __delitem__(self, name: str) -> None:
+        state = self._registry.get(name)
+        if state is None or getattr(state, self._field) is None:
+            raise KeyError(name)
+        setattr(state, self._field, None)
+
+    def __iter__(self) -> Iterator[str]:
+        field = self._field
+        return iter(
+            [state.name for state in self._registry if getattr(state, field) is not None]
+        )
+
+    def __len__(self) -> int:
+        field = self._field
+        return sum(1 for state in self._registry if getattr(state, field) is not None)
+
+    def __contains__(self, name: object) -> bool:
+        state = self._registry.get(name)  # type: ignore[arg-type]
+        return state is not None and getattr(state, self._field) is not None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        state = self._registry.get(name)
+        if state is None:
+            return default
+        value = getattr(state, self._field)
+        return default if value is None else value
+
+    def __repr__(self) -> str:
+        return f"HeaterFieldView({self._field!r}, {dict(self.items())!r})"
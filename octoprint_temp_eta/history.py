@@ -0,0 +1,222 @@
+"""Compact per-heater temperature history storage.
+
+Samples are kept as raw doubles in a preallocated ``array('d')`` ring buffer
+instead of a deque of Python tuples, which keeps memory per sample fixed and
+avoids creating garbage-collected objects on every temperature callback.
+
+Rows are kept in timestamp order: :meth:`HeaterHistory.append` rejects rows
+with a non-finite or older timestamp, so readers can binary-search the
+timestamp column instead of sorting it.
+"""
+
+import math
+
+from array import array
+from typing import Iterable, Iterator, Optional
+
+
+class HeaterHistory:
+    """Fixed-capacity ring buffer of (ts, value, ...) float rows.
+
+    Drop-in replacement for the ``deque(maxlen=...)`` of tuples previously used
+    per heater: it supports ``append``, ``clear``, ``len``, indexing and
+    iteration (yielding tuples), so the calculator functions keep working
+    unchanged.
+
+    Every row is written twice, at ``i`` and ``i + maxlen``. The duplicate
+    costs one extra row of storage per sample but makes any run of consecutive
+    rows contiguous in memory, so :meth:`window` can return zero-copy
+    ``memoryview`` slices even when the ring has wrapped.
+
+    Timestamps (the first field) are finite and non-decreasing from the oldest
+    to the newest row; equal timestamps are allowed.
+
+    Attributes:
+        fields (int): Number of floats per row (3 for heating, 2 for cooldown).
+        appended (int): Total rows appended since creation. Consumers such as
+            :class:`calculator.RollingFit` use it to find rows added since their
+            last look without rescanning the buffer.
+        rejected (int): Rows refused by :meth:`append` because their
+            timestamp was not finite or older than the newest row.
+    """
+
+    __slots__ = (
+        "fields",
+        "appended",
+        "rejected",
+        "_maxlen",
+        "_buf",
+        "_head",
+        "_len",
+    )
+
+    def __init__(
+        self, maxlen: int, fields: int = 3, rows: Optional[Iterable] = None
+    ) -> None:
+        """Create an empty history, optionally pre-filled with *rows*.
+
+        Args:
+            maxlen (int): Maximum number of rows kept; older rows are dropped.
+            fields (int): Number of floats per row.
+            rows: Optional iterable of row sequences to append (in timestamp
+                order; see :meth:`append`).
+        """
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self.fields = int(fields)
+        self.appended = 0
+        self.rejected = 0
+        self._maxlen = int(maxlen)
+        self._buf = array("d", bytes(8 * self.fields * 2 * self._maxlen))
+        self._head = 0
+        self._len = 0
+        if rows is not None:
+            for row in rows:
+                self.append(row)
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of rows kept."""
+        return self._maxlen
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __repr__(self) -> str:
+        return f"HeaterHistory({list(self)!r}, maxlen={self._maxlen})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HeaterHistory):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def append(self, row) -> bool:
+        """Append a row, dropping the oldest one when full.
+
+        Args:
+            row: Sequence of at least ``fields`` numbers.
+
+        Returns:
+            bool: False if the row was rejected because its timestamp is not
+            finite or older than the newest row's.
+        """
+        f = self.fields
+        cap = self._maxlen
+        ts = float(row[0])
+        if not math.isfinite(ts) or (
+            self._len and ts < self._buf[(self._head + self._len - 1) * f]
+        ):
+            self.rejected += 1
+            return False
+        slot = (self._head + self._len) % cap
+        if self._len < cap:
+            self._len += 1
+        else:
+            self._head = (self._head + 1) % cap
+        buf = self._buf
+        lo = slot * f
+        hi = (slot + cap) * f
+        for k in range(f):
+            value = float(row[k])
+            buf[lo + k] = value
+            buf[hi + k] = value
+        self.appended += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop all rows (the ``appended`` counter keeps counting)."""
+        self._head = 0
+        self._len = 0
+
+    def resize(self, maxlen: int) -> None:
+        """Change capacity in place, keeping the newest rows.
+
+        Args:
+            maxlen (int): New maximum number of rows.
+        """
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        if maxlen == self._maxlen:
+            return
+        rows = self.rows()
+        keep = min(len(rows) // self.fields, maxlen)
+        self._maxlen = int(maxlen)
+        self._buf = array("d", bytes(8 * self.fields * 2 * self._maxlen))
+        self._head = 0
+        self._len = 0
+        appended = self.appended
+        start = (len(rows) // self.fields - keep) * self.fields
+        for i in range(keep):
+            self.append(rows[start + i * self.fields : start + (i + 1) * self.fields])
+        self.appended = appended
+
+    def _row(self, index: int) -> tuple:
+        # Rows are mirrored, so head + index never needs to wrap.
+        f = self.fields
+        lo = (self._head + index) * f
+        return tuple(self._buf[lo : lo + f])
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("HeaterHistory index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[tuple]:
+        # Group the flat values into row tuples at C speed.
+        values = iter(self.rows().tolist())
+        return zip(*([values] * self.fields))
+
+    def __reversed__(self) -> Iterator[tuple]:
+        return reversed(list(self))
+
+    def rows(self, start: int = 0) -> memoryview:
+        """Return a flat zero-copy view of rows ``start..len`` (oldest first).
+
+        The view holds ``fields`` consecutive doubles per row. It stays valid
+        until the next append/resize overwrites the underlying slots.
+        """
+        start = max(0, min(int(start), self._len))
+        f = self.fields
+        lo = (self._head + start) * f
+        return memoryview(self._buf)[lo : lo + (self._len - start) * f]
+
+    def last(self) -> Optional[tuple]:
+        """Return the newest row, or None when empty."""
+        return self._row(self._len - 1) if self._len else None
+
+    def bisect(self, cutoff: float) -> int:
+        """Return the index of the oldest row with ``ts > cutoff``.
+
+        Binary search over the timestamp column; returns ``len(self)`` when
+        no row is newer than *cutoff*.
+
+        Args:
+            cutoff (float): Exclusive lower timestamp bound.
+        """
+        buf = self._buf
+        f = self.fields
+        head = self._head
+        lo = 0
+        hi = self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if buf[(head + mid) * f] > cutoff:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def window(self, cutoff: float) -> memoryview:
+        """Return a flat view of the newest rows with ``ts > cutoff``.
+
+        Args:
+            cutoff (float): Exclusive lower timestamp bound.
+        """
+        return self.rows(self.bisect(cutoff))
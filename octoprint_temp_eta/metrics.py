@@ -0,0 +1,151 @@
+"""Lightweight latency instrumentation for the plugin hot paths.
+
+Each instrumented stage owns a :class:`LatencyHistogram` with fixed,
+logarithmically spaced buckets. Recording a sample increments one counter in
+a preallocated array, so instrumentation is cheap enough to stay always on and
+memory does not grow with the number of samples.
+"""
+
+import functools
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Optional
+
+# Bucket upper bounds in seconds: 1 µs .. ~12 s, each 25% wider than the last.
+# Percentiles are reported as the upper bound of the bucket they fall into,
+# so they overestimate by at most 25%.
+_BUCKET_BOUNDS = tuple(1e-6 * 1.25**i for i in range(73))
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, total and max.
+
+    Thread-safe; :meth:`record` performs no allocation beyond the arguments.
+    """
+
+    __slots__ = ("_lock", "_counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # One extra bucket collects samples above the largest bound.
+        self._counts = array("Q", bytes(8 * (len(_BUCKET_BOUNDS) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one sample.
+
+        Args:
+            seconds (float): Measured duration in seconds.
+        """
+        index = bisect_left(_BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            for i in range(len(self._counts)):
+                self._counts[i] = 0
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def _percentile(self, fraction: float) -> float:
+        # Caller holds the lock and guarantees count > 0.
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index >= len(_BUCKET_BOUNDS):
+                    return self.max
+                return min(_BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """Return count, mean and p50/p95/p99/max latencies in milliseconds."""
+        with self._lock:
+            if not self.count:
+                return {
+                    "count": 0,
+                    "mean_ms": None,
+                    "p50_ms": None,
+                    "p95_ms": None,
+                    "p99_ms": None,
+                    "max_ms": None,
+                }
+            return {
+                "count": self.count,
+                "mean_ms": 1000.0 * self.total / self.count,
+                "p50_ms": 1000.0 * self._percentile(0.50),
+                "p95_ms": 1000.0 * self._percentile(0.95),
+                "p99_ms": 1000.0 * self._percentile(0.99),
+                "max_ms": 1000.0 * self.max,
+            }
+
+
+class MetricsRegistry:
+    """Named collection of latency histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Return the histogram called *name*, creating it on first use."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one sample to the histogram called *name*."""
+        self.histogram(name).record(seconds)
+
+    def reset(self) -> None:
+        """Discard the samples of every histogram."""
+        with self._lock:
+            histograms = list(self._histograms.values())
+        for histogram in histograms:
+            histogram.reset()
+
+    def snapshot(self) -> dict:
+        """Return ``{name: histogram snapshot}`` for every histogram."""
+        with self._lock:
+            items = sorted(self._histograms.items())
+        return {name: histogram.snapshot() for name, histogram in items}
+
+
+def timed(name: str, registry_attr: str = "_metrics") -> Callable:
+    """Decorate a method so each call is recorded in ``self.<registry_attr>``.
+
+    Args:
+        name (str): Histogram name.
+        registry_attr (str): Attribute holding the :class:`MetricsRegistry`.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            registry: Optional[MetricsRegistry] = getattr(self, registry_attr, None)
+            if registry is None:
+                return func(self, *args, **kwargs)
+            histogram = registry.histogram(name)
+            started = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                histogram.record(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorate
@@ -3,14 +3,21 @@
 """MQTT client wrapper for Temperature ETA plugin.
 
 Handles MQTT broker connection, reconnection, and message publishing with
-configurable settings for broker details, authentication, and QoS.
+configurable settings for broker details, authentication, and QoS. Messages
+are handed to a :class:`~octoprint_temp_eta.mqtt_queue.PublishQueue` and
+sent from its publisher thread.
+
+A single connection manager thread owns (re)connecting: failed attempts and
+lost connections are retried with exponential backoff and jitter, and
+messages published while the broker is unreachable are kept in a bounded
+offline buffer that is flushed once the connection is back.
 """
 
-import json
+import random
 import ssl
 import threading
 import time
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
 try:
     import paho.mqtt.client as mqtt
@@ -22,12 +29,81 @@ except ImportError as e:  # pragma: no cover
     )
     mqtt = None  # type: ignore
 
+from .metrics import MetricsRegistry, timed
+from .mqtt_payload import PayloadEncoder
+from .mqtt_queue import MessageBuffer, PublishQueue
+
+
+# Where ETA documents are published: one topic per heater, one combined
+# topic for all heaters, or both.
+MQTT_TOPIC_MODES = ("per_heater", "combined", "both")
+
+# Reconnect delays grow from RECONNECT_MIN_S to RECONNECT_MAX_S.
+RECONNECT_MIN_S = 1.0
+RECONNECT_MAX_S = 300.0
+
+# An attempt that has not been acknowledged by the broker after this long
+# counts as failed.
+CONNECT_TIMEOUT_S = 30.0
+
+# Messages kept while the broker is unreachable: the latest document per ETA
+# topic plus state change events, oldest dropped first.
+OFFLINE_BUFFER_SIZE = 256
+
+
+def _is_event_topic(topic: str) -> bool:
+    """Whether *topic* carries events that must never be coalesced."""
+    return topic.endswith("/state_change")
+
+
+class ReconnectBackoff:
+    """Exponential backoff with jitter for broker reconnects.
+
+    The n-th consecutive failure waits a random time between ``minimum``
+    and ``min(maximum, minimum * 2 ** n)`` seconds, so printers that lost
+    the same broker spread their reconnects out instead of retrying in
+    lockstep.
+
+    Attributes:
+        failures (int): Consecutive failures since the last :meth:`reset`.
+    """
+
+    def __init__(
+        self,
+        minimum: float = RECONNECT_MIN_S,
+        maximum: float = RECONNECT_MAX_S,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Create a backoff policy.
+
+        Args:
+            minimum (float): Shortest delay in seconds.
+            maximum (float): Longest delay in seconds.
+            rng: Random source, for deterministic tests.
+        """
+        self._minimum = max(0.0, float(minimum))
+        self._maximum = max(self._minimum, float(maximum))
+        self._rng = rng if rng is not None else random.Random()  # nosec B311
+        self.failures = 0
+
+    def next_delay(self) -> float:
+        """Record a failure and return the delay before the next attempt."""
+        # Cap the exponent; the ceiling is clamped to maximum long before.
+        ceiling = min(self._maximum, self._minimum * 2 ** min(self.failures + 1, 32))
+        self.failures += 1
+        return self._rng.uniform(self._minimum, ceiling)
+
+    def reset(self) -> None:
+        """Start over after a successful connection."""
+        self.failures = 0
+
 
 class MQTTClientWrapper:
     """Thread-safe MQTT client wrapper for the Temperature ETA plugin.
 
     Manages connection lifecycle, automatic reconnection, and message publishing.
-    All MQTT operations are non-blocking to avoid impacting the temperature callback.
+    All MQTT operations are non-blocking to avoid impacting the temperature callback:
+    publishing only queues the message for the publisher thread.
     """
 
     def __init__(self, logger: Any, identifier: str):
@@ -59,23 +135,64 @@ class MQTTClientWrapper:
 
         # Publishing settings
         self._base_topic = "octoprint/temp_eta"
+        # Topic strings per heater, plus the combined topic under the key
+        # None, for the base topic they were built from (see _topics_for).
+        self._topic_table: dict[Optional[str], tuple[str, str]] = {}
+        self._topic_table_base = self._base_topic
         self._qos = 0
         self._retain = False
         self._publish_interval = 1.0
 
-        # State tracking for state transition events
-        self._last_published_time = 0.0
+        # "per_heater" (<base>/<heater>/eta), "combined" (<base>/all/eta)
+        # or "both".
+        self._topic_mode = "per_heater"
+
+        # Publish throttling (per heater and for the combined topic) and
+        # state tracking for state transition events
+        self._last_published_by_heater: dict[str, float] = {}
+        self._last_published_doc: dict[str, dict[str, Any]] = {}
+        self._last_combined_time = 0.0
+        self._last_combined_docs: dict[str, dict[str, Any]] = {}
+
+        # Significance filtering: with a deadband > 0, documents are only
+        # published when the ETA or actual temperature moved by more than it
+        # (or another field changed), or after _heartbeat_interval seconds.
+        # A field whose deadband is 0 does not gate publishing on its own.
+        self._eta_deadband_s = 0.0
+        self._actual_deadband_c = 0.0
+        self._heartbeat_interval = 60.0
         self._last_heater_state: dict[str, Optional[str]] = {}
 
-        # Connection retry logic
-        self._last_connect_attempt = 0.0
-        self._connect_retry_interval = 30.0
+        # Connection manager: one long-lived thread connects and reconnects,
+        # waiting _backoff delays between attempts. _wake interrupts its wait.
+        self._manager_thread: Optional[threading.Thread] = None
+        self._manager_stopping = False
+        self._wake = threading.Event()
+        self._backoff = ReconnectBackoff()
+        self._next_attempt_at = 0.0  # time.monotonic()
+        self._connect_started_at = 0.0  # time.monotonic()
+        self._ever_connected = False
+        self._connect_attempts = 0
+        self._connect_failures = 0
+        self._reconnects = 0
+        self._disconnects = 0
+
+        # Store-and-forward while the broker is unreachable.
+        self._offline = MessageBuffer(OFFLINE_BUFFER_SIZE)
 
         # Avoid log spam when paho-mqtt is not installed.
         # Use a dedicated lock to avoid re-entrantly acquiring self._lock.
         self._mqtt_unavailable_lock = threading.Lock()
         self._mqtt_unavailable_warned = False
 
+        # Publish latency histograms, merged into the plugin's API metrics.
+        self._metrics = MetricsRegistry()
+
+        # Outbound queue drained by a publisher thread while MQTT is enabled.
+        # Payload encoding and client.publish run there, not on the caller.
+        self._queue = PublishQueue(self._send_queued, logger=logger)
+        self._encoder = PayloadEncoder()
+
     def _warn_mqtt_unavailable(self) -> None:
         """Log a one-time warning when MQTT support is unavailable."""
         with self._mqtt_unavailable_lock:
@@ -114,16 +231,45 @@ class MQTTClientWrapper:
             self._base_topic = self._build_final_topic(
                 base_topic, use_appearance_name, appearance_name, custom_identifier
             )
+            self._topic_table = {}
+            self._topic_table_base = self._base_topic
 
             self._qos = int(settings.get("mqtt_qos", 0))
             self._retain = bool(settings.get("mqtt_retain", False))
             self._publish_interval = float(settings.get("mqtt_publish_interval", 1.0))
+            self._eta_deadband_s = max(
+                0.0, float(settings.get("mqtt_eta_deadband_s") or 0.0)
+            )
+            self._actual_deadband_c = max(
+                0.0, float(settings.get("mqtt_actual_deadband_c") or 0.0)
+            )
+            self._heartbeat_interval = max(
+                0.0, float(settings.get("mqtt_heartbeat_s", 60.0) or 0.0)
+            )
+            topic_mode = str(settings.get("mqtt_topic_mode") or "per_heater")
+            self._topic_mode = (
+                topic_mode if topic_mode in MQTT_TOPIC_MODES else "per_heater"
+            )
 
             # Reconnect if settings changed and enabled
+            stale_client = None
             if self._enabled and (not old_enabled or not self._connected):
+                if not old_enabled:
+                    self._backoff.reset()
+                    self._next_attempt_at = 0.0
                 self._schedule_connect()
             elif not self._enabled and old_enabled:
-                self._disconnect_internal()
+                stale_client = self._disconnect_internal()
+            enabled = self._enabled
+
+        # Outside self._lock: the publisher thread and paho's network thread
+        # take it, and stopping either joins that thread.
+        if stale_client is not None:
+            self._stop_client(stale_client)
+        if enabled:
+            self._queue.start()
+        else:
+            self._queue.stop()
 
     def _build_final_topic(
         self,
@@ -178,7 +324,7 @@ class MQTTClientWrapper:
         return sanitized.strip("/")
 
     def _schedule_connect(self) -> None:
-        """Schedule a connection attempt (internal, lock must be held)."""
+        """Start or wake the connection manager (internal, lock must be held)."""
         if mqtt is None:
             self._warn_mqtt_unavailable()
             return
@@ -186,41 +332,96 @@ class MQTTClientWrapper:
         if not self._broker_host:
             return
 
-        # Start connection in background thread to avoid blocking
-        if not self._connecting and not self._connected:
-            self._connecting = True
-            thread = threading.Thread(target=self._connect_thread, daemon=True)
-            thread.start()
+        self._manager_stopping = False
+        if self._manager_thread is None:
+            self._manager_thread = threading.Thread(
+                target=self._connection_manager,
+                name="temp_eta-mqtt-connect",
+                daemon=True,
+            )
+            self._manager_thread.start()
+        self._wake.set()
+
+    def _connection_manager(self) -> None:
+        """Keep the broker connection up (connection manager thread).
 
-    def _connect_thread(self) -> None:
-        """Background thread for establishing MQTT connection."""
+        Runs while MQTT is enabled. Connection attempts happen here, one at a
+        time; between them the thread sleeps until the next backoff deadline,
+        the connect timeout, or until :meth:`_schedule_connect` or a paho
+        callback wakes it.
+        """
+        while True:
+            self._wake.clear()
+            attempt = False
+            with self._lock:
+                if (
+                    self._manager_stopping
+                    or not self._enabled
+                    or not self._broker_host
+                ):
+                    if self._manager_thread is threading.current_thread():
+                        self._manager_thread = None
+                    return
+
+                now = time.monotonic()
+                wait: Optional[float] = None
+                if self._connected:
+                    pass
+                elif self._connecting:
+                    wait = self._connect_started_at + CONNECT_TIMEOUT_S - now
+                    if wait <= 0:
+                        self._logger.error(
+                            "MQTT connection to %s:%d timed out",
+                            self._broker_host,
+                            self._broker_port,
+                        )
+                        self._connecting = False
+                        self._schedule_retry()
+                        continue
+                elif now >= self._next_attempt_at:
+                    attempt = True
+                else:
+                    wait = self._next_attempt_at - now
+
+            if attempt:
+                self._connect_once()
+            else:
+                self._wake.wait(wait)
+
+    def _schedule_retry(self) -> None:
+        """Count a failed attempt and set the next deadline (lock must be held)."""
+        self._connect_failures += 1
+        delay = self._backoff.next_delay()
+        self._next_attempt_at = time.monotonic() + delay
+        self._logger.debug("MQTT reconnect attempt in %.1fs", delay)
+        self._wake.set()
+
+    def _connect_once(self) -> None:
+        """Make one connection attempt (connection manager thread).
+
+        Replaces any previous client. The attempt completes in
+        :meth:`_on_connect`; a failure schedules the next attempt.
+        """
         try:
             if mqtt is None:
                 self._warn_mqtt_unavailable()
                 with self._lock:
                     self._connecting = False
+                    self._schedule_retry()
                 return
 
-            now = time.time()
             with self._lock:
-                if (now - self._last_connect_attempt) < self._connect_retry_interval:
-                    self._connecting = False
-                    return
-                self._last_connect_attempt = now
+                old_client = self._client
+                self._client = None
+                self._connecting = True
+                self._connect_started_at = time.monotonic()
+                self._connect_attempts += 1
+            if old_client is not None:
+                self._stop_client(old_client)
 
             with self._lock:
-                if self._client is not None:
-                    try:
-                        self._client.disconnect()
-                    except (AttributeError, OSError, RuntimeError, ValueError) as e:
-                        # Ignore disconnect errors during reconnect, but log for diagnostics.
-                        self._logger.debug(
-                            "Error while disconnecting existing MQTT client: %s", str(e)
-                        )
-                    self._client = None
-
                 # Create MQTT client with version-specific API
-                client_id = f"{self._identifier}_{int(now)}"
+                client_id = f"{self._identifier}_{int(time.time())}"
                 client = self._create_new_client(client_id)
                 client.on_connect = self._on_connect
                 client.on_disconnect = self._on_disconnect
@@ -229,12 +430,6 @@ class MQTTClientWrapper:
                 broker_host = self._broker_host
                 broker_port = self._broker_port
 
-            if client is None:
-                with self._lock:
-                    self._connecting = False
-                    self._connected = False
-                return
-
             self._logger.info("MQTT connecting to %s:%d", broker_host, broker_port)
             client.connect(broker_host, broker_port, keepalive=60)
             client.loop_start()
@@ -259,6 +454,20 @@ class MQTTClientWrapper:
                             str(loop_error),
                         )
                     self._client = None
+                self._schedule_retry()
+
+    def _stop_client(self, client: Any) -> None:
+        """Stop a client's network loop and disconnect it (lock must NOT be held).
+
+        ``loop_stop`` joins paho's network thread, whose callbacks take
+        ``self._lock``.
+        """
+        try:
+            client.loop_stop()
+            client.disconnect()
+        except (AttributeError, OSError, RuntimeError, ValueError) as e:
+            # Do not raise during shutdown or reconnect; log for diagnostics.
+            self._logger.debug("Error while disconnecting MQTT client: %s", str(e))
 
     def _create_new_client(self, client_id: str) -> Any:
         """Create a paho-mqtt Client.
@@ -267,6 +476,10 @@ class MQTTClientWrapper:
         constructor when the v2 API is unavailable, matching the declared
         ``paho-mqtt>=2.0.0,<3.0.0`` dependency range.
 
+        paho's own reconnect loop is disabled (``reconnect_on_failure``):
+        reconnecting is left to the connection manager and its jittered
+        backoff.
+
         Args:
             client_id: Client identifier string
 
@@ -286,7 +499,11 @@ class MQTTClientWrapper:
 
         if version2 is not None:
             try:
-                client = mqtt.Client(callback_api_version=version2, client_id=client_id)
+                client = mqtt.Client(
+                    callback_api_version=version2,
+                    client_id=client_id,
+                    reconnect_on_failure=False,
+                )
                 self._callback_api_v2 = True
                 return client
             except (TypeError, ValueError) as e:
@@ -297,7 +514,7 @@ class MQTTClientWrapper:
                 )
 
         self._callback_api_v2 = False
-        return mqtt.Client(client_id=client_id)
+        return mqtt.Client(client_id=client_id, reconnect_on_failure=False)
 
     def _configure_client_credentials(self, client: Any) -> None:
         """Configure authentication and TLS on a paho-mqtt Client.
@@ -344,17 +561,26 @@ class MQTTClientWrapper:
         reason_code = args[0] if args else 0
         failed = self._reason_is_failure(reason_code)
         with self._lock:
+            if _client is not None and _client is not self._client:
+                return  # late callback from a replaced client
             self._connecting = False
             if not failed:
                 self._connected = True
+                if self._ever_connected:
+                    self._reconnects += 1
+                self._ever_connected = True
+                self._backoff.reset()
                 self._logger.info(
                     "MQTT connected to %s:%d", self._broker_host, self._broker_port
                 )
+                self._flush_offline()
             else:
                 self._connected = False
                 self._logger.error(
                     "MQTT connection failed with code %s", str(reason_code)
                 )
+                if self._enabled:
+                    self._schedule_retry()
 
     def _on_disconnect(self, _client: Any, _userdata: Any, *args: Any) -> None:
         """Callback when MQTT connection is lost.
@@ -377,31 +603,83 @@ class MQTTClientWrapper:
             reason_code = args[1]
         failed = self._reason_is_failure(reason_code)
         with self._lock:
+            if _client is not None and _client is not self._client:
+                return  # late callback from a replaced client
+            if self._connected:
+                self._disconnects += 1
             self._connected = False
             self._connecting = False
             if failed:
                 self._logger.info(
                     "MQTT disconnected (code %s), will retry", str(reason_code)
                 )
+            # Reconnecting is the connection manager's job, not paho's.
+            if self._enabled:
+                self._schedule_retry()
 
-    def _disconnect_internal(self) -> None:
-        """Disconnect MQTT client (internal, lock must be held)."""
-        if self._client is not None:
-            try:
-                self._client.loop_stop()
-                self._client.disconnect()
-            except (AttributeError, OSError, RuntimeError, ValueError) as e:
-                # Do not raise during shutdown; log for diagnostics instead.
-                self._logger.debug("Error while disconnecting MQTT client: %s", str(e))
-            self._client = None
+    def _disconnect_internal(self) -> Optional[Any]:
+        """Stop the connection manager and detach the client (lock must be held).
+
+        Messages buffered for a later reconnect are discarded.
+
+        Returns:
+            The detached client, which the caller passes to
+            :meth:`_stop_client` after releasing the lock, or None.
+        """
+        client = self._client
+        self._client = None
         self._connected = False
         self._connecting = False
+        self._manager_stopping = True
+        self._wake.set()
+        self._offline.discard()
+        return client
 
     def disconnect(self) -> None:
-        """Disconnect MQTT client gracefully."""
+        """Disconnect MQTT client gracefully.
+
+        Queued messages get a short chance to go out first.
+        """
+        self._queue.flush(timeout=1.0)
+        self._queue.stop()
         with self._lock:
-            self._disconnect_internal()
+            client = self._disconnect_internal()
+            manager = self._manager_thread
+        if client is not None:
+            self._stop_client(client)
+        if manager is not None and manager is not threading.current_thread():
+            manager.join(2.0)
+
+    def get_metrics(self) -> dict:
+        """Return latency histogram snapshots for the wrapper's hot paths."""
+        return self._metrics.snapshot()
+
+    def get_queue_stats(self) -> dict:
+        """Return the outbound queue counters."""
+        return self._queue.stats()
+
+    def get_connection_stats(self) -> dict:
+        """Return reconnect counters and the offline buffer occupancy."""
+        with self._lock:
+            retry_in = None
+            if (
+                self._manager_thread is not None
+                and not self._connected
+                and not self._connecting
+            ):
+                retry_in = max(0.0, self._next_attempt_at - time.monotonic())
+            return {
+                "connected": self._connected,
+                "connect_attempts": self._connect_attempts,
+                "connect_failures": self._connect_failures,
+                "reconnects": self._reconnects,
+                "disconnects": self._disconnects,
+                "backoff_failures": self._backoff.failures,
+                "next_attempt_in_s": retry_in,
+                "offline_buffer": self._offline.stats(),
+            }
 
+    @timed("mqtt.publish_eta_update")
     def publish_eta_update(
         self,
         heater: str,
@@ -421,73 +699,289 @@ class MQTTClientWrapper:
             actual: Actual temperature
             cooldown_target: Cooldown target temperature (if applicable)
         """
+        self.publish_eta_batch(
+            {
+                heater: {
+                    "eta": eta,
+                    "eta_kind": eta_kind,
+                    "target": target,
+                    "actual": actual,
+                    "cooldown_target": cooldown_target,
+                }
+            }
+        )
+
+    @timed("mqtt.publish_eta_batch")
+    def publish_eta_batch(self, entries: Mapping[str, Mapping[str, Any]]) -> None:
+        """Publish the ETA updates of one tick.
+
+        Each heater is throttled by its own publish interval, so heaters
+        reported in the same tick never starve each other. Depending on the
+        topic mode, the documents go to ``<base>/<heater>/eta``, to one
+        combined ``<base>/all/eta`` message (throttled separately) or both.
+        State transitions are published as ``<base>/<heater>/state_change``
+        events on every call.
+
+        With a deadband configured, a document is only published when it
+        differs significantly from the last published one (see
+        :meth:`_is_significant`) or the heartbeat interval elapsed. A state
+        transition publishes the heater's document immediately, bypassing
+        the throttle.
+
+        Args:
+            entries: Heater name to a mapping with ``eta``, ``eta_kind``,
+                ``target``, ``actual`` and ``cooldown_target``; other keys
+                are ignored.
+        """
         with self._lock:
-            if not self._enabled or not self._connected:
+            # While the broker is unreachable the documents go to the offline
+            # buffer (see _enqueue), so keep building them.
+            if not self._enabled or (not self._connected and not self._broker_host):
                 return
 
-            # Check if we should publish based on interval
             now = time.time()
-            if (now - self._last_published_time) < self._publish_interval:
-                return
+            interval = self._publish_interval
+            per_heater = self._topic_mode != "combined"
+            documents = {}
+            any_state_changed = False
+            for heater, entry in entries.items():
+                payload, event_payload = self._heater_documents(heater, entry, now)
+                documents[heater] = payload
+                state_changed = event_payload is not None
+                any_state_changed = any_state_changed or state_changed
+                if per_heater and self._publish_due(
+                    self._last_published_doc,
+                    {heater: payload},
+                    self._last_published_by_heater.get(heater, 0.0),
+                    now,
+                    state_changed,
+                ):
+                    self._last_published_by_heater[heater] = now
+                    self._last_published_doc[heater] = payload
+                    self._enqueue(self._topics_for(heater)[0], payload)
+                if event_payload is not None:
+                    # Transitions are events: never coalesce them away.
+                    self._enqueue(
+                        self._topics_for(heater)[1], event_payload, coalesce=False
+                    )
+
+            if self._topic_mode != "per_heater" and documents:
+                if self._publish_due(
+                    self._last_combined_docs,
+                    documents,
+                    self._last_combined_time,
+                    now,
+                    any_state_changed,
+                ):
+                    self._last_combined_time = now
+                    self._last_combined_docs.update(documents)
+                    self._enqueue(
+                        self._topics_for(None)[0],
+                        {"timestamp": now, "heaters": documents},
+                    )
+
+    def _topics_for(self, heater: Optional[str]) -> tuple[str, str]:
+        """Return the ETA and state change topics of *heater* (lock must be held).
+
+        ``None`` selects the combined topic (``<base>/all/eta``). Topics are
+        built once per heater and base topic instead of on every publish.
+        """
+        table = self._topic_table
+        if self._topic_table_base != self._base_topic:
+            table = self._topic_table = {}
+            self._topic_table_base = self._base_topic
+        topics = table.get(heater)
+        if topics is None:
+            prefix = f"{self._base_topic}/{'all' if heater is None else heater}"
+            topics = table[heater] = (f"{prefix}/eta", f"{prefix}/state_change")
+        return topics
+
+    def _publish_due(
+        self,
+        last_documents: Mapping[str, Mapping[str, Any]],
+        documents: Mapping[str, Mapping[str, Any]],
+        last_time: float,
+        now: float,
+        state_changed: bool,
+    ) -> bool:
+        """Decide whether *documents* go out (internal, lock must be held).
+
+        Args:
+            last_documents: Heater name to the last published document
+            documents: Heater name to the new document
+            last_time: When this topic was last published
+            now: Timestamp of this update
+            state_changed: A heater in *documents* changed its state
+        """
+        if state_changed:
+            return True
+        if (now - last_time) < self._publish_interval:
+            return False
+        if self._eta_deadband_s <= 0 and self._actual_deadband_c <= 0:
+            return True
+        if 0 < self._heartbeat_interval <= (now - last_time):
+            return True
+        return any(
+            self._is_significant(last_documents.get(heater), payload)
+            for heater, payload in documents.items()
+        )
+
+    def _is_significant(
+        self, previous: Optional[Mapping[str, Any]], payload: Mapping[str, Any]
+    ) -> bool:
+        """Return whether *payload* differs meaningfully from *previous*.
+
+        The ETA and the actual temperature count as changed once they moved
+        by more than their deadband. Only called with at least one deadband
+        set; a field whose deadband is 0 is then left out, so e.g. an ETA
+        deadband alone is not defeated by sensor noise on the actual
+        temperature. Every other field, and an ETA or temperature appearing
+        or disappearing, counts on any change.
+        """
+        if previous is None:
+            return True
+        for key in ("eta_kind", "target", "cooldown_target", "state"):
+            if previous.get(key) != payload.get(key):
+                return True
+        for key, deadband in (
+            ("eta_seconds", self._eta_deadband_s),
+            ("actual", self._actual_deadband_c),
+        ):
+            old = previous.get(key)
+            new = payload.get(key)
+            if old is None or new is None:
+                if old is not new:
+                    return True
+            elif deadband > 0 and abs(new - old) > deadband:
+                return True
+        return False
+
+    def _heater_documents(
+        self, heater: str, entry: Mapping[str, Any], now: float
+    ) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
+        """Build a heater's ETA document and track its state.
+
+        Internal, lock must be held.
 
-            self._last_published_time = now
-
-            # Determine state for transition detection
-            current_state = None
-            if eta_kind == "heating" and eta is not None:
-                current_state = "heating"
-            elif eta_kind == "cooling" and eta is not None:
-                current_state = "cooling"
-            elif target is not None and actual is not None:
-                if abs(target - actual) <= 1.0:
-                    current_state = "at_target"
-                elif cooldown_target is not None and actual is not None:
-                    if abs(cooldown_target - actual) <= 1.0:
-                        current_state = "cooled_down"
-
-            # Detect state transitions
-            last_state = self._last_heater_state.get(heater)
-            state_changed = last_state != current_state
-            self._last_heater_state[heater] = current_state
-
-            # Build payload
-            payload = {
+        Args:
+            heater: Heater name
+            entry: ETA entry (see :meth:`publish_eta_batch`)
+            now: Timestamp of this update
+
+        Returns:
+            tuple: Payload for the heater's ETA topic, and the state
+            transition event payload (None if the state did not change)
+        """
+        eta = entry.get("eta")
+        eta_kind = entry.get("eta_kind")
+        target = entry.get("target")
+        actual = entry.get("actual")
+        cooldown_target = entry.get("cooldown_target")
+
+        # Determine state for transition detection
+        current_state = None
+        if eta_kind == "heating" and eta is not None:
+            current_state = "heating"
+        elif eta_kind == "cooling" and eta is not None:
+            current_state = "cooling"
+        elif target is not None and actual is not None:
+            if abs(target - actual) <= 1.0:
+                current_state = "at_target"
+            elif cooldown_target is not None and actual is not None:
+                if abs(cooldown_target - actual) <= 1.0:
+                    current_state = "cooled_down"
+
+        # Detect state transitions
+        last_state = self._last_heater_state.get(heater)
+        state_changed = last_state != current_state
+        self._last_heater_state[heater] = current_state
+
+        # State transition event if state changed
+        event_payload = None
+        if state_changed and current_state is not None:
+            event_payload = {
                 "heater": heater,
-                "eta_seconds": eta,
-                "eta_kind": eta_kind,
-                "target": target,
-                "actual": actual,
-                "cooldown_target": cooldown_target,
-                "timestamp": now,
                 "state": current_state,
+                "previous_state": last_state,
+                "timestamp": now,
+                "actual": actual,
+                "target": target,
             }
+            self._logger.info(
+                "MQTT: %s state changed from %s to %s",
+                heater,
+                last_state or "unknown",
+                current_state,
+            )
 
-            # Publish ETA data
-            topic = f"{self._base_topic}/{heater}/eta"
+        payload = {
+            "heater": heater,
+            "eta_seconds": eta,
+            "eta_kind": eta_kind,
+            "target": target,
+            "actual": actual,
+            "cooldown_target": cooldown_target,
+            "timestamp": now,
+            "state": current_state,
+        }
+        return payload, event_payload
+
+    def _enqueue(
+        self, topic: str, payload: dict[str, Any], coalesce: bool = True
+    ) -> None:
+        """Queue a message for the publisher thread (internal, lock must be held).
+
+        Publishes inline when the publisher thread is not running, and keeps
+        the message in the offline buffer while the broker is unreachable.
+
+        Args:
+            topic: MQTT topic
+            payload: Message payload dictionary
+            coalesce: Let a newer message for the same topic replace this one
+                while it is still queued
+        """
+        if not self._connected:
+            self._offline.add(topic, payload, coalesce=coalesce)
+        elif not self._queue.put(topic, payload, coalesce=coalesce):
             self._publish_message(topic, payload)
 
-            # Publish state transition event if state changed
-            if state_changed and current_state is not None:
-                event_payload = {
-                    "heater": heater,
-                    "state": current_state,
-                    "previous_state": last_state,
-                    "timestamp": now,
-                    "actual": actual,
-                    "target": target,
-                }
-                event_topic = f"{self._base_topic}/{heater}/state_change"
-                self._publish_message(event_topic, event_payload)
+    def _flush_offline(self) -> None:
+        """Re-submit buffered messages after a reconnect (lock must be held)."""
+        for topic, payload in self._offline.drain():
+            self._enqueue(topic, payload, coalesce=not _is_event_topic(topic))
+
+    @timed("mqtt.send")
+    def _send_queued(self, topic: str, payload: dict[str, Any]) -> None:
+        """Publish one queued message (publisher thread).
+
+        Only the client and publish options are read under ``self._lock``;
+        encoding and ``client.publish`` run outside it, so a slow broker does
+        not stall :meth:`publish_eta_batch`. A message dequeued after the
+        connection dropped, or that failed because the client was replaced or
+        disconnected while it was being sent, goes back through
+        :meth:`_enqueue` instead of being lost.
+        """
+        coalesce = not _is_event_topic(topic)
+        with self._lock:
+            client = self._client
+            if client is None or not self._connected:
+                if self._enabled:
+                    self._offline.add(topic, payload, coalesce=coalesce)
+                return
+            qos = self._qos
+            retain = self._retain
 
-                self._logger.info(
-                    "MQTT: %s state changed from %s to %s",
-                    heater,
-                    last_state or "unknown",
-                    current_state,
-                )
+        if self._deliver(client, topic, payload, qos, retain):
+            return
+
+        with self._lock:
+            if self._enabled and (self._client is not client or not self._connected):
+                self._enqueue(topic, payload, coalesce=coalesce)
 
     def _publish_message(self, topic: str, payload: dict[str, Any]) -> None:
-        """Publish a message to MQTT broker (internal, lock must be held).
+        """Publish a message inline (internal, lock must be held).
+
+        Used while the publisher thread is not running.
 
         Args:
             topic: MQTT topic
@@ -495,12 +989,26 @@ class MQTTClientWrapper:
         """
         if self._client is None or not self._connected:
             return
+        self._deliver(self._client, topic, payload, self._qos, self._retain)
+
+    def _deliver(
+        self, client: Any, topic: str, payload: dict[str, Any], qos: int, retain: bool
+    ) -> bool:
+        """Encode and publish a message with *client*.
 
+        Args:
+            client: paho client captured by the caller
+            topic: MQTT topic
+            payload: Message payload dictionary
+            qos: MQTT QoS level
+            retain: MQTT retain flag
+
+        Returns:
+            bool: True if paho accepted the message
+        """
         try:
-            json_payload = json.dumps(payload, ensure_ascii=False)
-            result = self._client.publish(
-                topic, json_payload, qos=self._qos, retain=self._retain
-            )
+            json_payload = self._encoder.encode(payload)
+            result = client.publish(topic, json_payload, qos=qos, retain=retain)
 
             # paho-mqtt 1.x: result.rc is an int (0 == success).
             # paho-mqtt 2.x: result.rc is a ReasonCode; _reason_is_failure
@@ -509,8 +1017,11 @@ class MQTTClientWrapper:
                 self._logger.debug(
                     "MQTT publish failed: topic=%s rc=%s", topic, str(result.rc)
                 )
+                return False
         except (AttributeError, OSError, RuntimeError, TypeError, ValueError) as e:
             self._logger.debug("MQTT publish error: %s", str(e))
+            return False
+        return True
 
     def is_connected(self) -> bool:
         """Check if MQTT client is connected.
@@ -0,0 +1,152 @@
+"""JSON encoding of MQTT payloads.
+
+Every MQTT message is encoded on the publisher thread. Three encoders produce
+equivalent JSON (only insignificant whitespace differs):
+
+* ``"orjson"``: the optional `orjson <https://github.com/ijl/orjson>`_
+  package, used for every payload when it is installed
+  (``pip install "octoprint-temp-eta[orjson]"``).
+* ``"template"``: fills the fixed-schema per-heater ETA document into a
+  precomputed template and falls back to :func:`json.dumps` for other
+  payloads. The default without orjson.
+* ``"json"``: :func:`json.dumps` with ``ensure_ascii=False`` for everything,
+  the encoder used before the others existed.
+
+Non-finite floats are encoded as ``null`` by ``orjson`` and ``template``.
+"""
+
+import json
+import math
+from typing import Any, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
+# Keys of the per-heater ETA document, in the order the MQTT wrapper builds
+# it (see MQTTClientWrapper._heater_documents).
+ETA_DOCUMENT_KEYS = (
+    "heater",
+    "eta_seconds",
+    "eta_kind",
+    "target",
+    "actual",
+    "cooldown_target",
+    "timestamp",
+    "state",
+)
+
+# Everything after the heater name; %s slots take pre-encoded JSON values.
+_ETA_TEMPLATE = "".join(
+    f',"{key}":%s' for key in ETA_DOCUMENT_KEYS[1:]
+) + "}"
+
+
+def available_encoders() -> tuple:
+    """Return the names of the payload encoders usable in this environment."""
+    if orjson is not None:
+        return ("orjson", "template", "json")
+    return ("template", "json")
+
+
+def _json_dumps(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _json_number(value: Any) -> str:
+    """Encode a number or None as a JSON literal.
+
+    Raises:
+        TypeError: If *value* is neither None nor a number
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, float):
+        # float.__repr__ also covers subclasses such as numpy.float64, whose
+        # own repr is not valid JSON.
+        return float.__repr__(value) if math.isfinite(value) else "null"
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int.__repr__(value)
+    raise TypeError(f"not a JSON number: {value!r}")
+
+
+class PayloadEncoder:
+    """Encode MQTT payloads to UTF-8 JSON with the selected encoder.
+
+    Not thread-safe; the MQTT wrapper only encodes on its publisher thread
+    (or inline while that thread is not running).
+
+    Attributes:
+        name (str): The encoder in use (see :func:`available_encoders`).
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Create an encoder.
+
+        Args:
+            name: ``"orjson"``, ``"template"`` or ``"json"``; defaults to the
+                fastest available one.
+
+        Raises:
+            ValueError: If the encoder is unknown or orjson is not installed
+        """
+        if name is None:
+            name = available_encoders()[0]
+        if name not in available_encoders():
+            raise ValueError(f"MQTT payload encoder not available: {name}")
+        self.name = name
+        # Encoded '{"heater":"<name>"' per heater, and encoded string values
+        # (eta_kind and state only take a handful of values).
+        self._prefixes: dict[str, str] = {}
+        self._strings: dict[Optional[str], str] = {None: "null"}
+
+    def encode(self, payload: Mapping[str, Any]) -> bytes:
+        """Encode *payload* as UTF-8 JSON.
+
+        Raises:
+            TypeError: If the payload is not JSON serializable
+            ValueError: If the payload contains a circular reference
+        """
+        if self.name == "orjson":
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        if self.name == "template" and len(payload) == len(ETA_DOCUMENT_KEYS):
+            encoded = self._encode_eta_document(payload)
+            if encoded is not None:
+                return encoded
+        return _json_dumps(payload)
+
+    def _encode_eta_document(self, payload: Mapping[str, Any]) -> Optional[bytes]:
+        """Fill an ETA document into the template.
+
+        Returns:
+            The encoded document, or None if *payload* does not match the
+            ETA document schema.
+        """
+        try:
+            heater = payload["heater"]
+            prefix = self._prefixes.get(heater)
+            if prefix is None:
+                prefix = '{"heater":' + self._string(heater)
+                self._prefixes[heater] = prefix
+            values = (
+                _json_number(payload["eta_seconds"]),
+                self._string(payload["eta_kind"]),
+                _json_number(payload["target"]),
+                _json_number(payload["actual"]),
+                _json_number(payload["cooldown_target"]),
+                _json_number(payload["timestamp"]),
+                self._string(payload["state"]),
+            )
+        except (KeyError, TypeError):
+            return None
+        return (prefix + _ETA_TEMPLATE % values).encode("utf-8")
+
+    def _string(self, value: Any) -> str:
+        encoded = self._strings.get(value)
+        if encoded is None:
+            if not isinstance(value, str):
+                raise TypeError(f"not a string: {value!r}")
+            encoded = json.dumps(value, ensure_ascii=False)
+            self._strings[value] = encoded
+        return encoded
@@ -0,0 +1,262 @@
+"""Outbound MQTT message queue.
+
+Publishing used to build, encode and hand every message to paho on the
+thread that produced it, while holding the MQTT wrapper lock. A
+:class:`PublishQueue` moves that work to a dedicated publisher thread: the
+producer only inserts the message into a dict, whatever the broker latency or
+the state of paho's own queue.
+
+Messages are keyed by topic. A message for a topic that is still queued
+replaces the queued payload in place (latest wins), so a slow broker never
+makes the queue hold more than one pending document per topic. Messages that
+must not coalesce, such as state transition events, are queued without a
+key.
+
+The queue is bounded. When it is full, a new message evicts the oldest queued
+message ("drop oldest"); newer ETA documents supersede older ones anyway.
+
+The storage itself is a :class:`MessageBuffer`, which the MQTT wrapper also
+uses to hold messages while the broker is unreachable.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Default bound: one ETA topic per heater plus state events leaves plenty of
+# room; anything beyond this means the broker is not keeping up.
+DEFAULT_MAXSIZE = 256
+
+
+class MessageBuffer:
+    """Bounded, topic-coalescing message store (not thread-safe).
+
+    Attributes:
+        coalesced (int): Messages that replaced a stored one for the same key.
+        dropped (int): Messages evicted from a full buffer or discarded by
+            :meth:`discard`.
+        max_depth (int): Largest number of stored messages observed.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Create an empty buffer.
+
+        Args:
+            maxsize (int): Maximum number of stored messages.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = int(maxsize)
+        self._messages: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._unkeyed = itertools.count()
+
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def add(self, topic: str, payload: Any, coalesce: bool = True) -> None:
+        """Store *payload* for *topic*, evicting the oldest message if full.
+
+        Args:
+            topic (str): MQTT topic.
+            payload: Message stored unchanged.
+            coalesce (bool): Replace a stored message for the same topic
+                instead of storing another one.
+        """
+        key: Hashable = topic if coalesce else ("unkeyed", next(self._unkeyed))
+        if key in self._messages:
+            self._messages[key] = (topic, payload)
+            self.coalesced += 1
+            return
+        if len(self._messages) >= self._maxsize:
+            self._messages.popitem(last=False)
+            self.dropped += 1
+        self._messages[key] = (topic, payload)
+        depth = len(self._messages)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def drain(self) -> "list[tuple]":
+        """Remove and return all stored ``(topic, payload)`` pairs in order."""
+        messages = list(self._messages.values())
+        self._messages.clear()
+        return messages
+
+    def discard(self) -> None:
+        """Drop all stored messages, counting them as dropped."""
+        self.dropped += len(self._messages)
+        self._messages.clear()
+
+    def stats(self) -> dict:
+        """Return a snapshot of the buffer counters."""
+        return {
+            "depth": len(self._messages),
+            "max_depth": self.max_depth,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
+
+
+class PublishQueue:
+    """Bounded, topic-coalescing queue drained by one publisher thread.
+
+    Attributes:
+        submitted (int): Messages accepted by :meth:`put`.
+        published (int): Messages passed to the sender.
+        failed (int): Messages whose sender call raised.
+    """
+
+    def __init__(
+        self,
+        sender: Callable[[str, Any], None],
+        logger: Optional[Any] = None,
+        name: str = "temp_eta-mqtt",
+        maxsize: int = DEFAULT_MAXSIZE,
+    ) -> None:
+        """Create a stopped queue.
+
+        Args:
+            sender: Called with ``(topic, payload)`` for each message on the
+                publisher thread.
+            logger: Optional logger for sender failures.
+            name (str): Thread name.
+            maxsize (int): Maximum number of queued messages.
+        """
+        self._sender = sender
+        self._logger = logger
+        self._name = name
+        self._pending = MessageBuffer(maxsize)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._busy = False
+
+        self.submitted = 0
+        self.published = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the publisher thread is alive and accepting messages."""
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stopping
+
+    def start(self) -> None:
+        """Start the publisher thread (no-op if already running)."""
+        with self._cond:
+            if self.running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the publisher thread, discarding queued messages.
+
+        Args:
+            timeout (float): Seconds to wait for in-flight messages.
+        """
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            self._pending.discard()
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._cond:
+            if self._thread is thread:
+                self._thread = None
+
+    def put(self, topic: str, payload: Any, coalesce: bool = True) -> bool:
+        """Queue *payload* for *topic*.
+
+        Args:
+            topic (str): MQTT topic.
+            payload: Message passed to the sender unchanged.
+            coalesce (bool): Replace a queued message for the same topic
+                instead of queueing another one.
+
+        Returns:
+            bool: False if the publisher thread is not running (the caller
+            should then publish the message itself).
+        """
+        with self._cond:
+            if not self.running:
+                return False
+            self.submitted += 1
+            self._pending.add(topic, payload, coalesce=coalesce)
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until every queued message was passed to the sender.
+
+        Args:
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the queue drained within *timeout*.
+        """
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stats(self) -> dict:
+        """Return a snapshot of the queue counters."""
+        with self._cond:
+            pending = self._pending
+            return {
+                "running": self.running,
+                "queue_depth": len(pending),
+                "max_queue_depth": pending.max_depth,
+                "submitted": self.submitted,
+                "coalesced": pending.coalesced,
+                "dropped": pending.dropped,
+                "published": self.published,
+                "failed": self.failed,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                # Take everything queued so far and send it as one batch.
+                batch = self._pending.drain()
+                self._busy = True
+
+            failed = 0
+            for topic, payload in batch:
+                try:
+                    self._sender(topic, payload)
+                except (
+                    AttributeError,
+                    KeyError,
+                    OSError,
+                    RuntimeError,
+                    TypeError,
+                    ValueError,
+                ) as e:
+                    failed += 1
+                    if self._logger is not None:
+                        self._logger.debug("MQTT queued publish failed: %s", str(e))
+
+            with self._cond:
+                self.published += len(batch)
+                self.failed += failed
+                self._busy = False
+                self._cond.notify_all()
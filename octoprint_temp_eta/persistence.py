@@ -0,0 +1,381 @@
+"""Binary append-only storage for persisted heater history.
+
+A history file is a small header followed by fixed-width records::
+
+    header:  magic "TETA" | version u16 | record size u16 | heater count u16
+             | heater names (u8 length + UTF-8 bytes each) | CRC32 u32
+    record:  ts f64 | actual f64 | target f64 | heater id u16 | 2 pad bytes
+             | CRC32 u32 of the preceding 28 bytes
+
+All integers and floats are little-endian; a heater id is the index of the
+heater's name in the header.
+
+The file works as a checkpoint plus a journal. A compaction ("checkpoint")
+rewrites it from a full history snapshot; afterwards each persist appends one
+journal entry holding only the rows newer than each heater's high-water mark,
+so a persist costs O(new samples) instead of re-encoding the whole history.
+Loading replays the checkpoint and all journal entries in file order.
+
+Records with a bad CRC and a torn record at the end of the file (e.g. after a
+power loss during an append) are skipped on read.
+
+Writes take a durability policy: ``"none"`` leaves flushing to the OS,
+``"file"`` fsyncs the written file and ``"file+dir"`` additionally fsyncs the
+directory after a checkpoint so the rename itself survives a power loss.
+"""
+
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+MAGIC = b"TETA"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHH")
+_NAME_LEN = struct.Struct("<B")
+_CRC = struct.Struct("<I")
+_RECORD_BODY = struct.Struct("<dddH2x")
+RECORD_SIZE = _RECORD_BODY.size + _CRC.size
+
+Row = Tuple[float, float, float]
+# (newest timestamp written, rows with exactly that timestamp written)
+Mark = Tuple[float, int]
+
+FSYNC_NONE = "none"
+FSYNC_FILE = "file"
+FSYNC_FILE_AND_DIR = "file+dir"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_FILE, FSYNC_FILE_AND_DIR)
+
+
+class HistoryFormatError(ValueError):
+    """Raised when a history file header is missing, corrupt or unsupported."""
+
+
+def encode_header(heaters: Sequence[str]) -> bytes:
+    """Return the encoded header for the given heater name table.
+
+    Args:
+        heaters: Heater names; a record's heater id indexes into this list.
+    """
+    if len(heaters) > 0xFFFF:
+        raise ValueError("too many heaters")
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_SIZE, len(heaters))]
+    for name in heaters:
+        raw = name.encode("utf-8")
+        if len(raw) > 0xFF:
+            raise ValueError(f"heater name too long: {name!r}")
+        parts.append(_NAME_LEN.pack(len(raw)))
+        parts.append(raw)
+    body = b"".join(parts)
+    return body + _CRC.pack(zlib.crc32(body))
+
+
+def decode_header(data: bytes) -> Tuple[List[str], int]:
+    """Parse a header from the start of *data*.
+
+    Returns:
+        Tuple of (heater names, offset of the first record)
+
+    Raises:
+        HistoryFormatError: If the header is truncated, corrupt or of an
+            unsupported version
+    """
+    if len(data) < _HEADER.size:
+        raise HistoryFormatError("truncated header")
+    magic, version, record_size, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise HistoryFormatError("not a history file")
+    if version != FORMAT_VERSION or record_size != RECORD_SIZE:
+        raise HistoryFormatError(f"unsupported history format version {version}")
+
+    offset = _HEADER.size
+    heaters = []
+    try:
+        for _ in range(count):
+            (length,) = _NAME_LEN.unpack_from(data, offset)
+            offset += _NAME_LEN.size
+            raw = data[offset : offset + length]
+            if len(raw) != length:
+                raise HistoryFormatError("truncated header")
+            heaters.append(raw.decode("utf-8"))
+            offset += length
+        (crc,) = _CRC.unpack_from(data, offset)
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise HistoryFormatError(f"corrupt header: {exc}") from exc
+    if crc != zlib.crc32(data[:offset]):
+        raise HistoryFormatError("header CRC mismatch")
+    return heaters, offset + _CRC.size
+
+
+def encode_records(samples: Dict[str, Iterable[Row]], heater_ids: Dict[str, int]) -> bytes:
+    """Encode rows of every heater as consecutive records.
+
+    Args:
+        samples: Heater name to (ts, actual, target) rows
+        heater_ids: Heater name to header index; must cover every heater
+            in *samples*
+    """
+    out = bytearray()
+    pack = _RECORD_BODY.pack
+    crc_pack = _CRC.pack
+    crc32 = zlib.crc32
+    for heater, rows in samples.items():
+        heater_id = heater_ids[heater]
+        for ts, actual, target in rows:
+            body = pack(ts, actual, target, heater_id)
+            out += body
+            out += crc_pack(crc32(body))
+    return bytes(out)
+
+
+def decode_records(
+    data: bytes, heaters: Sequence[str], offset: int
+) -> Dict[str, List[Row]]:
+    """Decode all valid records of *data* starting at *offset*.
+
+    Records failing their CRC or referring to an unknown heater are skipped,
+    as is a partial record at the end.
+    """
+    samples: Dict[str, List[Row]] = {}
+    unpack = _RECORD_BODY.unpack_from
+    crc_unpack = _CRC.unpack_from
+    crc32 = zlib.crc32
+    body_size = _RECORD_BODY.size
+    view = memoryview(data)
+    end = offset + (len(data) - offset) // RECORD_SIZE * RECORD_SIZE
+    for pos in range(offset, end, RECORD_SIZE):
+        (crc,) = crc_unpack(data, pos + body_size)
+        if crc != crc32(view[pos : pos + body_size]):
+            continue
+        ts, actual, target, heater_id = unpack(data, pos)
+        if heater_id >= len(heaters):
+            continue
+        samples.setdefault(heaters[heater_id], []).append((ts, actual, target))
+    return samples
+
+
+def read_history_file(path: Path) -> Dict[str, List[Row]]:
+    """Read all samples from a history file.
+
+    Raises:
+        OSError: If the file cannot be read
+        HistoryFormatError: If the header is invalid
+    """
+    return HistoryFile.open(path)[1]
+
+
+def tail_rows(rows: Sequence[Row], mark: Mark) -> List[Row]:
+    """Return the rows of *rows* not yet covered by the high-water *mark*.
+
+    *mark* is ``(ts, count)``: the newest timestamp written and how many rows
+    with exactly that timestamp were written. Rows with a newer timestamp are
+    new, and so are rows at the mark timestamp beyond the first *count*, since
+    a history may hold several rows with the same timestamp.
+
+    Rows are assumed to be in time order. Only the tail is visited, via
+    negative indexing, so this is O(new rows) for deques and
+    :class:`~octoprint_temp_eta.history.HeaterHistory` alike.
+    """
+    mark_ts, written = mark
+    size = len(rows)
+    newer = 0
+    while newer < size and rows[-1 - newer][0] > mark_ts:
+        newer += 1
+    at_mark = 0
+    while newer + at_mark < size and rows[-1 - newer - at_mark][0] == mark_ts:
+        at_mark += 1
+    count = newer + max(0, at_mark - written)
+    return [rows[i] for i in range(size - count, size)]
+
+
+def advance_mark(mark: Optional[Mark], rows: Sequence[Row]) -> Optional[Mark]:
+    """Return the high-water mark after writing *rows* (in time order).
+
+    Args:
+        mark: Mark before the write, or None for a fresh checkpoint.
+        rows: Rows written for the heater.
+    """
+    if not rows:
+        return mark
+    last_ts = rows[-1][0]
+    count = 0
+    while count < len(rows) and rows[-1 - count][0] == last_ts:
+        count += 1
+    if count == len(rows) and mark is not None and mark[0] == last_ts:
+        count += mark[1]
+    return (last_ts, count)
+
+
+class HistoryFile:
+    """Append state of one history file owned by this process.
+
+    Created by :meth:`compact`, which checkpoints the file from a full
+    snapshot, or by :meth:`open`, which resumes an existing file. Afterwards
+    :meth:`append` adds one journal entry with the rows above each heater's
+    high-water mark (see :func:`tail_rows`). Callers serialize access.
+
+    Attributes:
+        path (Path): File location.
+        heaters (list): Heater name table of the current header.
+        size (int): Current file size in bytes.
+        marks (dict): Heater name to its ``(ts, count)`` high-water mark:
+            the newest timestamp written and the number of rows written with
+            exactly that timestamp.
+        entries (int): Journal entries appended since the last checkpoint.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.heaters: List[str] = []
+        self.size = 0
+        self.marks: Dict[str, Mark] = {}
+        self.entries = 0
+
+    @classmethod
+    def open(cls, path: Path) -> Tuple["HistoryFile", Dict[str, List[Row]]]:
+        """Replay an existing file.
+
+        Returns:
+            Tuple of (append state positioned at the end of the file, samples)
+
+        Raises:
+            OSError: If the file cannot be read
+            HistoryFormatError: If the header is invalid
+        """
+        history_file = cls(path)
+        data = history_file.path.read_bytes()
+        heaters, offset = decode_header(data)
+        samples = decode_records(data, heaters, offset)
+        history_file.heaters = heaters
+        # A torn final record leaves the size off the record grid, which makes
+        # can_append() force a checkpoint instead of appending after it.
+        history_file.size = len(data)
+        marks = {}
+        for heater, rows in samples.items():
+            last_ts = max(row[0] for row in rows)
+            marks[heater] = (last_ts, sum(1 for row in rows if row[0] == last_ts))
+        history_file.marks = marks
+        return history_file, samples
+
+    @staticmethod
+    def encoded_size(heaters: Sequence[str], row_count: int) -> int:
+        """Return the file size for *row_count* rows of the given heaters."""
+        return len(encode_header(heaters)) + row_count * RECORD_SIZE
+
+    def new_rows(self, samples: Mapping[str, Sequence[Row]]) -> Dict[str, List[Row]]:
+        """Return the rows of *samples* not covered by each heater's mark.
+
+        Heaters without a mark contribute all their rows.
+        """
+        out = {}
+        marks = self.marks
+        for heater, rows in samples.items():
+            mark = marks.get(heater)
+            tail = list(rows) if mark is None else tail_rows(rows, mark)
+            if tail:
+                out[heater] = tail
+        return out
+
+    def can_append(self, rows: Mapping[str, Sequence[Row]]) -> bool:
+        """Whether *rows* can be appended without a checkpoint.
+
+        Requires every heater to be listed in the header and the file to end
+        on a record boundary.
+        """
+        if (self.size - len(encode_header(self.heaters))) % RECORD_SIZE:
+            return False
+        return all(heater in self.heaters for heater in rows)
+
+    def compact(self, samples: Dict[str, Sequence[Row]], fsync: str = FSYNC_NONE) -> int:
+        """Atomically rewrite the file with exactly *samples*.
+
+        Writes a temporary file next to the target and replaces it.
+
+        Args:
+            samples: Heater name to (ts, actual, target) rows
+            fsync (str): Durability policy, one of :data:`FSYNC_POLICIES`
+
+        Returns:
+            int: Number of bytes written
+        """
+        heaters = sorted(heater for heater, rows in samples.items() if rows)
+        ids = {heater: i for i, heater in enumerate(heaters)}
+        data = encode_header(heaters) + encode_records(
+            {heater: samples[heater] for heater in heaters}, ids
+        )
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+                if fsync != FSYNC_NONE:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            tmp_path.replace(self.path)
+            if fsync == FSYNC_FILE_AND_DIR:
+                _fsync_dir(self.path.parent)
+        finally:
+            # Best-effort cleanup if something went wrong before replace.
+            try:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ):
+                pass
+
+        self.heaters = heaters
+        self.size = len(data)
+        self.marks = {heater: advance_mark(None, samples[heater]) for heater in heaters}
+        self.entries = 0
+        return len(data)
+
+    def append(self, rows: Mapping[str, Sequence[Row]], fsync: str = FSYNC_NONE) -> int:
+        """Append *rows* (see :meth:`new_rows`) as one journal entry.
+
+        Args:
+            rows: Heater name to rows to append
+            fsync (str): Durability policy, one of :data:`FSYNC_POLICIES`.
+                Appends do not change the directory, so ``"file+dir"`` only
+                fsyncs the file.
+
+        Returns:
+            int: Number of bytes written
+        """
+        ids = {heater: i for i, heater in enumerate(self.heaters)}
+        data = encode_records(rows, ids)
+        if not data:
+            return 0
+        with open(self.path, "ab") as fh:
+            fh.write(data)
+            if fsync != FSYNC_NONE:
+                fh.flush()
+                os.fsync(fh.fileno())
+        self.size += len(data)
+        self.entries += 1
+        for heater, heater_rows in rows.items():
+            if heater_rows:
+                self.marks[heater] = advance_mark(self.marks.get(heater), heater_rows)
+        return len(data)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Best effort: directories cannot be opened or fsynced on every platform
+    # and file system (e.g. Windows), and the data itself is already synced.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
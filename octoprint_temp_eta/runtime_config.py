@@ -0,0 +1,123 @@
+"""Immutable snapshot of the settings read on the temperature hot path.
+
+OctoPrint's settings tree is a layered dict lookup with type conversion on
+every access. The temperature callback runs at ~2 Hz per printer and used to
+read a dozen settings per tick (plus a few more per heater). Instead, the
+plugin validates those settings once into a :class:`RuntimeConfig` when it
+starts and whenever settings are saved, and swaps the new object in with a
+single attribute assignment. Readers take one reference and get a consistent
+set of values, even while a save is rebuilding the next snapshot.
+"""
+
+from typing import Any, Optional
+
+
+class RuntimeConfig:
+    """Validated, read-only hot-path settings.
+
+    Defaults match the fallbacks the plugin uses when settings are missing.
+
+    Attributes:
+        enabled (bool): Plugin enabled.
+        suppress_while_printing (bool): Hide ETAs while a print job is active.
+        algorithm (str): Heating ETA algorithm, "linear" or "exponential".
+        threshold_start_c (float): Minimum distance to target to show an ETA.
+        update_interval_s (float): Minimum seconds between ETA broadcasts.
+        heating_enabled (bool): Heating ETA enabled.
+        cooldown_enabled (bool): Cooldown ETA enabled.
+        cooldown_mode (str): "threshold" or "ambient".
+        cooldown_hysteresis_c (float): Band above ambient in ambient mode.
+        cooldown_fit_window_s (float): Cooldown fit window in seconds.
+        cooldown_target_tool_c (float): Threshold-mode goal for tools, or None.
+        cooldown_target_bed_c (float): Threshold-mode goal for the bed, or None.
+        cooldown_target_chamber_c (float): Threshold-mode goal for the
+            chamber, or None.
+        cooldown_ambient_c (float): User-provided ambient temperature, or None
+            to estimate it from the cooldown history.
+    """
+
+    __slots__ = (
+        "enabled",
+        "suppress_while_printing",
+        "algorithm",
+        "threshold_start_c",
+        "update_interval_s",
+        "heating_enabled",
+        "cooldown_enabled",
+        "cooldown_mode",
+        "cooldown_hysteresis_c",
+        "cooldown_fit_window_s",
+        "cooldown_target_tool_c",
+        "cooldown_target_bed_c",
+        "cooldown_target_chamber_c",
+        "cooldown_ambient_c",
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        suppress_while_printing: bool = True,
+        algorithm: str = "linear",
+        threshold_start_c: float = 5.0,
+        update_interval_s: float = 1.0,
+        heating_enabled: bool = True,
+        cooldown_enabled: bool = False,
+        cooldown_mode: str = "threshold",
+        cooldown_hysteresis_c: float = 1.0,
+        cooldown_fit_window_s: float = 120.0,
+        cooldown_target_tool_c: Optional[float] = None,
+        cooldown_target_bed_c: Optional[float] = None,
+        cooldown_target_chamber_c: Optional[float] = None,
+        cooldown_ambient_c: Optional[float] = None,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "enabled", bool(enabled))
+        init(self, "suppress_while_printing", bool(suppress_while_printing))
+        init(self, "algorithm", "exponential" if algorithm == "exponential" else "linear")
+        init(self, "threshold_start_c", float(threshold_start_c))
+        init(self, "update_interval_s", float(update_interval_s))
+        init(self, "heating_enabled", bool(heating_enabled))
+        init(self, "cooldown_enabled", bool(cooldown_enabled))
+        init(self, "cooldown_mode", "ambient" if cooldown_mode == "ambient" else "threshold")
+        init(self, "cooldown_hysteresis_c", float(cooldown_hysteresis_c))
+        init(self, "cooldown_fit_window_s", float(cooldown_fit_window_s))
+        init(self, "cooldown_target_tool_c", _optional_float(cooldown_target_tool_c))
+        init(self, "cooldown_target_bed_c", _optional_float(cooldown_target_bed_c))
+        init(
+            self, "cooldown_target_chamber_c", _optional_float(cooldown_target_chamber_c)
+        )
+        init(self, "cooldown_ambient_c", _optional_float(cooldown_ambient_c))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("RuntimeConfig is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("RuntimeConfig is immutable")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"RuntimeConfig({fields})"
+
+    def replace(self, **changes: Any) -> "RuntimeConfig":
+        """Return a copy with the given fields changed."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        unknown = set(changes) - set(values)
+        if unknown:
+            raise TypeError(f"unknown RuntimeConfig fields: {sorted(unknown)}")
+        values.update(changes)
+        return RuntimeConfig(**values)
+
+    def cooldown_target_c(self, heater_name: str) -> Optional[float]:
+        """Return the threshold-mode cooldown goal for a heater, or None."""
+        if heater_name == "bed":
+            return self.cooldown_target_bed_c
+        if heater_name == "chamber":
+            return self.cooldown_target_chamber_c
+        if isinstance(heater_name, str) and heater_name.startswith("tool"):
+            return self.cooldown_target_tool_c
+        return None
+
+
+def _optional_float(value: Optional[float]) -> Optional[float]:
+    return None if value is None else float(value)
@@ -680,6 +680,9 @@ $(() => {
 		// Maps heater name to {eta, actual, target} observables
 		self.heaters = ko.observableArray([]);
 		self.heaterData = {}; // Maps heater name to {eta, actual, target}
+		self._countdownFrame = null; // Pending ETA countdown animation frame
+		// performance.now() minus server time in ms, set on each keyframe.
+		self._serverClockOffsetMs = null;
 
 		self._isFrontendDebugEnabled = () => {
 			var ps = self._pluginSettings();
@@ -1589,10 +1592,14 @@ $(() => {
 
 			var hist = heaterObj._history || [];
 			var histStart = heaterObj._historyStart || 0;
+			if (hist.length <= histStart) {
+				return;
+			}
 
 			// Only plot points inside the configured time window.
 			var windowSec = self.getHistoricalGraphWindowSeconds();
-			var nowSec = hist[hist.length - 1].t;
+			var last = hist[hist.length - 1];
+			var nowSec = Math.max(last.t, nowMs / 1000.0);
 			var minT = nowSec - windowSec;
 
 			var actualSeries = [];
@@ -1615,6 +1622,19 @@ $(() => {
 				}
 			}
 
+			// Carry the last values forward to now: the server only sends a
+			// heater's temperature while something changed, so an idle heater
+			// would otherwise end at its last update.
+			if (nowSec - last.t >= 1 && actualSeries.length > 0) {
+				var lastActual = self._displayTemp(last.a);
+				if (lastActual !== null) {
+					actualSeries.push([nowSec * 1000, lastActual]);
+				}
+				if (targetSeries.length > 0 && Number.isFinite(last.tg) && last.tg > 0) {
+					targetSeries.push([nowSec * 1000, self._displayTemp(last.tg)]);
+				}
+			}
+
 			if (actualSeries.length < 2) {
 				return;
 			}
@@ -1871,7 +1891,11 @@ $(() => {
 		 * @function TempETAViewModel#onDataUpdaterPluginMessage
 		 * @param {string} plugin - plugin identifier (should be "temp_eta")
 		 * @param {Object} data - plugin message payload
-		 * @param {string} data.type - message type (e.g. 'history_reset','settings_reset','heater_update')
+		 * @param {string} data.type - message type (e.g. 'history_reset','settings_reset','eta_batch')
+		 * @param {Object} [data.heaters] - eta_batch: heater id to entry with the fields below
+		 * @param {boolean} [data.keyframe] - eta_batch: entries are complete instead of deltas
+		 * @param {number} [data.ts] - eta_batch keyframes: server time (epoch seconds) of the tick
+		 * @param {number|null} [data.eta_ts] - server time (epoch seconds) the ETA was computed at
 		 * @param {string} [data.heater] - heater id when applicable (e.g. 'tool0','bed')
 		 * @param {number} [data.eta] - ETA in seconds when provided
 		 * @param {string} [data.eta_kind] - kind of ETA ('linear','exponential',...)
@@ -1906,201 +1930,338 @@ $(() => {
 				return;
 			}
 
+			if (data.type === "eta_batch") {
+				// One message per tick. Keyframes carry every field of every
+				// heater; other messages only the fields that changed.
+				var heaters = data.heaters || {};
+				if (data.keyframe && Number.isFinite(data.ts)) {
+					// Map server time onto performance.now() once per keyframe,
+					// so ETAs count down from when the server computed them.
+					self._serverClockOffsetMs = performance.now() - data.ts * 1000;
+				}
+				Object.keys(heaters).forEach((name) => {
+					var entry = data.keyframe
+						? heaters[name]
+						: self._mergeHeaterDelta(name, heaters[name]);
+					self._applyHeaterUpdate(name, entry);
+				});
+				return;
+			}
+
 			if (data.type === "eta_update") {
-				var heater = data.heater;
-				var eta = data.eta;
-				var etaKind = data.eta_kind || null;
-				var cooldownTarget =
-					data.cooldown_target !== undefined && data.cooldown_target !== null
-						? parseFloat(data.cooldown_target)
-						: null;
-
-				if (!self.heaterData[heater]) {
-					self.heaterData[heater] = {
-						name: heater,
-						eta: ko.observable(null),
-						etaKind: ko.observable(null),
-						actual: ko.observable(null),
-						target: ko.observable(null),
-						cooldownTarget: ko.observable(null),
-						startTemp: ko.observable(null),
-						startTarget: ko.observable(null),
-						_history: [],
-						_lastGraphRenderMs: 0,
-						_targetReachedNotifiedFor: null,
-						_targetReachedNotifiedForNotification: null,
-					};
-					self.heaters.push(self.heaterData[heater]);
-					self._debugLog(
-						`register_${heater}`,
-						"[TempETA] Registered new heater",
-						heater,
-						60000,
-					);
-				}
+				self._applyHeaterUpdate(data.heater, data);
+			}
+		};
 
-				// Capture previous state for sound/event transitions.
-				var heaterObj = self.heaterData[heater];
-				var prevEta = heaterObj.eta();
-				var prevEtaKind = heaterObj.etaKind();
-				var prevActual = heaterObj.actual
-					? parseFloat(heaterObj.actual())
-					: NaN;
-				var prevTarget = heaterObj.target
-					? parseFloat(heaterObj.target())
-					: NaN;
+		/**
+		 * Complete a delta entry with the heater's current values.
+		 * @function TempETAViewModel#_mergeHeaterDelta
+		 * @param {string} heater - heater id (e.g. 'tool0','bed')
+		 * @param {Object} delta - changed fields of an eta_batch entry
+		 * @returns {Object} entry with every field of an eta_batch entry
+		 */
+		self._mergeHeaterDelta = (heater, delta) => {
+			var heaterObj = self.heaterData[heater];
+			var entry = {
+				eta: heaterObj ? self._interpolatedEta(heaterObj) : null,
+				eta_kind: heaterObj ? heaterObj.etaKind() : null,
+				target: heaterObj ? heaterObj.target() : null,
+				actual: heaterObj ? heaterObj.actual() : null,
+				cooldown_target: heaterObj ? heaterObj.cooldownTarget() : null,
+			};
+			Object.keys(delta || {}).forEach((key) => {
+				entry[key] = delta[key];
+			});
+			return entry;
+		};
 
-				var prevCooldown = heaterObj.cooldownTarget
-					? heaterObj.cooldownTarget()
-					: null;
+		/**
+		 * Current ETA of a heater, counted down from the last ETA the server sent.
+		 * The server only re-sends an ETA when it leaves this countdown, so the
+		 * display stays smooth with long update intervals. The countdown stops
+		 * at 0 until the next server message clears or re-anchors it.
+		 * @function TempETAViewModel#_interpolatedEta
+		 * @param {Object} heaterObj - heater view model entry
+		 * @returns {number|null} ETA in seconds
+		 */
+		self._interpolatedEta = (heaterObj) => {
+			var anchor = heaterObj._etaAnchor;
+			if (!anchor) {
+				return heaterObj.eta();
+			}
+			var elapsedS = (performance.now() - anchor.atMs) / 1000;
+			return Math.max(0, anchor.eta - elapsedS);
+		};
 
-				// Update heater data (avoid redundant KO notifications).
-				if (prevEta !== eta) {
-					heaterObj.eta(eta);
-				}
-				if (prevEtaKind !== etaKind) {
-					heaterObj.etaKind(etaKind);
-				}
-				if (heaterObj.actual() !== data.actual) {
-					heaterObj.actual(data.actual);
-				}
-				if (heaterObj.target() !== data.target) {
-					heaterObj.target(data.target);
-				}
+		/**
+		 * performance.now() timestamp at which a server ETA was computed.
+		 * Uses the clock offset of the last keyframe, so worker and websocket
+		 * latency is not counted as remaining time; falls back to now.
+		 * @function TempETAViewModel#_etaAnchorMs
+		 * @param {number|null|undefined} etaTs - server time (epoch seconds) of the ETA
+		 * @returns {number} anchor time in milliseconds
+		 */
+		self._etaAnchorMs = (etaTs) => {
+			var nowMs = performance.now();
+			if (!Number.isFinite(etaTs) || !Number.isFinite(self._serverClockOffsetMs)) {
+				return nowMs;
+			}
+			// A message faster than the keyframe would otherwise anchor in the future.
+			return Math.min(nowMs, etaTs * 1000 + self._serverClockOffsetMs);
+		};
 
-				var normalizedCooldown =
-					cooldownTarget !== null && Number.isFinite(cooldownTarget)
-						? cooldownTarget
-						: null;
-				if (
-					prevCooldown !== normalizedCooldown &&
-					!(
-						Number.isFinite(prevCooldown) &&
-						Number.isFinite(normalizedCooldown) &&
-						Math.abs(prevCooldown - normalizedCooldown) < 1e-9
-					)
-				) {
-					heaterObj.cooldownTarget(normalizedCooldown);
+		/**
+		 * Update displayed ETAs once per animation frame while any heater counts down.
+		 * Observables only change when the displayed whole second changes.
+		 * @function TempETAViewModel#_ensureCountdownLoop
+		 * @returns {void}
+		 */
+		self._ensureCountdownLoop = () => {
+			if (self._countdownFrame) {
+				return;
+			}
+			var schedule =
+				typeof window.requestAnimationFrame === "function"
+					? (fn) => window.requestAnimationFrame(fn)
+					: (fn) => window.setTimeout(fn, 250);
+
+			var frame = () => {
+				self._countdownFrame = null;
+				var active = false;
+				Object.keys(self.heaterData).forEach((name) => {
+					var heaterObj = self.heaterData[name];
+					if (!heaterObj._etaAnchor) {
+						return;
+					}
+					var eta = self._interpolatedEta(heaterObj);
+					if (Math.floor(eta) !== Math.floor(heaterObj.eta())) {
+						heaterObj.eta(eta);
+					}
+					// At 0 there is nothing left to animate until the server
+					// sends the next update.
+					if (eta > 0) {
+						active = true;
+					}
+				});
+				if (active) {
+					self._countdownFrame = schedule(frame);
 				}
+			};
+			self._countdownFrame = schedule(frame);
+		};
 
-				// Track start temperature for progress bars.
-				// We reset this when a new target is set (or the target changes), so
-				// progress represents the fraction from startTemp -> target.
-				var actualNow = parseFloat(data.actual);
-				var targetNow = parseFloat(data.target);
-				var prevStartTarget = parseFloat(heaterObj.startTarget());
+		/**
+		 * Apply one heater's ETA update to its view model entry.
+		 * @function TempETAViewModel#_applyHeaterUpdate
+		 * @param {string} heater - heater id (e.g. 'tool0','bed')
+		 * @param {Object} data - heater entry of an eta_batch message (or a legacy eta_update payload)
+		 * @returns {void}
+		 */
+		self._applyHeaterUpdate = (heater, data) => {
+			var eta = data.eta;
+			var etaKind = data.eta_kind || null;
+			var cooldownTarget =
+				data.cooldown_target !== undefined && data.cooldown_target !== null
+					? parseFloat(data.cooldown_target)
+					: null;
 
-				var heatingNow = self._isHeaterHeatingNow(eta, actualNow, targetNow);
-				if (!heatingNow) {
-					// Reset when the heater returns to "Idle" (e.g. reached target).
-					heaterObj.startTemp(null);
-					heaterObj.startTarget(null);
-				} else {
-					var needsReset =
-						!Number.isFinite(prevStartTarget) ||
-						Math.abs(prevStartTarget - targetNow) > 1e-6 ||
-						heaterObj.startTemp() === null ||
-						heaterObj.startTemp() === undefined;
-
-					if (needsReset) {
-						heaterObj.startTemp(actualNow);
-						heaterObj.startTarget(targetNow);
-					}
+			if (!self.heaterData[heater]) {
+				self.heaterData[heater] = {
+					name: heater,
+					eta: ko.observable(null),
+					etaKind: ko.observable(null),
+					actual: ko.observable(null),
+					target: ko.observable(null),
+					cooldownTarget: ko.observable(null),
+					startTemp: ko.observable(null),
+					startTarget: ko.observable(null),
+					_history: [],
+					_etaAnchor: null,
+					_lastGraphRenderMs: 0,
+					_targetReachedNotifiedFor: null,
+					_targetReachedNotifiedForNotification: null,
+				};
+				self.heaters.push(self.heaterData[heater]);
+				self._debugLog(
+					`register_${heater}`,
+					"[TempETA] Registered new heater",
+					heater,
+					60000,
+				);
+			}
+
+			// Capture previous state for sound/event transitions.
+			var heaterObj = self.heaterData[heater];
+			var prevEta = heaterObj.eta();
+			var prevEtaKind = heaterObj.etaKind();
+			var prevActual = heaterObj.actual
+				? parseFloat(heaterObj.actual())
+				: NaN;
+			var prevTarget = heaterObj.target
+				? parseFloat(heaterObj.target())
+				: NaN;
+
+			var prevCooldown = heaterObj.cooldownTarget
+				? heaterObj.cooldownTarget()
+				: null;
+
+			// Count the ETA down locally until the server sends a new one.
+			if (Number.isFinite(eta) && eta > 0) {
+				heaterObj._etaAnchor = {
+					eta: eta,
+					atMs: self._etaAnchorMs(data.eta_ts),
+				};
+				self._ensureCountdownLoop();
+			} else {
+				heaterObj._etaAnchor = null;
+			}
+			// Update heater data (avoid redundant KO notifications).
+			var displayedEta = self._interpolatedEta(heaterObj);
+			if (prevEta !== displayedEta) {
+				heaterObj.eta(displayedEta);
+			}
+			if (prevEtaKind !== etaKind) {
+				heaterObj.etaKind(etaKind);
+			}
+			if (heaterObj.actual() !== data.actual) {
+				heaterObj.actual(data.actual);
+			}
+			if (heaterObj.target() !== data.target) {
+				heaterObj.target(data.target);
+			}
+
+			var normalizedCooldown =
+				cooldownTarget !== null && Number.isFinite(cooldownTarget)
+					? cooldownTarget
+					: null;
+			if (
+				prevCooldown !== normalizedCooldown &&
+				!(
+					Number.isFinite(prevCooldown) &&
+					Number.isFinite(normalizedCooldown) &&
+					Math.abs(prevCooldown - normalizedCooldown) < 1e-9
+				)
+			) {
+				heaterObj.cooldownTarget(normalizedCooldown);
+			}
+
+			// Track start temperature for progress bars.
+			// We reset this when a new target is set (or the target changes), so
+			// progress represents the fraction from startTemp -> target.
+			var actualNow = parseFloat(data.actual);
+			var targetNow = parseFloat(data.target);
+			var prevStartTarget = parseFloat(heaterObj.startTarget());
+
+			var heatingNow = self._isHeaterHeatingNow(eta, actualNow, targetNow);
+			if (!heatingNow) {
+				// Reset when the heater returns to "Idle" (e.g. reached target).
+				heaterObj.startTemp(null);
+				heaterObj.startTarget(null);
+			} else {
+				var needsReset =
+					!Number.isFinite(prevStartTarget) ||
+					Math.abs(prevStartTarget - targetNow) > 1e-6 ||
+					heaterObj.startTemp() === null ||
+					heaterObj.startTemp() === undefined;
+
+				if (needsReset) {
+					heaterObj.startTemp(actualNow);
+					heaterObj.startTarget(targetNow);
 				}
+			}
 
-				// Sound alert transitions.
-				try {
-					var prevHeating = self._isHeaterHeatingNow(
-						prevEta,
-						prevActual,
-						prevTarget,
-					);
+			// Sound alert transitions.
+			try {
+				var prevHeating = self._isHeaterHeatingNow(
+					prevEta,
+					prevActual,
+					prevTarget,
+				);
 
-					// Reset target-reached marker if the target changes significantly.
-					if (
-						Number.isFinite(prevTarget) &&
-						Number.isFinite(targetNow) &&
-						Math.abs(prevTarget - targetNow) > 0.2
-					) {
-						heaterObj._targetReachedNotifiedFor = null;
-						heaterObj._targetReachedNotifiedForNotification = null;
-					}
+				// Reset target-reached marker if the target changes significantly.
+				if (
+					Number.isFinite(prevTarget) &&
+					Number.isFinite(targetNow) &&
+					Math.abs(prevTarget - targetNow) > 0.2
+				) {
+					heaterObj._targetReachedNotifiedFor = null;
+					heaterObj._targetReachedNotifiedForNotification = null;
+				}
 
+				if (
+					self._isSoundEnabled() &&
+					self._isSoundEventEnabled("target_reached") &&
+					prevHeating &&
+					!heatingNow &&
+					Number.isFinite(targetNow) &&
+					targetNow > 0
+				) {
+					var notifiedFor = heaterObj._targetReachedNotifiedFor;
 					if (
-						self._isSoundEnabled() &&
-						self._isSoundEventEnabled("target_reached") &&
-						prevHeating &&
-						!heatingNow &&
-						Number.isFinite(targetNow) &&
-						targetNow > 0
+						!Number.isFinite(notifiedFor) ||
+						notifiedFor === null ||
+						Math.abs(notifiedFor - targetNow) > 0.1
 					) {
-						var notifiedFor = heaterObj._targetReachedNotifiedFor;
-						if (
-							!Number.isFinite(notifiedFor) ||
-							notifiedFor === null ||
-							Math.abs(notifiedFor - targetNow) > 0.1
-						) {
-							heaterObj._targetReachedNotifiedFor = targetNow;
-							self._playSoundEvent(heater, "target_reached");
-						}
+						heaterObj._targetReachedNotifiedFor = targetNow;
+						self._playSoundEvent(heater, "target_reached");
 					}
+				}
 
+				if (
+					self._isNotificationEnabled() &&
+					self._isNotificationEventEnabled("target_reached") &&
+					prevHeating &&
+					!heatingNow &&
+					Number.isFinite(targetNow) &&
+					targetNow > 0
+				) {
+					var notifiedForN = heaterObj._targetReachedNotifiedForNotification;
 					if (
-						self._isNotificationEnabled() &&
-						self._isNotificationEventEnabled("target_reached") &&
-						prevHeating &&
-						!heatingNow &&
-						Number.isFinite(targetNow) &&
-						targetNow > 0
+						!Number.isFinite(notifiedForN) ||
+						notifiedForN === null ||
+						Math.abs(notifiedForN - targetNow) > 0.1
 					) {
-						var notifiedForN = heaterObj._targetReachedNotifiedForNotification;
-						if (
-							!Number.isFinite(notifiedForN) ||
-							notifiedForN === null ||
-							Math.abs(notifiedForN - targetNow) > 0.1
-						) {
-							heaterObj._targetReachedNotifiedForNotification = targetNow;
-							self._notifyEvent(heater, "target_reached", targetNow);
-						}
+						heaterObj._targetReachedNotifiedForNotification = targetNow;
+						self._notifyEvent(heater, "target_reached", targetNow);
 					}
+				}
 
-					var prevCooling = prevEtaKind === "cooling";
-					var nowCooling = etaKind === "cooling";
-					if (
-						self._isSoundEnabled() &&
-						self._isSoundEventEnabled("cooldown_finished") &&
-						prevCooling &&
-						!nowCooling
-					) {
-						self._playSoundEvent(heater, "cooldown_finished");
-					}
+				var prevCooling = prevEtaKind === "cooling";
+				var nowCooling = etaKind === "cooling";
+				if (
+					self._isSoundEnabled() &&
+					self._isSoundEventEnabled("cooldown_finished") &&
+					prevCooling &&
+					!nowCooling
+				) {
+					self._playSoundEvent(heater, "cooldown_finished");
+				}
 
-					if (
-						self._isNotificationEnabled() &&
-						self._isNotificationEventEnabled("cooldown_finished") &&
-						prevCooling &&
-						!nowCooling
-					) {
-						// Prefer the explicit cooldown target if provided, otherwise fall back
-						// to the current "effective" target.
-						var t = cooldownTarget;
-						if (!Number.isFinite(t) || t === null) {
-							t = targetNow;
-						}
-						self._notifyEvent(heater, "cooldown_finished", t);
+				if (
+					self._isNotificationEnabled() &&
+					self._isNotificationEventEnabled("cooldown_finished") &&
+					prevCooling &&
+					!nowCooling
+				) {
+					// Prefer the explicit cooldown target if provided, otherwise fall back
+					// to the current "effective" target.
+					var t = cooldownTarget;
+					if (!Number.isFinite(t) || t === null) {
+						t = targetNow;
 					}
-				} catch (_e) {
-					// ignore
+					self._notifyEvent(heater, "cooldown_finished", t);
 				}
+			} catch (_e) {
+				// ignore
+			}
 
-				// Record and render history graph (tab view).
-				var tsSec = Date.now() / 1000.0;
-				self._recordHeaterHistory(heaterObj, tsSec, actualNow, targetNow);
-				self._renderHistoricalGraph(heaterObj);
+			// Record and render history graph (tab view).
+			var tsSec = Date.now() / 1000.0;
+			self._recordHeaterHistory(heaterObj, tsSec, actualNow, targetNow);
+			self._renderHistoricalGraph(heaterObj);
 
-				// Ensure sidebar becomes visible even if it was injected late.
-				self._throttledEnsureSidebarBound();
-			}
+			// Ensure sidebar becomes visible even if it was injected late.
+			self._throttledEnsureSidebarBound();
 		};
 
 		self._effectiveDisplayTargetC = (heater) => {
@@ -0,0 +1,180 @@
+"""Background workers for ETA computation and history persistence.
+
+OctoPrint delivers temperature callbacks on a shared thread, so anything slow
+done there (fitting, frontend messages, MQTT publishing, disk I/O) delays every
+other plugin. The plugin instead records samples in the callback and hands a
+"tick" to a :class:`CoalescingWorker`, which runs the expensive part on its own
+thread. Persist requests go to a second worker so a slow disk never holds up
+ETA updates.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+
+class CoalescingWorker:
+    """Bounded single-consumer queue that only processes the newest item.
+
+    Items submitted while the worker is busy pile up in a bounded queue. When
+    the worker wakes it takes the newest item and discards the rest: an ETA
+    tick supersedes all earlier ones, so computing stale ticks is wasted work.
+
+    Attributes:
+        submitted (int): Items accepted by :meth:`submit`.
+        processed (int): Items passed to the handler.
+        dropped (int): Items discarded without processing, either coalesced
+            into a newer item or evicted because the queue was full.
+        max_queue_depth (int): Largest queue depth observed.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], None],
+        logger: Optional[Any] = None,
+        name: str = "temp_eta-worker",
+        maxsize: int = 8,
+    ) -> None:
+        """Create a stopped worker.
+
+        Args:
+            handler: Called with each processed item on the worker thread.
+            logger: Optional logger for handler failures.
+            name (str): Thread name.
+            maxsize (int): Maximum number of queued items; the oldest item
+                is dropped when a new one arrives on a full queue.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._handler = handler
+        self._logger = logger
+        self._name = name
+        self._queue: deque = deque()
+        self._maxsize = int(maxsize)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._busy = False
+
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is alive and accepting items."""
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stopping
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if already running)."""
+        with self._cond:
+            if self.running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker thread, discarding queued items.
+
+        Args:
+            timeout (float): Seconds to wait for an in-flight item to finish.
+        """
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            self.dropped += len(self._queue)
+            self._queue.clear()
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._cond:
+            if self._thread is thread:
+                self._thread = None
+
+    def submit(self, item: Any) -> bool:
+        """Queue *item* for processing.
+
+        Returns:
+            bool: False if the worker is not running (the caller should then
+            process the item itself).
+        """
+        with self._cond:
+            if not self.running:
+                return False
+            if len(self._queue) >= self._maxsize:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(item)
+            self.submitted += 1
+            depth = len(self._queue)
+            if depth > self.max_queue_depth:
+                self.max_queue_depth = depth
+            # notify_all: flush() waits on the same condition.
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until the queue is empty and no item is being processed.
+
+        Args:
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the worker went idle within *timeout*.
+        """
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._cond:
+            while self._queue or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stats(self) -> dict:
+        """Return a snapshot of the queue counters."""
+        with self._cond:
+            return {
+                "running": self.running,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self.max_queue_depth,
+                "submitted": self.submitted,
+                "processed": self.processed,
+                "dropped": self.dropped,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                item = self._queue.pop()
+                self.dropped += len(self._queue)
+                self._queue.clear()
+                self._busy = True
+
+            try:
+                self._handler(item)
+            except (
+                AttributeError,
+                KeyError,
+                OSError,
+                RuntimeError,
+                TypeError,
+                ValueError,
+            ) as e:
+                if self._logger is not None:
+                    self._logger.error("ETA worker tick failed: %s", str(e))
+
+            with self._cond:
+                self.processed += 1
+                self._busy = False
+                self._cond.notify_all()
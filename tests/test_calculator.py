@@ -3,11 +3,14 @@
 """Unit tests for the calculator module."""
 
 
+import math
+import random
 import time
 from collections import deque
 from unittest import TestCase
 
 from octoprint_temp_eta import calculator
+from octoprint_temp_eta.history import HeaterHistory
 
 
 class TestCalculateLinearETA(TestCase):
@@ -334,6 +337,270 @@ class TestCalculateCooldownExponentialETA(TestCase):
         self.assertGreater(result, 0.0)
 
 
+def _heating_stream(seed, count, maxlen=None):
+    """Yield (history, target) after each appended sample of a noisy heat-up."""
+    rng = random.Random(seed)
+    history = deque(maxlen=maxlen)
+    ts = 1_700_000_000.0
+    temp = 20.0
+    target = 200.0
+    for i in range(count):
+        ts += rng.choice([0.5, 0.5, 1.0])
+        temp += (target - temp) * 0.01 + rng.gauss(0.0, 0.05)
+        if i == count // 2:
+            target = 210.0
+        history.append((ts, temp, target))
+        yield history, target
+
+
+class TestRollingFit(TestCase):
+    """Test cases for the incremental RollingFit engine."""
+
+    def assertSameEta(self, expected, actual):
+        """Assert two ETA results agree (both None or numerically equal)."""
+        if expected is None or actual is None:
+            self.assertEqual(expected, actual)
+        else:
+            self.assertAlmostEqual(expected, actual, delta=1e-6 * max(1.0, expected))
+
+    def test_matches_stateless_functions_over_stream(self):
+        """Test fit results equal the stateless functions on every tick."""
+        fit = calculator.RollingFit()
+        for history, target in _heating_stream(seed=1, count=400, maxlen=60):
+            fit.sync(history)
+            self.assertSameEta(
+                calculator.calculate_linear_eta(history, target),
+                calculator.calculate_linear_eta_from_fit(fit, target),
+            )
+            self.assertSameEta(
+                calculator.calculate_exponential_eta(history, target),
+                calculator.calculate_exponential_eta_from_fit(fit, target),
+            )
+
+    def test_honors_history_maxlen(self):
+        """Test rows dropped by the source maxlen leave the fit."""
+        fit = calculator.RollingFit()
+        history = deque(maxlen=3)
+        for i in range(10):
+            history.append((float(i), 20.0 + i, 200.0))
+            fit.sync(history)
+        self.assertSameEta(
+            calculator.calculate_exponential_eta(history, 200.0),
+            calculator.calculate_exponential_eta_from_fit(fit, 200.0),
+        )
+        self.assertEqual(fit.history_len, 3)
+
+    def test_replaced_history_is_replayed(self):
+        """Test a new container (or cleared one) replaces previous samples."""
+        fit = calculator.RollingFit()
+        fit.sync(deque([(95.0, 20.0, 50.0), (100.0, 30.0, 50.0)]))
+        self.assertAlmostEqual(calculator.calculate_linear_eta_from_fit(fit, 50.0), 10.0)
+
+        replaced = deque([(95.0, 30.0, 50.0), (100.0, 20.0, 50.0)])
+        fit.sync(replaced)
+        self.assertIsNone(calculator.calculate_linear_eta_from_fit(fit, 50.0))
+
+        replaced.clear()
+        replaced.extend([(10.0, 20.0, 50.0), (15.0, 25.0, 50.0)])
+        fit.sync(replaced)
+        self.assertAlmostEqual(calculator.calculate_linear_eta_from_fit(fit, 50.0), 25.0)
+
+    def test_unsorted_replay_matches_stateless(self):
+        """Test an unsorted initial history is handled like _filter_recent."""
+        rows = [(float(i), 20.0 + 2.0 * i, 100.0) for i in range(12)]
+        shuffled = rows[:]
+        random.Random(3).shuffle(shuffled)
+        history = deque(shuffled)
+        fit = calculator.RollingFit()
+        fit.sync(history)
+        self.assertSameEta(
+            calculator.calculate_exponential_eta(history, 100.0),
+            calculator.calculate_exponential_eta_from_fit(fit, 100.0),
+        )
+
+    def test_skips_non_finite_samples(self):
+        """Test non-finite samples never enter the running sums."""
+        fit = calculator.RollingFit()
+        fit.push(0.0, 20.0)
+        fit.push(1.0, float("nan"))
+        fit.push(float("inf"), 25.0)
+        fit.push(2.0, 24.0)
+        self.assertEqual(fit.last_ts, 2.0)
+        self.assertAlmostEqual(calculator.calculate_linear_eta_from_fit(fit, 60.0), 18.0)
+
+    def test_invalid_target_returns_none(self):
+        """Test NaN/inf targets are rejected like the stateless API."""
+        fit = calculator.RollingFit()
+        fit.sync(deque([(0.0, 20.0, 60.0), (1.0, 22.0, 60.0)]))
+        self.assertIsNone(calculator.calculate_linear_eta_from_fit(fit, float("nan")))
+        self.assertIsNone(
+            calculator.calculate_exponential_eta_from_fit(fit, float("inf"))
+        )
+
+
+    def test_copy_is_independent_of_source(self):
+        """Test a copy keeps its samples while the source keeps syncing."""
+        history = deque(maxlen=60)
+        for i in range(20):
+            history.append((float(i), 20.0 + 3.0 * i, 200.0))
+        fit = calculator.RollingFit()
+        fit.sync(history)
+        expected = calculator.calculate_exponential_eta(history, 200.0)
+
+        copied = fit.copy(200.0)
+        for i in range(20, 40):
+            history.append((float(i), 80.0 - i, 200.0))
+            fit.sync(history)
+
+        self.assertSameEta(
+            expected, calculator.calculate_exponential_eta_from_fit(copied, 200.0)
+        )
+        self.assertSameEta(
+            calculator.calculate_exponential_eta(history, 200.0),
+            calculator.calculate_exponential_eta_from_fit(fit, 200.0),
+        )
+
+
+class TestSlidingWindowMin(TestCase):
+    """Test cases for the monotonic-deque window minimum."""
+
+    def test_matches_min_over_sliding_window(self):
+        """Test the minimum equals min() over the samples left in the window."""
+        rng = random.Random(5)
+        window = []
+        tracker = calculator.SlidingWindowMin()
+        self.assertIsNone(tracker.minimum)
+        for i in range(300):
+            ts = float(i)
+            value = rng.choice([rng.uniform(20.0, 80.0), 50.0])
+            tracker.push(ts, value, i)
+            window.append((ts, value, i))
+            cutoff = ts - 15.0
+            tracker.evict(cutoff)
+            if i % 7 == 0:
+                tracker.evict_dropped(i - 10)
+                window[:] = [row for row in window if row[2] >= i - 10]
+            window[:] = [row for row in window if row[0] > cutoff]
+            self.assertEqual(tracker.minimum, min(value for _, value, _ in window))
+
+
+class TestCooldownFit(TestCase):
+    """Test cases for the incremental CooldownFit engine."""
+
+    @staticmethod
+    def _reference(history, window, now):
+        """Plugin's previous full-scan computation of ambient inputs and ETA."""
+        recent = [(ts, temp) for ts, temp in history if ts > now - window and math.isfinite(temp)]
+        ambient = [temp for ts, temp in history if ts > now - max(window, 60.0) and math.isfinite(temp)]
+        eta = calculator.calculate_cooldown_linear_eta(recent, 40.0, window) if len(recent) >= 2 else None
+        stats = (len(ambient), min(ambient), ambient[-1]) if ambient else (0, None, None)
+        return eta, stats
+
+    def test_matches_full_scan_over_stream(self):
+        """Test ETA and ambient window equal a full scan across wraps, clears and resizes."""
+        rng = random.Random(11)
+        history = HeaterHistory(maxlen=150, fields=2)
+        fit = calculator.CooldownFit(45.0)
+        ts = now = 1_700_000_000.0
+        temp = 200.0
+        for i in range(900):
+            ts += rng.choice([0.5, 0.5, 1.0, 3.0])
+            temp = 25.0 + (temp - 25.0) * 0.995 + rng.gauss(0.0, 0.3)
+            history.append((ts, float("nan") if i % 37 == 0 else temp))
+            if i == 400:
+                history.clear()
+            if i == 600:
+                history.resize(40)
+            if i % 3:
+                continue  # evaluate on every third sample only
+            # Wall-clock "now" never moves back and may run ahead of the newest sample.
+            now = max(now, ts + rng.choice([0.0, 0.2, 2.0]))
+            fit.sync(history)
+            eta, stats = self._reference(list(history), 45.0, now)
+            self.assertEqual(fit.ambient_window(now), stats)
+            self.assertEqual(calculator.calculate_cooldown_linear_eta_from_fit(fit, 40.0, now), eta)
+
+    def test_replaced_history_is_replayed(self):
+        """Test a different history object replaces previous samples."""
+        fit = calculator.CooldownFit(60.0)
+        fit.sync(HeaterHistory(maxlen=10, fields=2, rows=[(0.0, 90.0), (10.0, 80.0)]))
+        self.assertAlmostEqual(calculator.calculate_cooldown_linear_eta_from_fit(fit, 40.0, 10.0), 40.0)
+        fit.sync(HeaterHistory(maxlen=10, fields=2, rows=[(0.0, 80.0), (10.0, 90.0)]))
+        self.assertIsNone(calculator.calculate_cooldown_linear_eta_from_fit(fit, 40.0, 10.0))
+        self.assertEqual(fit.ambient_window(10.0), (2, 80.0, 90.0))
+
+    def test_invalid_goal_returns_none(self):
+        """Test NaN goals are rejected like the stateless API."""
+        fit = calculator.CooldownFit()
+        fit.sync(HeaterHistory(maxlen=10, fields=2, rows=[(0.0, 90.0), (10.0, 80.0)]))
+        self.assertIsNone(calculator.calculate_cooldown_linear_eta_from_fit(fit, float("nan"), 10.0))
+
+
+class TestCalculateBatch(TestCase):
+    """Test cases for the multi-heater batch API."""
+
+    def setUp(self):
+        self.histories = {}
+        self.targets = {}
+        for seed, heater in enumerate(("bed", "tool0", "tool1", "chamber")):
+            history, target = list(_heating_stream(seed=seed, count=80))[-1]
+            self.histories[heater] = history
+            self.targets[heater] = target
+
+    def test_matches_per_heater_functions(self):
+        """Test each batch result equals the single-heater function."""
+        for algorithm, func in (
+            ("linear", calculator.calculate_linear_eta),
+            ("exponential", calculator.calculate_exponential_eta),
+        ):
+            result = calculator.calculate_batch(
+                self.histories, self.targets, {"algorithm": algorithm}
+            )
+            self.assertEqual(list(result), list(self.histories))
+            for heater, history in self.histories.items():
+                expected = func(history, self.targets[heater])
+                if expected is None:
+                    self.assertIsNone(result[heater])
+                else:
+                    self.assertAlmostEqual(result[heater], expected, delta=1e-6)
+
+    def test_accepts_rolling_fits(self):
+        """Test RollingFit values are evaluated from their running sums."""
+        fits = {}
+        for heater, history in self.histories.items():
+            fits[heater] = calculator.RollingFit()
+            fits[heater].sync(history)
+        from_fits = calculator.calculate_batch(
+            fits, self.targets, {"algorithm": "exponential"}
+        )
+        from_histories = calculator.calculate_batch(
+            self.histories, self.targets, {"algorithm": "exponential"}
+        )
+        for heater in self.histories:
+            self.assertAlmostEqual(
+                from_fits[heater], from_histories[heater], delta=1e-6
+            )
+
+    def test_invalid_inputs(self):
+        """Test bad targets and windows yield None and unknown algorithms raise."""
+        targets = dict(self.targets, bed=float("nan"), tool0=None)
+        del targets["tool1"]
+        result = calculator.calculate_batch(self.histories, targets)
+        self.assertIsNone(result["bed"])
+        self.assertIsNone(result["tool0"])
+        self.assertIsNone(result["tool1"])
+        self.assertIsNotNone(result["chamber"])
+
+        result = calculator.calculate_batch(
+            self.histories, self.targets, {"linear_window_seconds": 0}
+        )
+        self.assertEqual(result, dict.fromkeys(self.histories))
+
+        with self.assertRaises(ValueError):
+            calculator.calculate_batch(self.histories, self.targets, {"algorithm": "x"})
+        self.assertEqual(calculator.calculate_batch({}, {}), {})
+
+
 if __name__ == "__main__":
     import unittest
 
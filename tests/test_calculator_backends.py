@@ -0,0 +1,201 @@
+"""Parity tests between the pure-Python and NumPy calculator backends.
+
+Every case runs the public calculator API once per backend on identical input
+and requires the results to agree within a tight tolerance.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import deque
+from typing import Any, Iterator
+
+import pytest
+
+from octoprint_temp_eta import calculator
+from octoprint_temp_eta.history import HeaterHistory
+
+pytest.importorskip("numpy")
+
+REL_TOL = 1e-9
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend() -> Iterator[None]:
+    """Restore the import-time backend after each test."""
+    original = calculator.BACKEND
+    yield
+    calculator.use_backend(original)
+
+
+def _run_both(name: str, *args: Any) -> tuple[Any, Any]:
+    """Call calculator.<name> with each backend and return both results."""
+    results = []
+    for backend in ("python", "numpy"):
+        calculator.use_backend(backend)
+        results.append(getattr(calculator, name)(*args))
+    return results[0], results[1]
+
+
+def _assert_parity(name: str, *args: Any) -> None:
+    expected, actual = _run_both(name, *args)
+    if expected is None or actual is None:
+        assert expected == actual
+    else:
+        assert actual == pytest.approx(expected, rel=REL_TOL, abs=1e-9)
+
+
+def _heating_rows(seed: int, count: int, tau: float, noise: float) -> list:
+    rng = random.Random(seed)
+    ts = 1_700_000_000.0
+    rows = []
+    for i in range(count):
+        ts += rng.choice([0.5, 0.5, 1.0])
+        temp = 200.0 - 180.0 * math.exp(-i * 0.5 / tau) + rng.gauss(0.0, noise)
+        rows.append((ts, temp, 200.0))
+    return rows
+
+
+def _cooldown_rows(seed: int, count: int, tau: float, noise: float) -> list:
+    rng = random.Random(seed)
+    ts = 1_700_000_000.0
+    rows = []
+    for i in range(count):
+        ts += 1.0
+        rows.append((ts, 20.0 + 180.0 * math.exp(-i / tau) + rng.gauss(0.0, noise)))
+    return rows
+
+
+HEATING_CASES = [
+    pytest.param(_heating_rows(1, 60, 40.0, 0.0), id="smooth-60"),
+    pytest.param(_heating_rows(2, 300, 80.0, 0.1), id="noisy-300"),
+    pytest.param(_heating_rows(3, 1000, 400.0, 0.3), id="noisy-1000"),
+    pytest.param(_heating_rows(4, 8, 10.0, 0.0), id="short-linear-fallback"),
+    pytest.param([(float(i), 20.0 + 2.0 * i, 60.0) for i in range(40)], id="ramp"),
+    pytest.param([(float(i), 50.0, 100.0) for i in range(20)], id="flat"),
+    pytest.param([(float(i), 99.8, 100.0) for i in range(20)], id="at-target"),
+    pytest.param(
+        [(0.0, 20.0, 60.0), (1.0, float("nan"), 60.0), (float("inf"), 30.0, 60.0)]
+        + [(float(i), 20.0 + i, 60.0) for i in range(2, 12)],
+        id="non-finite",
+    ),
+    pytest.param(
+        random.Random(5).sample(_heating_rows(5, 50, 30.0, 0.05), 50), id="shuffled"
+    ),
+    pytest.param(
+        [row for row in _heating_rows(6, 40, 30.0, 0.0) for _ in range(2)],
+        id="duplicated",
+    ),
+]
+
+
+@pytest.mark.parametrize("rows", HEATING_CASES)
+@pytest.mark.parametrize("container", ["deque", "heater_history"])
+@pytest.mark.parametrize(
+    "name", ["calculate_linear_eta", "calculate_exponential_eta"]
+)
+def test_heating_backends_agree(rows: list, container: str, name: str) -> None:
+    """Heating ETAs agree across backends for deques and ring buffers."""
+    if container == "deque":
+        history: Any = deque(rows)
+    else:
+        history = HeaterHistory(maxlen=len(rows), rows=rows)
+    for target in (200.0, 60.0, 100.0):
+        _assert_parity(name, history, target)
+
+
+@pytest.mark.parametrize("window", [5.0, 10.0, 30.0, 120.0])
+def test_heating_backends_agree_across_windows(window: float) -> None:
+    """Window handling matches for every window size."""
+    history = deque(_heating_rows(7, 200, 60.0, 0.05))
+    _assert_parity("calculate_linear_eta", history, 200.0, window)
+    _assert_parity("calculate_exponential_eta", history, 200.0, window)
+
+
+COOLDOWN_CASES = [
+    pytest.param(_cooldown_rows(1, 120, 90.0, 0.0), id="smooth-120"),
+    pytest.param(_cooldown_rows(2, 600, 300.0, 0.2), id="noisy-600"),
+    pytest.param(_cooldown_rows(3, 5, 50.0, 0.0), id="short"),
+    pytest.param([(float(i), 80.0) for i in range(30)], id="flat"),
+    pytest.param(
+        [(0.0, 80.0), (float("inf"), 75.0), (2.0, float("nan"))]
+        + [(float(i), 80.0 - i) for i in range(3, 20)],
+        id="non-finite",
+    ),
+    pytest.param(
+        random.Random(4).sample(_cooldown_rows(4, 80, 60.0, 0.1), 80), id="shuffled"
+    ),
+]
+
+
+@pytest.mark.parametrize("algorithm", ["linear", "exponential"])
+@pytest.mark.parametrize("container", ["deque", "heater_history"])
+def test_batch_backends_agree(algorithm: str, container: str) -> None:
+    """Batch results agree across backends for deques and ring buffers."""
+    histories: dict[str, Any] = {}
+    targets: dict[str, Any] = {}
+    for index, param in enumerate(HEATING_CASES):
+        rows = param.values[0]
+        if container == "deque":
+            histories[f"h{index}"] = deque(rows)
+        else:
+            histories[f"h{index}"] = HeaterHistory(maxlen=len(rows), rows=rows)
+        targets[f"h{index}"] = (200.0, 60.0, 100.0)[index % 3]
+    targets["h0"] = float("nan")
+    for linear_window, exponential_window in ((10.0, 30.0), (5.0, 120.0)):
+        config = {
+            "algorithm": algorithm,
+            "linear_window_seconds": linear_window,
+            "exponential_window_seconds": exponential_window,
+        }
+        expected, actual = _run_both("calculate_batch", histories, targets, config)
+        assert list(actual) == list(expected)
+        for heater, value in expected.items():
+            if value is None or actual[heater] is None:
+                assert actual[heater] == value
+            else:
+                assert actual[heater] == pytest.approx(value, rel=REL_TOL, abs=1e-9)
+
+
+@pytest.mark.parametrize("rows", COOLDOWN_CASES)
+@pytest.mark.parametrize("container", ["deque", "heater_history"])
+def test_cooldown_backends_agree(rows: list, container: str) -> None:
+    """Cooldown ETAs agree across backends for deques and ring buffers."""
+    if container == "deque":
+        history: Any = deque(rows)
+    else:
+        history = HeaterHistory(maxlen=len(rows), fields=2, rows=rows)
+    for window in (30.0, 60.0, 600.0):
+        for goal in (30.0, 50.0, 90.0):
+            _assert_parity("calculate_cooldown_linear_eta", history, goal, window)
+            _assert_parity(
+                "calculate_cooldown_exponential_eta", history, 20.0, goal, window
+            )
+
+
+def test_backends_agree_on_invalid_arguments() -> None:
+    """Argument validation is shared by both backends."""
+    history = deque(_heating_rows(8, 30, 20.0, 0.0))
+    cooldown = deque(_cooldown_rows(8, 30, 20.0, 0.0))
+    for bad in (float("nan"), float("inf")):
+        _assert_parity("calculate_linear_eta", history, bad)
+        _assert_parity("calculate_exponential_eta", history, 200.0, bad)
+        _assert_parity("calculate_cooldown_linear_eta", cooldown, bad)
+        _assert_parity("calculate_cooldown_exponential_eta", cooldown, bad, 30.0)
+    _assert_parity("calculate_linear_eta", deque(), 200.0)
+    _assert_parity("calculate_cooldown_exponential_eta", cooldown, 40.0, 30.0)
+
+
+def test_use_backend_rejects_unknown_name() -> None:
+    """Unknown backends raise ValueError and leave the binding untouched."""
+    before = calculator.BACKEND
+    with pytest.raises(ValueError):
+        calculator.use_backend("fortran")
+    assert calculator.BACKEND == before
+
+
+def test_numpy_backend_is_default_when_available() -> None:
+    """The import-time choice prefers NumPy when it is installed."""
+    assert "numpy" in calculator.available_backends()
+    assert calculator.BACKEND == "numpy"
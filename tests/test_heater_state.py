@@ -0,0 +1,105 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the heater_state module."""
+
+from unittest import TestCase
+
+from octoprint_temp_eta.heater_state import HeaterRegistry, HeaterState
+
+
+class TestHeaterState(TestCase):
+    """Test cases for the slotted per-heater state."""
+
+    def test_is_slotted_with_empty_defaults(self):
+        """Test new states have no values and reject unknown attributes."""
+        state = HeaterState("tool0")
+        self.assertFalse(hasattr(state, "__dict__"))
+        for field in HeaterState.__slots__:
+            if field not in ("name", "lock"):
+                self.assertIsNone(getattr(state, field))
+        with self.assertRaises(AttributeError):
+            state.unknown = 1  # type: ignore[attr-defined]
+
+    def test_snapshot_copies_reportable_state(self):
+        """Test snapshots are immutable copies unaffected by later writes."""
+        state = HeaterState("bed")
+        state.history = [(1.0, 20.0, 60.0), (2.0, 21.0, 60.0)]
+        state.last_target = 60.0
+        state.last_eta = 30.0
+        state.last_eta_kind = "heating"
+
+        snapshot = state.snapshot()
+        state.last_eta = 12.0
+        self.assertEqual(snapshot.name, "bed")
+        self.assertEqual(snapshot.last_eta, 30.0)
+        self.assertEqual(snapshot.samples, 2)
+        self.assertEqual(snapshot.cooldown_samples, 0)
+        with self.assertRaises(AttributeError):
+            snapshot.last_eta = 1.0  # type: ignore[misc]
+
+
+class TestHeaterRegistry(TestCase):
+    """Test cases for the heater name registry."""
+
+    def test_state_creates_once_and_interns_names(self):
+        """Test lookups return the same object keyed by an interned name."""
+        registry = HeaterRegistry()
+        name = "".join(["to", "ol1"])
+        state = registry.state(name)
+        self.assertIs(registry.state("tool1"), state)
+        self.assertIs(state.name, "tool1")
+        self.assertIsNone(registry.get("bed"))
+        self.assertEqual(len(registry), 1)
+        self.assertIn("tool1", registry)
+
+    def test_state_converts_non_string_names(self):
+        """Test non-string keys map onto the string-named state."""
+        registry = HeaterRegistry()
+        self.assertIs(registry.state(5), registry.state("5"))
+        self.assertEqual(len(registry), 1)
+
+    def test_field_view_reads_and_writes_states(self):
+        """Test the view lists heaters whose field is set and writes through."""
+        registry = HeaterRegistry()
+        registry.state("bed").last_target = 60.0
+        registry.state("tool0")
+        view = registry.field("last_target")
+
+        self.assertEqual(dict(view), {"bed": 60.0})
+        self.assertNotIn("tool0", view)
+        self.assertIsNone(view.get("tool0"))
+        with self.assertRaises(KeyError):
+            view["tool0"]  # pylint: disable=pointless-statement
+
+        view["chamber"] = 40.0
+        self.assertEqual(registry.state("chamber").last_target, 40.0)
+        self.assertEqual(view.pop("bed"), 60.0)
+        self.assertIsNone(registry.state("bed").last_target)
+        self.assertEqual(view, {"chamber": 40.0})
+
+    def test_assign_replaces_field_on_all_heaters(self):
+        """Test assign() clears heaters missing from the new mapping."""
+        registry = HeaterRegistry()
+        registry.field("history").update({"bed": [1], "tool0": [2]})
+        registry.state("tool0").last_target = 200.0
+
+        registry.assign("history", {"tool1": [3]})
+        self.assertEqual(dict(registry.field("history")), {"tool1": [3]})
+        self.assertEqual(registry.state("tool0").last_target, 200.0)
+
+        registry.assign("history", {})
+        self.assertEqual(len(registry.field("history")), 0)
+
+    def test_field_view_rejects_unknown_fields(self):
+        """Test views are only available for state fields."""
+        registry = HeaterRegistry()
+        with self.assertRaises(ValueError):
+            registry.field("name")
+        with self.assertRaises(ValueError):
+            registry.field("nope")
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
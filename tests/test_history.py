@@ -0,0 +1,230 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the history module."""
+
+import math
+from collections import deque
+from unittest import TestCase
+
+from octoprint_temp_eta import calculator
+from octoprint_temp_eta.history import HeaterHistory
+
+try:
+    from hypothesis import given, settings
+    from hypothesis import strategies as st
+except ImportError:  # pragma: no cover - hypothesis is a develop dependency
+    given = None  # type: ignore
+
+
+class TestHeaterHistory(TestCase):
+    """Test cases for the HeaterHistory ring buffer."""
+
+    def test_behaves_like_bounded_deque(self):
+        """Test append/len/iteration/indexing match deque(maxlen=...)."""
+        history = HeaterHistory(maxlen=4)
+        reference = deque(maxlen=4)
+        for i in range(11):
+            row = (float(i), 20.0 + i, 200.0)
+            history.append(row)
+            reference.append(row)
+            self.assertEqual(list(history), list(reference))
+            self.assertEqual(history[0], reference[0])
+            self.assertEqual(history[-1], reference[-1])
+            self.assertEqual(list(reversed(history)), list(reversed(reference)))
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history.appended, 11)
+
+    def test_cooldown_rows_have_two_fields(self):
+        """Test two-field rows for cooldown history unpack as (ts, temp)."""
+        history = HeaterHistory(maxlen=3, fields=2)
+        history.append((1.0, 80.0))
+        history.append((2.0, 79.0))
+        self.assertEqual([temp for _, temp in history], [80.0, 79.0])
+
+    def test_index_out_of_range(self):
+        """Test invalid indexes raise IndexError."""
+        history = HeaterHistory(maxlen=3)
+        with self.assertRaises(IndexError):
+            _ = history[0]
+        history.append((1.0, 2.0, 3.0))
+        with self.assertRaises(IndexError):
+            _ = history[-2]
+
+    def test_invalid_maxlen(self):
+        """Test non-positive capacities are rejected."""
+        with self.assertRaises(ValueError):
+            HeaterHistory(maxlen=0)
+        with self.assertRaises(ValueError):
+            HeaterHistory(maxlen=3).resize(0)
+
+    def test_clear_keeps_appended_counter(self):
+        """Test clear empties the buffer but keeps counting appends."""
+        history = HeaterHistory(maxlen=3, rows=[(1.0, 2.0, 3.0), (2.0, 3.0, 4.0)])
+        history.clear()
+        self.assertFalse(history)
+        self.assertEqual(history.appended, 2)
+        history.append((5.0, 6.0, 7.0))
+        self.assertEqual(list(history), [(5.0, 6.0, 7.0)])
+
+    def test_resize_keeps_newest_rows(self):
+        """Test shrinking and growing keep the newest samples in order."""
+        history = HeaterHistory(
+            maxlen=5, rows=[(float(i), float(i), 0.0) for i in range(8)]
+        )
+        history.resize(2)
+        self.assertEqual(history.maxlen, 2)
+        self.assertEqual(list(history), [(6.0, 6.0, 0.0), (7.0, 7.0, 0.0)])
+        history.resize(4)
+        history.append((8.0, 8.0, 0.0))
+        self.assertEqual([row[0] for row in history], [6.0, 7.0, 8.0])
+        self.assertEqual(history.appended, 9)
+
+    def test_window_returns_contiguous_view_after_wrap(self):
+        """Test window() yields a zero-copy view even when the ring wrapped."""
+        history = HeaterHistory(maxlen=4)
+        for i in range(7):
+            history.append((float(i), 10.0 * i, 50.0))
+        view = history.window(4.0)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.tolist(), [5.0, 50.0, 50.0, 6.0, 60.0, 50.0])
+        self.assertEqual(len(history.window(100.0)), 0)
+        self.assertEqual(len(history.rows()), 12)
+
+    def test_append_rejects_out_of_order_timestamps(self):
+        """Test rows older than the newest one or with a NaN ts are refused."""
+        history = HeaterHistory(maxlen=4)
+        self.assertTrue(history.append((2.0, 20.0, 200.0)))
+        self.assertTrue(history.append((2.0, 21.0, 200.0)))
+        self.assertFalse(history.append((1.5, 22.0, 200.0)))
+        self.assertFalse(history.append((float("nan"), 22.0, 200.0)))
+        self.assertFalse(history.append((float("inf"), 22.0, 200.0)))
+        self.assertTrue(history.append((3.0, float("nan"), 200.0)))
+        self.assertEqual([row[0] for row in history], [2.0, 2.0, 3.0])
+        self.assertEqual(history.rejected, 3)
+        self.assertEqual(history.appended, 3)
+        history.clear()
+        self.assertTrue(history.append((1.0, 20.0, 200.0)))
+
+    def test_bisect_and_last(self):
+        """Test bisect finds the first row newer than the cutoff after a wrap."""
+        history = HeaterHistory(maxlen=5, fields=2)
+        self.assertIsNone(history.last())
+        self.assertEqual(history.bisect(0.0), 0)
+        for ts in (1.0, 2.0, 2.0, 3.0, 4.0, 4.0, 5.0):
+            history.append((ts, ts * 10.0))
+        # Rows are now ts 2, 3, 4, 4, 5.
+        self.assertEqual(history.last(), (5.0, 50.0))
+        self.assertEqual(history.bisect(0.0), 0)
+        self.assertEqual(history.bisect(2.0), 1)
+        self.assertEqual(history.bisect(3.5), 2)
+        self.assertEqual(history.bisect(4.0), 4)
+        self.assertEqual(history.bisect(5.0), 5)
+
+    def test_rolling_fit_syncs_by_append_counter(self):
+        """Test RollingFit tracks HeaterHistory across wraps, clears and resizes."""
+        history = HeaterHistory(maxlen=20)
+        fit = calculator.RollingFit()
+        temp = 20.0
+        for i in range(120):
+            temp += (200.0 - temp) * 0.02
+            history.append((float(i) * 0.5, temp, 200.0))
+            if i == 60:
+                history.clear()
+            if i == 90:
+                history.resize(8)
+            fit.sync(history)
+            self.assertEqual(
+                calculator.calculate_linear_eta(history, 200.0),
+                calculator.calculate_linear_eta_from_fit(fit, 200.0),
+            )
+            expected = calculator.calculate_exponential_eta(history, 200.0)
+            actual = calculator.calculate_exponential_eta_from_fit(fit, 200.0)
+            if expected is None or actual is None:
+                self.assertEqual(expected, actual)
+            else:
+                self.assertAlmostEqual(expected, actual, places=6)
+
+
+if given is not None:
+    _TIMESTAMPS = st.floats(min_value=0.0, max_value=60.0).map(lambda ts: round(ts, 1))
+    _TEMPS = st.one_of(st.floats(min_value=20.0, max_value=250.0), st.just(float("nan")))
+    # Shuffled samples with duplicated timestamps and occasional NaN readings.
+    _SAMPLES = st.lists(st.tuples(_TIMESTAMPS, _TEMPS), max_size=80).flatmap(
+        lambda rows: st.permutations(rows + rows[: len(rows) // 3])
+    )
+    _WINDOWS = st.sampled_from([0.5, 5.0, 10.0, 30.0, 120.0])
+    _DEFAULT_BACKEND = calculator.BACKEND
+
+    class TestHeaterHistoryOrdering(TestCase):
+        """Property tests for time-ordered ingest and bisect window extraction."""
+
+        @given(_SAMPLES)
+        @settings(max_examples=200, deadline=None)
+        def test_keeps_non_decreasing_subsequence(self, samples):
+            """Test append keeps exactly the rows not older than the newest kept one."""
+            history = HeaterHistory(maxlen=32, fields=2)
+            kept = []
+            for row in samples:
+                if not kept or row[0] >= kept[-1][0]:
+                    kept.append(row)
+                history.append(row)
+            expected = kept[-32:]
+            self.assertEqual(len(history), len(expected))
+            for (ts, temp), (exp_ts, exp_temp) in zip(history, expected):
+                self.assertEqual(ts, exp_ts)
+                self.assertTrue(temp == exp_temp or (math.isnan(temp) and math.isnan(exp_temp)))
+            self.assertEqual(history.rejected, len(samples) - len(kept))
+
+        @given(_SAMPLES, _WINDOWS)
+        @settings(max_examples=200, deadline=None)
+        def test_window_matches_filter_recent(self, samples, window):
+            """Test the bisect window equals _find_last_ts + _filter_recent."""
+            history = HeaterHistory(maxlen=48, fields=2)
+            for row in samples:
+                history.append(row)
+            rows = list(history)
+            last_ts = calculator._find_last_ts(rows)
+            expected = None if last_ts is None else calculator._filter_recent(rows, last_ts - window)
+            self.assertEqual(calculator._recent_rows(history, window), expected)
+            self.assertEqual(calculator._recent_rows(rows, window), expected)
+
+        @given(_SAMPLES, _WINDOWS)
+        @settings(max_examples=100, deadline=None)
+        def test_calculators_match_plain_rows(self, samples, window):
+            """Test every calculator returns the same ETA for a HeaterHistory and its rows."""
+            cooldown = HeaterHistory(maxlen=48, fields=2)
+            heating = HeaterHistory(maxlen=48)
+            for ts, temp in samples:
+                cooldown.append((ts, temp))
+                heating.append((ts, temp, 250.0))
+            calls = (
+                ("calculate_linear_eta", heating, (255.0, window)),
+                ("calculate_exponential_eta", heating, (255.0, window)),
+                ("calculate_cooldown_linear_eta", cooldown, (15.0, window)),
+                ("calculate_cooldown_exponential_eta", cooldown, (10.0, 15.0, window)),
+            )
+            try:
+                for backend in calculator.available_backends():
+                    calculator.use_backend(backend)
+                    for name, history, args in calls:
+                        func = getattr(calculator, name)
+                        expected = func(list(history), *args)
+                        actual = func(history, *args)
+                        if expected is None or actual is None:
+                            self.assertEqual(actual, expected, (backend, name))
+                        else:
+                            self.assertAlmostEqual(actual, expected, delta=1e-9 * max(1.0, abs(expected)), msg=(backend, name))
+                    result = calculator.calculate_batch(
+                        {"tool0": heating, "tool1": list(heating)},
+                        {"tool0": 255.0, "tool1": 255.0},
+                        {"algorithm": "exponential", "exponential_window_seconds": window},
+                    )
+                    self.assertEqual(result["tool0"], result["tool1"], backend)
+            finally:
+                calculator.use_backend(_DEFAULT_BACKEND)
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
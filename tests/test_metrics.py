@@ -0,0 +1,85 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the metrics module."""
+
+from unittest import TestCase
+
+from octoprint_temp_eta.metrics import LatencyHistogram, MetricsRegistry, timed
+
+
+class TestLatencyHistogram(TestCase):
+    """Test cases for the fixed-bucket latency histogram."""
+
+    def test_empty_snapshot(self):
+        """Test an unused histogram reports a zero count and no latencies."""
+        snapshot = LatencyHistogram().snapshot()
+        self.assertEqual(snapshot["count"], 0)
+        self.assertIsNone(snapshot["p99_ms"])
+
+    def test_percentiles_within_bucket_resolution(self):
+        """Test percentiles land within one bucket (25%) of the true value."""
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i * 1e-5)  # 0.01 ms .. 10 ms
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 1000)
+        self.assertAlmostEqual(snapshot["max_ms"], 10.0)
+        self.assertAlmostEqual(snapshot["mean_ms"], 5.005)
+        for key, expected in (("p50_ms", 5.0), ("p95_ms", 9.5), ("p99_ms", 9.9)):
+            self.assertGreaterEqual(snapshot[key], expected)
+            self.assertLessEqual(snapshot[key], expected * 1.25)
+
+    def test_outliers_and_reset(self):
+        """Test samples beyond the last bucket report the exact max."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(60.0)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["p99_ms"], 60000.0)
+        self.assertLessEqual(snapshot["p50_ms"], 0.001)
+        histogram.reset()
+        self.assertEqual(histogram.snapshot()["count"], 0)
+
+
+class TestMetricsRegistry(TestCase):
+    """Test cases for named histograms and the timed decorator."""
+
+    def test_timed_records_calls_and_exceptions(self):
+        """Test every decorated call is counted, including failing ones."""
+
+        class Stage:
+            def __init__(self):
+                self._metrics = MetricsRegistry()
+
+            @timed("stage.run")
+            def run(self, fail=False):
+                if fail:
+                    raise ValueError("boom")
+                return 42
+
+        stage = Stage()
+        self.assertEqual(stage.run(), 42)
+        with self.assertRaises(ValueError):
+            stage.run(fail=True)
+        snapshot = stage._metrics.snapshot()
+        self.assertEqual(list(snapshot), ["stage.run"])
+        self.assertEqual(snapshot["stage.run"]["count"], 2)
+
+        stage._metrics.reset()
+        self.assertEqual(stage._metrics.snapshot()["stage.run"]["count"], 0)
+
+    def test_timed_without_registry_is_passthrough(self):
+        """Test objects lacking a registry still work."""
+
+        class Bare:
+            @timed("bare")
+            def run(self):
+                return "ok"
+
+        self.assertEqual(Bare().run(), "ok")
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
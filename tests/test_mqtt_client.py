@@ -5,14 +5,17 @@ Tests MQTT connection management, message publishing, and state transitions.
 
 from __future__ import annotations
 
+import json
+import random
 import ssl
+import threading
 import time
-from typing import Any
+from typing import Any, Iterator
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from octoprint_temp_eta.mqtt_client import MQTTClientWrapper
+from octoprint_temp_eta.mqtt_client import MQTTClientWrapper, ReconnectBackoff
 
 
 class DummyLogger:
@@ -62,9 +65,9 @@ class MQTTClientWrapperHarness(MQTTClientWrapper):
         with self._lock:
             self._schedule_connect()
 
-    def run_connect_thread(self) -> None:
-        """Execute the internal connect thread body synchronously."""
-        self._connect_thread()
+    def run_connect_once(self) -> None:
+        """Execute one connection attempt synchronously."""
+        self._connect_once()
 
     def run_on_connect(self, rc: Any, v2: bool = False) -> None:
         """
@@ -101,9 +104,15 @@ def fixture_test_logger() -> DummyLogger:
 
 
 @pytest.fixture(name="wrapper")
-def fixture_wrapper(test_logger: DummyLogger) -> MQTTClientWrapperHarness:
-    """Create a testable MQTT wrapper instance."""
-    return MQTTClientWrapperHarness(test_logger, "temp_eta")
+def fixture_wrapper(test_logger: DummyLogger) -> Iterator[MQTTClientWrapperHarness]:
+    """Create a testable MQTT wrapper instance.
+
+    Tests that enable MQTT start the connection manager thread, which is
+    stopped again on teardown.
+    """
+    wrapper = MQTTClientWrapperHarness(test_logger, "temp_eta")
+    yield wrapper
+    wrapper.disconnect()
 
 
 def test_mqtt_wrapper_initialization(wrapper: MQTTClientWrapperHarness) -> None:
@@ -165,11 +174,15 @@ def test_mqtt_configure_enabled_with_host(
         "mqtt_publish_interval": 1.0,
     }
 
-    wrapper.configure(settings)
-    time.sleep(0.1)
+    try:
+        wrapper.configure(settings)
+        time.sleep(0.1)
 
-    assert wrapper.get_internal_state("enabled")
-    assert wrapper.get_internal_state("broker_host") == "test-broker"
+        assert wrapper.get_internal_state("enabled")
+        assert wrapper.get_internal_state("broker_host") == "test-broker"
+        assert mock_client.connect.called
+    finally:
+        wrapper.disconnect()
 
 
 def test_mqtt_publish_eta_update_disabled(
@@ -225,6 +238,7 @@ def test_mqtt_publish_eta_update_connected(
     )
 
     assert mock_client.publish.called
+    assert wrapper.get_metrics()["mqtt.publish_eta_update"]["count"] == 1
 
 
 @patch("octoprint_temp_eta.mqtt_client.mqtt")
@@ -243,8 +257,7 @@ def test_mqtt_state_transition_detection(
         connected=True,
         client=mock_client,
         base_topic="test/topic",
-        last_published_time=0.0,
-    )
+            )
 
     mock_result = MagicMock()
     mock_result.rc = 0
@@ -254,12 +267,12 @@ def test_mqtt_state_transition_detection(
         heater="bed", eta=120.0, eta_kind="heating", target=60.0, actual=40.0
     )
 
-    wrapper.set_internal_state(last_published_time=0.0)
+    wrapper.set_internal_state(last_published_by_heater={})
     wrapper.publish_eta_update(
         heater="bed", eta=115.0, eta_kind="heating", target=60.0, actual=42.0
     )
 
-    wrapper.set_internal_state(last_published_time=0.0)
+    wrapper.set_internal_state(last_published_by_heater={})
     wrapper.publish_eta_update(
         heater="bed", eta=None, eta_kind=None, target=60.0, actual=60.0
     )
@@ -291,7 +304,8 @@ def test_mqtt_publish_interval_throttling(wrapper: MQTTClientWrapperHarness) ->
         connected=True,
         client=mock_client,
         publish_interval=1.0,
-        last_published_time=time.time(),
+        last_published_by_heater={"bed": time.time()},
+        last_heater_state={"bed": "heating"},
     )
 
     wrapper.publish_eta_update(
@@ -501,18 +515,134 @@ def test_mqtt_schedule_connect_logs_when_mqtt_unavailable(
     assert any("MQTT support disabled" in msg for msg in test_logger.warning_calls)
 
 
-def test_mqtt_connect_thread_respects_retry_interval(
-    wrapper: MQTTClientWrapperHarness,
+def test_mqtt_reconnect_backoff_grows_with_jitter() -> None:
+    """Delays are drawn from a doubling window capped at the maximum."""
+    backoff = ReconnectBackoff(1.0, 10.0, rng=random.Random(7))
+
+    delays = [backoff.next_delay() for _ in range(6)]
+
+    for failures, delay in enumerate(delays, start=1):
+        assert 1.0 <= delay <= min(10.0, 2.0**failures)
+    assert len(set(delays)) == len(delays)
+    assert backoff.failures == 6
+
+    backoff.reset()
+    assert backoff.failures == 0
+    assert backoff.next_delay() <= 2.0
+
+
+@patch("octoprint_temp_eta.mqtt_client.mqtt")
+def test_mqtt_failed_connect_schedules_backoff(
+    mock_mqtt: Mock, wrapper: MQTTClientWrapperHarness
 ) -> None:
-    """Connect thread should early-return when inside retry interval."""
-    wrapper.set_internal_state(connect_retry_interval=30.0)
+    """A failed attempt is counted and the next one waits for the backoff."""
+    mock_client = MagicMock()
+    mock_client.connect.side_effect = OSError("refused")
+    mock_mqtt.Client.return_value = mock_client
+    mock_mqtt.CallbackAPIVersion.VERSION2 = object()
+    wrapper.set_internal_state(enabled=True, broker_host="broker", broker_port=1883)
 
-    with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.set_internal_state(last_connect_attempt=80.0)
-        wrapper.run_connect_thread()
+    wrapper.run_connect_once()
 
+    stats = wrapper.get_connection_stats()
+    assert stats["connect_attempts"] == 1
+    assert stats["connect_failures"] == 1
+    assert stats["backoff_failures"] == 1
+    delay = wrapper.get_internal_state("next_attempt_at") - time.monotonic()
+    assert 0.0 < delay <= 2.0
     assert wrapper.get_internal_state("client") is None
-    assert wrapper.get_internal_state("connected") is False
+
+
+def _wait_for(predicate: Any, timeout: float = 5.0) -> bool:
+    """Poll *predicate* until it is true or *timeout* expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+@patch("octoprint_temp_eta.mqtt_client.mqtt")
+def test_mqtt_connection_manager_reconnects_with_backoff(
+    mock_mqtt: Mock, wrapper: MQTTClientWrapperHarness
+) -> None:
+    """One manager thread retries failed attempts and reconnects after a drop."""
+    mock_client = MagicMock()
+    attempts: list[str] = []
+
+    def connect(*_args: Any, **_kwargs: Any) -> None:
+        attempts.append(threading.current_thread().name)
+        if len(attempts) == 1:
+            raise OSError("broker restarting")
+        wrapper.run_on_connect(rc=0)
+
+    mock_client.connect.side_effect = connect
+    mock_mqtt.Client.return_value = mock_client
+    mock_mqtt.CallbackAPIVersion.VERSION2 = object()
+    wrapper.set_internal_state(backoff=ReconnectBackoff(0.01, 0.02))
+
+    try:
+        wrapper.configure({"mqtt_enabled": True, "mqtt_broker_host": "broker"})
+        assert _wait_for(wrapper.is_connected)
+
+        # Broker goes away: the manager, not paho, reconnects.
+        wrapper.run_on_disconnect(rc=7)
+        assert _wait_for(lambda: wrapper.get_connection_stats()["reconnects"] == 1)
+    finally:
+        wrapper.disconnect()
+
+    stats = wrapper.get_connection_stats()
+    assert stats["connect_attempts"] == 3
+    assert stats["connect_failures"] == 2
+    assert stats["disconnects"] == 1
+    assert stats["backoff_failures"] == 0
+    assert set(attempts) == {"temp_eta-mqtt-connect"}
+    assert wrapper.get_internal_state("manager_thread") is None
+
+
+def test_mqtt_offline_buffer_flushes_on_reconnect(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """While offline, the latest ETA per topic and all events are kept."""
+    mock_client = MagicMock()
+    mock_client.publish.return_value = MagicMock(rc=0)
+    wrapper.set_internal_state(
+        enabled=True,
+        connected=False,
+        broker_host="broker",
+        base_topic="t",
+        publish_interval=0.0,
+        client=mock_client,
+    )
+
+    wrapper.publish_eta_update(
+        heater="bed", eta=120.0, eta_kind="heating", target=60.0, actual=40.0
+    )
+    wrapper.publish_eta_update(
+        heater="bed", eta=30.0, eta_kind="cooling", target=0.0, actual=50.0
+    )
+    assert wrapper.get_connection_stats()["offline_buffer"]["depth"] == 3
+    assert not mock_client.publish.called
+
+    wrapper._on_connect(mock_client, None, {}, 0)
+
+    published = [
+        (c.args[0], json.loads(c.args[1])) for c in mock_client.publish.call_args_list
+    ]
+    assert [topic for topic, _ in published] == [
+        "t/bed/eta",
+        "t/bed/state_change",
+        "t/bed/state_change",
+    ]
+    assert published[0][1]["eta_seconds"] == 30.0
+    assert [payload["state"] for _, payload in published[1:]] == [
+        "heating",
+        "cooling",
+    ]
+    buffer_stats = wrapper.get_connection_stats()["offline_buffer"]
+    assert buffer_stats["depth"] == 0
+    assert buffer_stats["coalesced"] == 1
 
 
 @patch("octoprint_temp_eta.mqtt_client.mqtt")
@@ -537,12 +667,11 @@ def test_mqtt_connect_thread_falls_back_to_paho_v1_api(
         enabled=True,
         broker_host="broker",
         broker_port=1883,
-        connect_retry_interval=0.0,
         last_connect_attempt=0.0,
     )
 
     with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.run_connect_thread()
+        wrapper.run_connect_once()
 
     assert any("falling back to 1.x API" in msg for msg in test_logger.debug_calls)
     assert wrapper._callback_api_v2 is False
@@ -565,11 +694,10 @@ def test_mqtt_connect_thread_tls_insecure(
         broker_port=8883,
         use_tls=True,
         tls_insecure=True,
-        connect_retry_interval=0.0,
     )
 
     with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.run_connect_thread()
+        wrapper.run_connect_once()
 
     mock_client.tls_set.assert_called_with(cert_reqs=ssl.CERT_NONE)
     mock_client.tls_insecure_set.assert_called_with(True)
@@ -590,11 +718,10 @@ def test_mqtt_connect_thread_tls_secure(
         broker_port=8883,
         use_tls=True,
         tls_insecure=False,
-        connect_retry_interval=0.0,
     )
 
     with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.run_connect_thread()
+        wrapper.run_connect_once()
 
     mock_client.tls_set.assert_called_with(cert_reqs=ssl.CERT_REQUIRED)
 
@@ -615,12 +742,11 @@ def test_mqtt_connect_thread_handles_connect_error(
         enabled=True,
         broker_host="broker",
         broker_port=1883,
-        connect_retry_interval=0.0,
         connecting=True,
     )
 
     with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.run_connect_thread()
+        wrapper.run_connect_once()
 
     assert any("MQTT connection failed" in msg for msg in test_logger.error_calls)
     assert wrapper.get_internal_state("connected") is False
@@ -672,8 +798,7 @@ def test_mqtt_publish_eta_update_sets_cooled_down_state(
         connected=True,
         client=mock_client,
         base_topic="test/topic",
-        last_published_time=0.0,
-        publish_interval=0.0,
+                publish_interval=0.0,
     )
 
     mock_result = MagicMock()
@@ -723,11 +848,10 @@ def test_mqtt_connect_thread_disconnects_existing_client(
         broker_host="broker",
         broker_port=1883,
         client=old_client,
-        connect_retry_interval=0.0,
     )
 
     with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.run_connect_thread()
+        wrapper.run_connect_once()
 
     assert old_client.disconnect.called
     assert wrapper.get_internal_state("client") is new_client
@@ -748,11 +872,10 @@ def test_mqtt_connect_thread_cleanup_ignores_loop_stop_errors(
         enabled=True,
         broker_host="broker",
         broker_port=1883,
-        connect_retry_interval=0.0,
     )
 
     with patch("octoprint_temp_eta.mqtt_client.time.time", lambda: 100.0):
-        wrapper.run_connect_thread()
+        wrapper.run_connect_once()
 
     assert wrapper.get_internal_state("client") is None
 
@@ -883,8 +1006,7 @@ def test_mqtt_publish_eta_update_sets_cooling_state(
         connected=True,
         client=mock_client,
         base_topic="test/topic",
-        last_published_time=0.0,
-        publish_interval=0.0,
+                publish_interval=0.0,
     )
 
     mock_result = MagicMock()
@@ -909,3 +1031,298 @@ def test_mqtt_publish_message_returns_when_not_connected(
     """_publish_message should no-op if there is no client or no connection."""
     wrapper.set_internal_state(connected=False, client=None)
     wrapper.publish_message("topic", {"k": "v"})
+
+
+def test_mqtt_publish_eta_update_goes_through_publisher_thread(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """With MQTT enabled, messages are sent from the publisher thread."""
+    mock_client = MagicMock()
+    mock_result = MagicMock()
+    mock_result.rc = 0
+    mock_client.publish.return_value = mock_result
+    threads: list[str] = []
+    mock_client.publish.side_effect = lambda *_a, **_k: (
+        threads.append(threading.current_thread().name) or mock_result
+    )
+
+    wrapper.configure({"mqtt_enabled": True, "mqtt_publish_interval": 0.0})
+    wrapper.set_internal_state(
+        connected=True, client=mock_client, base_topic="test/topic"
+    )
+    try:
+        wrapper.publish_eta_update(
+            heater="bed", eta=120.0, eta_kind="heating", target=60.0, actual=40.0
+        )
+        assert wrapper.get_internal_state("queue").flush(2.0)
+    finally:
+        wrapper.disconnect()
+
+    topics = [c.args[0] for c in mock_client.publish.call_args_list]
+    assert topics == ["test/topic/bed/eta", "test/topic/bed/state_change"]
+    assert threads == ["temp_eta-mqtt", "temp_eta-mqtt"]
+    stats = wrapper.get_queue_stats()
+    assert stats["published"] == 2
+    assert stats["running"] is False
+    assert wrapper.get_metrics()["mqtt.send"]["count"] == 2
+
+
+def _connected_wrapper(
+    wrapper: MQTTClientWrapperHarness, topic_mode: str = "per_heater"
+) -> MagicMock:
+    """Put the wrapper into a connected state with a mock client."""
+    mock_client = MagicMock()
+    mock_result = MagicMock()
+    mock_result.rc = 0
+    mock_client.publish.return_value = mock_result
+    wrapper.set_internal_state(
+        enabled=True,
+        connected=True,
+        client=mock_client,
+        base_topic="test/topic",
+        publish_interval=1.0,
+        topic_mode=topic_mode,
+    )
+    return mock_client
+
+
+_BATCH = {
+    "bed": {"eta": 120.0, "eta_kind": "heating", "target": 60.0, "actual": 40.0},
+    "tool0": {"eta": 60.0, "eta_kind": "heating", "target": 200.0, "actual": 90.0},
+}
+
+
+def test_mqtt_publish_eta_batch_throttles_each_heater(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """Every heater of a tick is published; each has its own interval."""
+    mock_client = _connected_wrapper(wrapper)
+
+    wrapper.publish_eta_batch(_BATCH)
+    eta_topics = [
+        c.args[0] for c in mock_client.publish.call_args_list if c.args[0].endswith("/eta")
+    ]
+    assert eta_topics == ["test/topic/bed/eta", "test/topic/tool0/eta"]
+
+    mock_client.publish.reset_mock()
+    wrapper.publish_eta_batch(_BATCH)
+    assert not mock_client.publish.called
+
+    # A heater seen for the first time is not held back by the others.
+    wrapper.publish_eta_batch({"chamber": {"eta": None, "target": 0.0, "actual": 25.0}})
+    topics = [c.args[0] for c in mock_client.publish.call_args_list]
+    assert topics == ["test/topic/chamber/eta"]
+
+
+def test_mqtt_send_queued_publishes_outside_the_lock(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """Encoding and client.publish run without holding the wrapper lock."""
+    mock_client = _connected_wrapper(wrapper)
+    lock = wrapper.get_internal_state("lock")
+    lock_free: list[bool] = []
+
+    def _publish(*_args: Any, **_kwargs: Any) -> MagicMock:
+        acquired = lock.acquire(blocking=False)
+        if acquired:
+            lock.release()
+        lock_free.append(acquired)
+        return MagicMock(rc=0)
+
+    mock_client.publish.side_effect = _publish
+
+    wrapper._send_queued("test/topic/bed/eta", {"heater": "bed"})
+    assert lock_free == [True]
+
+
+def test_mqtt_send_queued_rebuffers_when_client_replaced(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """A send that fails because the client was swapped is not lost."""
+    old_client = _connected_wrapper(wrapper)
+    new_client = MagicMock()
+    new_client.publish.return_value = MagicMock(rc=0)
+
+    def _replaced(*_args: Any, **_kwargs: Any) -> MagicMock:
+        wrapper.set_internal_state(client=new_client, connected=False)
+        return MagicMock(rc=4)
+
+    old_client.publish.side_effect = _replaced
+
+    wrapper._send_queued("test/topic/bed/eta", {"heater": "bed"})
+    assert wrapper.get_connection_stats()["offline_buffer"]["depth"] == 1
+
+    wrapper._on_connect(new_client, None, {}, 0)
+    topics = [c.args[0] for c in new_client.publish.call_args_list]
+    assert topics == ["test/topic/bed/eta"]
+
+
+def test_mqtt_publish_eta_batch_combined_topic(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """Combined mode sends every heater in one <base>/all/eta message."""
+    mock_client = _connected_wrapper(wrapper, topic_mode="combined")
+    wrapper.set_internal_state(last_heater_state={"bed": "heating", "tool0": "heating"})
+
+    wrapper.publish_eta_batch(_BATCH)
+    wrapper.publish_eta_batch(_BATCH)
+
+    assert mock_client.publish.call_count == 1
+    topic, body = mock_client.publish.call_args.args
+    assert topic == "test/topic/all/eta"
+    document = json.loads(body)
+    assert set(document["heaters"]) == {"bed", "tool0"}
+    assert document["heaters"]["tool0"]["eta_seconds"] == 60.0
+
+
+def test_mqtt_publish_eta_batch_both_topic_modes(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """Mode "both" publishes the per-heater and the combined topics."""
+    mock_client = _connected_wrapper(wrapper, topic_mode="both")
+    wrapper.set_internal_state(last_heater_state={"bed": "heating", "tool0": "heating"})
+
+    wrapper.publish_eta_batch(_BATCH)
+
+    topics = [c.args[0] for c in mock_client.publish.call_args_list]
+    assert topics == ["test/topic/bed/eta", "test/topic/tool0/eta", "test/topic/all/eta"]
+
+
+def test_mqtt_configure_topic_mode(wrapper: MQTTClientWrapperHarness) -> None:
+    """Unknown topic modes fall back to per-heater topics."""
+    wrapper.configure({"mqtt_topic_mode": "combined"})
+    assert wrapper.get_internal_state("topic_mode") == "combined"
+    wrapper.configure({"mqtt_topic_mode": "everything"})
+    assert wrapper.get_internal_state("topic_mode") == "per_heater"
+
+
+def test_mqtt_topic_table_follows_base_topic(
+    wrapper: MQTTClientWrapperHarness,
+) -> None:
+    """Topics are built once per heater and rebuilt when the base changes."""
+    mock_client = _connected_wrapper(wrapper, topic_mode="both")
+
+    wrapper.publish_eta_batch(_BATCH)
+    table = wrapper.get_internal_state("topic_table")
+    assert table["bed"] == ("test/topic/bed/eta", "test/topic/bed/state_change")
+    assert table[None][0] == "test/topic/all/eta"
+    bed_topic = table["bed"][0]
+
+    wrapper.set_internal_state(last_published_by_heater={}, last_combined_time=0.0)
+    wrapper.publish_eta_batch(_BATCH)
+    assert wrapper.get_internal_state("topic_table")["bed"][0] is bed_topic
+
+    wrapper.configure(
+        {
+            "mqtt_base_topic": "other",
+            "mqtt_use_appearance_name": False,
+            "mqtt_publish_interval": 0.0,
+        }
+    )
+    wrapper.set_internal_state(enabled=True, connected=True, client=mock_client)
+    mock_client.publish.reset_mock()
+    wrapper.publish_eta_batch({"bed": _BATCH["bed"]})
+    topics = {c.args[0] for c in mock_client.publish.call_args_list}
+    assert topics == {"other/bed/eta"}
+
+
+def test_mqtt_deadbands_suppress_insignificant_updates(
+    monkeypatch: pytest.MonkeyPatch, wrapper: MQTTClientWrapperHarness
+) -> None:
+    """Only significant changes and heartbeats are published with deadbands."""
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(time, "time", lambda: clock["now"])
+    mock_client = _connected_wrapper(wrapper)
+    wrapper.set_internal_state(
+        eta_deadband_s=5.0, actual_deadband_c=1.0, heartbeat_interval=60.0
+    )
+
+    def publish(eta: float, actual: float) -> list[str]:
+        mock_client.publish.reset_mock()
+        wrapper.publish_eta_batch(
+            {"bed": {"eta": eta, "eta_kind": "heating", "target": 60.0, "actual": actual}}
+        )
+        return [c.args[0] for c in mock_client.publish.call_args_list]
+
+    assert publish(100.0, 40.0) == ["test/topic/bed/eta", "test/topic/bed/state_change"]
+    clock["now"] += 2.0
+    assert publish(98.0, 40.5) == []
+    clock["now"] += 2.0
+    assert publish(94.0, 40.8) == ["test/topic/bed/eta"]
+    clock["now"] += 1.0
+    assert publish(93.5, 42.0) == ["test/topic/bed/eta"]
+    clock["now"] += 61.0
+    assert publish(93.5, 42.0) == ["test/topic/bed/eta"]
+
+
+def test_mqtt_eta_deadband_alone_ignores_noisy_actual(
+    monkeypatch: pytest.MonkeyPatch, wrapper: MQTTClientWrapperHarness
+) -> None:
+    """A deadband of 0 does not gate when only the other deadband is set."""
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(time, "time", lambda: clock["now"])
+    mock_client = _connected_wrapper(wrapper)
+    wrapper.set_internal_state(
+        eta_deadband_s=5.0, actual_deadband_c=0.0, heartbeat_interval=60.0
+    )
+
+    def publish(eta: float, actual: float) -> list[str]:
+        mock_client.publish.reset_mock()
+        wrapper.publish_eta_batch(
+            {"bed": {"eta": eta, "eta_kind": "heating", "target": 60.0, "actual": actual}}
+        )
+        return [c.args[0] for c in mock_client.publish.call_args_list]
+
+    assert publish(100.0, 40.0) == ["test/topic/bed/eta", "test/topic/bed/state_change"]
+    for eta, actual in ((99.0, 40.1), (98.0, 39.9), (97.0, 40.2), (96.5, 40.0)):
+        clock["now"] += 2.0
+        assert publish(eta, actual) == []
+    clock["now"] += 2.0
+    assert publish(94.0, 40.1) == ["test/topic/bed/eta"]
+
+    # The other way round: only the temperature deadband gates.
+    wrapper.set_internal_state(eta_deadband_s=0.0, actual_deadband_c=1.0)
+    clock["now"] += 2.0
+    assert publish(80.0, 40.5) == []
+    clock["now"] += 2.0
+    assert publish(78.0, 41.5) == ["test/topic/bed/eta"]
+
+
+def test_mqtt_state_change_publishes_immediately(
+    monkeypatch: pytest.MonkeyPatch, wrapper: MQTTClientWrapperHarness
+) -> None:
+    """A state transition bypasses the throttle and the deadbands."""
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(time, "time", lambda: clock["now"])
+    mock_client = _connected_wrapper(wrapper, topic_mode="both")
+    wrapper.set_internal_state(eta_deadband_s=30.0, actual_deadband_c=5.0)
+
+    wrapper.publish_eta_batch(
+        {"bed": {"eta": 10.0, "eta_kind": "heating", "target": 60.0, "actual": 58.0}}
+    )
+    mock_client.publish.reset_mock()
+    clock["now"] += 0.2
+    wrapper.publish_eta_batch(
+        {"bed": {"eta": None, "eta_kind": None, "target": 60.0, "actual": 59.5}}
+    )
+
+    topics = [c.args[0] for c in mock_client.publish.call_args_list]
+    assert topics == [
+        "test/topic/bed/eta",
+        "test/topic/bed/state_change",
+        "test/topic/all/eta",
+    ]
+
+
+def test_mqtt_configure_deadbands(wrapper: MQTTClientWrapperHarness) -> None:
+    """Deadband and heartbeat settings are read and clamped at zero."""
+    wrapper.configure(
+        {
+            "mqtt_eta_deadband_s": 5,
+            "mqtt_actual_deadband_c": -1,
+            "mqtt_heartbeat_s": 120,
+        }
+    )
+    assert wrapper.get_internal_state("eta_deadband_s") == 5.0
+    assert wrapper.get_internal_state("actual_deadband_c") == 0.0
+    assert wrapper.get_internal_state("heartbeat_interval") == 120.0
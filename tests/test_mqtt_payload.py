@@ -0,0 +1,112 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the mqtt_payload module."""
+
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from octoprint_temp_eta import mqtt_payload
+from octoprint_temp_eta.mqtt_payload import (
+    ETA_DOCUMENT_KEYS,
+    PayloadEncoder,
+    available_encoders,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None  # type: ignore
+
+
+def _eta_document(**overrides):
+    document = {
+        "heater": "tool0",
+        "eta_seconds": 42.512345,
+        "eta_kind": "heating",
+        "target": 210.0,
+        "actual": 150.2,
+        "cooldown_target": None,
+        "timestamp": 1767225600.125,
+        "state": "heating",
+    }
+    document.update(overrides)
+    return document
+
+
+class TestPayloadEncoder(TestCase):
+    """Test cases for the MQTT payload encoders."""
+
+    def test_encoders_agree_with_json(self):
+        """Test every encoder produces the same JSON as json.dumps."""
+        payloads = [
+            _eta_document(),
+            _eta_document(heater="Düse \"1\"", eta_seconds=None, eta_kind=None, state=None, target=0, actual=-3),
+            {"heater": "bed", "state": "cooling", "previous_state": None, "timestamp": 1.5, "actual": 50.0, "target": 0.0},
+            {"timestamp": 2.0, "heaters": {"bed": _eta_document(heater="bed")}},
+        ]
+        if np is not None:
+            payloads.append(_eta_document(eta_seconds=np.float64(12.25), actual=np.float64(80.5)))
+
+        for name in available_encoders():
+            encoder = PayloadEncoder(name)
+            for payload in payloads:
+                with self.subTest(encoder=name, payload=payload):
+                    encoded = encoder.encode(payload)
+                    self.assertIsInstance(encoded, bytes)
+                    self.assertEqual(json.loads(encoded), json.loads(json.dumps(payload, default=float)))
+
+    def test_template_keeps_key_order_and_caches_prefix(self):
+        """Test the template encodes ETA documents in schema order."""
+        encoder = PayloadEncoder("template")
+        encoded = encoder.encode(_eta_document())
+        self.assertEqual(list(json.loads(encoded)), list(ETA_DOCUMENT_KEYS))
+        self.assertTrue(encoded.startswith(b'{"heater":"tool0","eta_seconds":42.512345,'))
+        encoder.encode(_eta_document(eta_seconds=1.0))
+        self.assertEqual(list(encoder._prefixes), ["tool0"])
+
+    def test_template_encodes_non_finite_floats_as_null(self):
+        """Test NaN and infinity become null instead of invalid JSON."""
+        encoded = PayloadEncoder("template").encode(_eta_document(eta_seconds=float("nan"), actual=float("inf")))
+        decoded = json.loads(encoded)
+        self.assertIsNone(decoded["eta_seconds"])
+        self.assertIsNone(decoded["actual"])
+
+    def test_template_falls_back_for_other_schemas(self):
+        """Test payloads that do not match the ETA schema use json.dumps."""
+        encoder = PayloadEncoder("template")
+        for payload in (
+            _eta_document(eta_kind=3),
+            _eta_document(target="hot"),
+            _eta_document(actual=True),
+            {key: None for key in "abcdefgh"},
+        ):
+            with self.subTest(payload=payload):
+                self.assertEqual(encoder.encode(payload), json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def test_json_encoder_matches_previous_output(self):
+        """Test the json encoder is byte-for-byte the previous encoding."""
+        payload = _eta_document(heater="Düse")
+        self.assertEqual(
+            PayloadEncoder("json").encode(payload),
+            json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+        )
+
+    def test_defaults_without_orjson(self):
+        """Test the template encoder is the default when orjson is missing."""
+        with patch.object(mqtt_payload, "orjson", None):
+            self.assertEqual(available_encoders(), ("template", "json"))
+            self.assertEqual(PayloadEncoder().name, "template")
+            with self.assertRaises(ValueError):
+                PayloadEncoder("orjson")
+
+    def test_rejects_unknown_encoder(self):
+        """Test unknown encoder names raise ValueError."""
+        with self.assertRaises(ValueError):
+            PayloadEncoder("pickle")
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
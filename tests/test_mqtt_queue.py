@@ -0,0 +1,130 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the mqtt_queue module."""
+
+import threading
+from unittest import TestCase
+
+from octoprint_temp_eta.mqtt_queue import PublishQueue
+
+
+class TestPublishQueue(TestCase):
+    """Test cases for the outbound MQTT queue."""
+
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.sent = []
+
+    def _blocking_sender(self, topic, payload):
+        """Record the message, then block the first call until released."""
+        self.sent.append((topic, payload))
+        if len(self.sent) == 1:
+            self.started.set()
+            self.release.wait(5.0)
+
+    def test_put_returns_false_when_stopped(self):
+        """Test callers are told to publish themselves without a thread."""
+        queue = PublishQueue(self._blocking_sender)
+        self.assertFalse(queue.put("a/eta", 1))
+        self.assertEqual(queue.stats()["submitted"], 0)
+
+    def test_coalesces_per_topic_and_keeps_unkeyed_messages(self):
+        """Test queued ETA documents collapse per topic; events do not."""
+        queue = PublishQueue(self._blocking_sender)
+        queue.start()
+        try:
+            queue.put("first", 0)
+            self.assertTrue(self.started.wait(5.0))
+            queue.put("bed/eta", 1)
+            queue.put("tool0/eta", 1)
+            queue.put("bed/eta", 2)
+            queue.put("bed/state_change", "a", coalesce=False)
+            queue.put("bed/state_change", "b", coalesce=False)
+            self.assertEqual(queue.stats()["queue_depth"], 4)
+            self.release.set()
+            self.assertTrue(queue.flush(5.0))
+        finally:
+            queue.stop()
+
+        self.assertEqual(
+            self.sent,
+            [
+                ("first", 0),
+                ("bed/eta", 2),
+                ("tool0/eta", 1),
+                ("bed/state_change", "a"),
+                ("bed/state_change", "b"),
+            ],
+        )
+        stats = queue.stats()
+        self.assertEqual(stats["submitted"], 6)
+        self.assertEqual(stats["coalesced"], 1)
+        self.assertEqual(stats["published"], 5)
+        self.assertEqual(stats["dropped"], 0)
+
+    def test_full_queue_drops_oldest(self):
+        """Test a full queue evicts its oldest message."""
+        queue = PublishQueue(self._blocking_sender, maxsize=2)
+        queue.start()
+        try:
+            queue.put("first", 0)
+            self.assertTrue(self.started.wait(5.0))
+            for topic in ("a", "b", "c"):
+                queue.put(topic, topic)
+            self.release.set()
+            self.assertTrue(queue.flush(5.0))
+        finally:
+            queue.stop()
+
+        self.assertEqual([topic for topic, _ in self.sent], ["first", "b", "c"])
+        self.assertEqual(queue.stats()["dropped"], 1)
+        self.assertEqual(queue.stats()["max_queue_depth"], 2)
+
+    def test_sender_errors_are_counted(self):
+        """Test a failing sender does not stop the publisher thread."""
+
+        def failing_sender(topic, _payload):
+            if topic == "bad":
+                raise OSError("broker gone")
+            self.sent.append(topic)
+
+        queue = PublishQueue(failing_sender)
+        queue.start()
+        try:
+            queue.put("bad", None)
+            self.assertTrue(queue.flush(5.0))
+            queue.put("good", None)
+            self.assertTrue(queue.flush(5.0))
+        finally:
+            queue.stop()
+
+        self.assertEqual(self.sent, ["good"])
+        self.assertEqual(queue.stats()["failed"], 1)
+        self.assertEqual(queue.stats()["published"], 2)
+
+    def test_stop_discards_queued_messages(self):
+        """Test stop() counts messages that were never sent as dropped."""
+        queue = PublishQueue(self._blocking_sender)
+        queue.start()
+        queue.put("first", 0)
+        self.assertTrue(self.started.wait(5.0))
+        queue.put("a", 1)
+        self.release.set()
+        queue.stop()
+
+        self.assertFalse(queue.running)
+        self.assertFalse(queue.put("b", 2))
+        stats = queue.stats()
+        self.assertEqual(stats["published"] + stats["dropped"], 2)
+
+    def test_rejects_non_positive_maxsize(self):
+        """Test the queue bound must be positive."""
+        with self.assertRaises(ValueError):
+            PublishQueue(self._blocking_sender, maxsize=0)
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
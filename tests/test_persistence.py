@@ -0,0 +1,229 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the persistence module."""
+
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+from unittest import TestCase, mock
+
+from octoprint_temp_eta.persistence import (
+    FSYNC_FILE,
+    FSYNC_FILE_AND_DIR,
+    FSYNC_NONE,
+    RECORD_SIZE,
+    HistoryFile,
+    HistoryFormatError,
+    decode_header,
+    decode_records,
+    encode_header,
+    encode_records,
+    read_history_file,
+    tail_rows,
+)
+
+SAMPLES = {
+    "bed": [(1.0, 20.0, 60.0), (2.0, 21.5, 60.0)],
+    "tool0": [(1.0, 25.0, 210.0), (2.0, 30.0, 210.0), (3.0, 35.5, 210.0)],
+}
+
+
+class TestEncoding(TestCase):
+    """Test cases for header and record encoding."""
+
+    def test_header_roundtrip(self):
+        """Test heater names survive an encode/decode cycle."""
+        data = encode_header(["bed", "tool0", "chämber"])
+        heaters, offset = decode_header(data + b"rest")
+        self.assertEqual(heaters, ["bed", "tool0", "chämber"])
+        self.assertEqual(offset, len(data))
+
+    def test_records_roundtrip(self):
+        """Test records decode to the rows that were encoded."""
+        heaters = sorted(SAMPLES)
+        ids = {heater: i for i, heater in enumerate(heaters)}
+        data = encode_records(SAMPLES, ids)
+        self.assertEqual(len(data), 5 * RECORD_SIZE)
+        self.assertEqual(decode_records(data, heaters, 0), SAMPLES)
+
+    def test_bad_header_raises(self):
+        """Test bad magic, version and CRC are rejected."""
+        header = bytearray(encode_header(["tool0"]))
+        with self.assertRaises(HistoryFormatError):
+            decode_header(b"{}")
+        with self.assertRaises(HistoryFormatError):
+            decode_header(b"JSON" + bytes(header[4:]))
+        corrupt = bytearray(header)
+        corrupt[-1] ^= 0xFF
+        with self.assertRaises(HistoryFormatError):
+            decode_header(bytes(corrupt))
+        future = bytearray(header)
+        future[4] = 99
+        with self.assertRaises(HistoryFormatError):
+            decode_header(bytes(future))
+
+    def test_corrupt_and_torn_records_are_skipped(self):
+        """Test a record with a bad CRC and a partial tail are ignored."""
+        heaters = ["tool0"]
+        data = bytearray(encode_records({"tool0": SAMPLES["tool0"]}, {"tool0": 0}))
+        data[RECORD_SIZE + 3] ^= 0xFF
+        data += encode_records({"tool0": [(4.0, 40.0, 210.0)]}, {"tool0": 0})[:-5]
+        rows = decode_records(bytes(data), heaters, 0)
+        self.assertEqual(rows, {"tool0": [SAMPLES["tool0"][0], SAMPLES["tool0"][2]]})
+
+    def test_unknown_heater_id_is_skipped(self):
+        """Test records referring past the heater table are ignored."""
+        data = encode_records({"tool0": [(1.0, 2.0, 3.0)]}, {"tool0": 5})
+        self.assertEqual(decode_records(data, ["tool0"], 0), {})
+
+
+class TestTailRows(TestCase):
+    """Test cases for high-water mark tail extraction."""
+
+    def test_returns_rows_above_mark(self):
+        """Test only rows newer than the mark are returned, oldest first."""
+        rows = deque([(float(i), 20.0, 60.0) for i in range(10)], maxlen=10)
+        self.assertEqual(tail_rows(rows, (6.0, 1)), [(7.0, 20.0, 60.0), (8.0, 20.0, 60.0), (9.0, 20.0, 60.0)])
+        self.assertEqual(tail_rows(rows, (9.0, 1)), [])
+        self.assertEqual(tail_rows(rows, (-1.0, 0)), list(rows))
+        self.assertEqual(tail_rows([], (0.0, 0)), [])
+
+    def test_rows_at_the_mark_timestamp_beyond_its_count_are_new(self):
+        """Test a row sharing the mark's timestamp is not mistaken as written."""
+        rows = [(1.0, 20.0, 60.0), (2.0, 21.0, 60.0), (2.0, 22.0, 60.0), (3.0, 23.0, 60.0)]
+        self.assertEqual(tail_rows(rows[:3], (2.0, 1)), [(2.0, 22.0, 60.0)])
+        self.assertEqual(tail_rows(rows, (2.0, 1)), rows[2:])
+        self.assertEqual(tail_rows(rows, (2.0, 2)), rows[3:])
+
+
+class TestHistoryFile(TestCase):
+    """Test cases for the append/compact file state."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "history_default.bin"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_compact_then_append(self):
+        """Test append writes only rows newer than the last persist."""
+        history_file = HistoryFile(self.path)
+        written = history_file.compact(SAMPLES)
+        self.assertEqual(written, self.path.stat().st_size)
+        self.assertEqual(history_file.heaters, ["bed", "tool0"])
+        self.assertEqual(history_file.marks, {"bed": (2.0, 1), "tool0": (3.0, 1)})
+        self.assertFalse(self.path.with_name(self.path.name + ".tmp").exists())
+
+        grown = {
+            "bed": SAMPLES["bed"] + [(4.0, 23.0, 60.0)],
+            "tool0": SAMPLES["tool0"] + [(4.0, 40.0, 210.0), (5.0, 44.0, 210.0)],
+        }
+        rows = history_file.new_rows(grown)
+        self.assertEqual(
+            rows,
+            {"bed": [(4.0, 23.0, 60.0)], "tool0": [(4.0, 40.0, 210.0), (5.0, 44.0, 210.0)]},
+        )
+        self.assertTrue(history_file.can_append(rows))
+        self.assertEqual(history_file.append(rows), 3 * RECORD_SIZE)
+        self.assertEqual(history_file.size, written + 3 * RECORD_SIZE)
+        self.assertEqual(history_file.size, self.path.stat().st_size)
+        self.assertEqual(read_history_file(self.path), grown)
+
+        self.assertEqual(history_file.marks, {"bed": (4.0, 1), "tool0": (5.0, 1)})
+        self.assertEqual(history_file.entries, 1)
+
+        self.assertEqual(history_file.new_rows(grown), {})
+        self.assertEqual(history_file.append({}), 0)
+        self.assertEqual(history_file.entries, 1)
+
+    def test_marks_are_per_heater(self):
+        """Test a heater lagging behind another still gets its new rows."""
+        history_file = HistoryFile(self.path)
+        history_file.compact({"bed": [(1.0, 20.0, 60.0)], "tool0": [(5.0, 30.0, 210.0)]})
+        rows = history_file.new_rows(
+            {"bed": [(1.0, 20.0, 60.0), (3.0, 22.0, 60.0)], "tool0": [(5.0, 30.0, 210.0)]}
+        )
+        self.assertEqual(rows, {"bed": [(3.0, 22.0, 60.0)]})
+
+    def test_equal_timestamps_across_a_journal_write(self):
+        """Test a row with the last journaled timestamp is journaled later."""
+        history_file = HistoryFile(self.path)
+        history = [(1.0, 20.0, 60.0), (2.0, 21.0, 60.0)]
+        history_file.compact({"bed": history})
+
+        history.append((3.0, 22.0, 60.0))
+        history_file.append(history_file.new_rows({"bed": history}))
+        history.append((3.0, 22.5, 60.0))
+        rows = history_file.new_rows({"bed": history})
+        self.assertEqual(rows, {"bed": [(3.0, 22.5, 60.0)]})
+        history_file.append(rows)
+        self.assertEqual(history_file.marks, {"bed": (3.0, 2)})
+        self.assertEqual(history_file.new_rows({"bed": history}), {})
+
+        resumed, samples = HistoryFile.open(self.path)
+        self.assertEqual(samples, {"bed": history})
+        self.assertEqual(resumed.marks, history_file.marks)
+
+    def test_open_replays_checkpoint_and_journal(self):
+        """Test open() returns all rows and resumes at the end of the file."""
+        history_file = HistoryFile(self.path)
+        history_file.compact(SAMPLES)
+        history_file.append({"tool0": [(4.0, 40.0, 210.0)]})
+        history_file.append({"bed": [(5.0, 25.0, 60.0)]})
+
+        resumed, samples = HistoryFile.open(self.path)
+        self.assertEqual(samples["tool0"][-1], (4.0, 40.0, 210.0))
+        self.assertEqual(samples["bed"][-1], (5.0, 25.0, 60.0))
+        self.assertEqual(resumed.heaters, history_file.heaters)
+        self.assertEqual(resumed.size, history_file.size)
+        self.assertEqual(resumed.marks, history_file.marks)
+        self.assertTrue(resumed.can_append({"tool0": [(6.0, 41.0, 210.0)]}))
+
+    def test_torn_tail_blocks_append(self):
+        """Test a file ending mid-record must be checkpointed before appending."""
+        history_file = HistoryFile(self.path)
+        history_file.compact(SAMPLES)
+        with open(self.path, "ab") as fh:
+            fh.write(b"\x00" * 7)
+        resumed, samples = HistoryFile.open(self.path)
+        self.assertEqual(samples, SAMPLES)
+        self.assertFalse(resumed.can_append({"tool0": [(6.0, 41.0, 210.0)]}))
+
+    def test_new_heater_requires_compaction(self):
+        """Test rows for a heater missing from the header cannot be appended."""
+        history_file = HistoryFile(self.path)
+        history_file.compact({"tool0": SAMPLES["tool0"]})
+        rows = history_file.new_rows({"bed": [(9.0, 30.0, 60.0)]})
+        self.assertFalse(history_file.can_append(rows))
+
+    def test_fsync_policies(self):
+        """Test each durability policy fsyncs the expected descriptors."""
+        for policy, compact_syncs, append_syncs in (
+            (FSYNC_NONE, 0, 0),
+            (FSYNC_FILE, 1, 1),
+            (FSYNC_FILE_AND_DIR, 2, 1),
+        ):
+            with self.subTest(policy=policy), mock.patch.object(
+                os, "fsync", wraps=os.fsync
+            ) as fsync:
+                history_file = HistoryFile(self.path)
+                history_file.compact(SAMPLES, policy)
+                self.assertEqual(fsync.call_count, compact_syncs)
+                fsync.reset_mock()
+                history_file.append({"tool0": [(9.0, 50.0, 210.0)]}, policy)
+                self.assertEqual(fsync.call_count, append_syncs)
+                self.assertEqual(read_history_file(self.path)["tool0"][-1], (9.0, 50.0, 210.0))
+
+    def test_encoded_size_matches_compacted_file(self):
+        """Test encoded_size predicts the compacted file size."""
+        history_file = HistoryFile(self.path)
+        written = history_file.compact(SAMPLES)
+        self.assertEqual(HistoryFile.encoded_size(["bed", "tool0"], 5), written)
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
@@ -10,16 +10,20 @@ These tests follow the guidance in tests/README.md:
 from __future__ import annotations
 
 import json
+import math
 import pathlib
+import threading
 from collections import deque
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 import pytest
 
 import octoprint_temp_eta
 from octoprint_temp_eta import TempETAPlugin
 from octoprint_temp_eta import calculator as calc_module
+from octoprint_temp_eta import persistence
+from octoprint_temp_eta.persistence import RECORD_SIZE, read_history_file
 
 
 class DummyLogger:
@@ -118,10 +122,39 @@ class DummyPluginManager:
     def __init__(self) -> None:
         """Initialize test helper state."""
         self.messages: list[dict[str, Any]] = []
+        self._heater_view: dict[str, dict[str, Any]] = {}
 
     def send_plugin_message(self, identifier: str, payload: dict[str, Any]) -> None:
-        """Provide a test stub implementation."""
-        self.messages.append({"identifier": identifier, "payload": payload})
+        """Provide a test stub implementation.
+
+        eta_batch deltas are merged into the heater values seen so far, like
+        the frontend does, and stored with the message.
+        """
+        message = {"identifier": identifier, "payload": payload}
+        if payload.get("type") == "eta_batch":
+            merged = {}
+            for heater, entry in payload["heaters"].items():
+                if payload.get("keyframe"):
+                    view = dict(entry)
+                else:
+                    view = {**self._heater_view.get(heater, {}), **entry}
+                self._heater_view[heater] = view
+                merged[heater] = dict(view)
+            message["merged"] = merged
+        self.messages.append(message)
+
+    def heater_updates(self) -> list[dict[str, Any]]:
+        """Return merged per-heater entries of all eta_batch messages, oldest first."""
+        updates = []
+        for message in self.messages:
+            payload = message["payload"]
+            if payload.get("type") != "eta_batch":
+                continue
+            for heater, entry in message["merged"].items():
+                updates.append(
+                    {"heater": heater, "cooldown_mode": payload["cooldown_mode"], **entry}
+                )
+        return updates
 
 
 class DummySettings:
@@ -262,6 +295,11 @@ def _set_time(monkeypatch: pytest.MonkeyPatch, now: float) -> None:
     monkeypatch.setattr(octoprint_temp_eta.time, "time", lambda: float(now))
 
 
+def _cooldown_rows(plugin: Any, rows: Any) -> Any:
+    """Build a cooldown history holding *rows*, as the plugin creates them."""
+    return _call_attr(plugin, _member("new_heater_history"), fields=2, rows=rows)
+
+
 def test_settings_defaults_shape(temp_eta_plugin: Any) -> None:
     """Test settings defaults shape."""
     defaults = temp_eta_plugin.get_settings_defaults()
@@ -375,8 +413,6 @@ def test_refresh_runtime_caches_applies_valid_settings_and_orders_backoff(
     settings.set(["persist_backoff_max_s"], 10.0)
     settings.set(["persist_max_json_bytes"], 20000)
 
-    _set_attr(plugin_any, _member("threshold_start_c"), 5.0)
-    _set_attr(plugin_any, _member("update_interval_s"), 1.0)
     _set_attr(plugin_any, _member("persist_backoff_current_s"), 999.0)
 
     _call_attr(
@@ -384,8 +420,9 @@ def test_refresh_runtime_caches_applies_valid_settings_and_orders_backoff(
         _member("refresh_runtime_caches"),
     )
 
-    assert _get_attr(plugin_any, _member("threshold_start_c")) == 7.5
-    assert _get_attr(plugin_any, _member("update_interval_s")) == 0.5
+    config = _get_attr(plugin_any, _member("runtime_config"))
+    assert config.threshold_start_c == 7.5
+    assert config.update_interval_s == 0.5
     assert _get_attr(plugin_any, _member("persist_backoff_reset_s")) == 5.0
     assert _get_attr(plugin_any, _member("persist_backoff_initial_s")) == 20.0
     assert _get_attr(plugin_any, _member("persist_backoff_max_s")) == 20.0
@@ -500,8 +537,8 @@ def test_persist_current_profile_history_emits_size_warning_and_trims(
 
     assert _get_attr(plugin_any, _member("logger")).warning_calls
     # Ensure atomic tmp cleanup happens.
-    assert not (tmp_path / "history_default.json.tmp").exists()
-    assert (tmp_path / "history_default.json").exists()
+    assert not (tmp_path / "history_default.bin.tmp").exists()
+    assert (tmp_path / "history_default.bin").exists()
 
 
 def test_persist_current_profile_history_breaks_when_cannot_trim(
@@ -529,7 +566,7 @@ def test_persist_current_profile_history_breaks_when_cannot_trim(
         temp_eta_plugin,
         _member("persist_current_profile_history"),
     )
-    assert (tmp_path / "history_default.json").exists()
+    assert (tmp_path / "history_default.bin").exists()
 
 
 def test_persist_current_profile_history_cleans_tmp_when_replace_fails(
@@ -563,7 +600,7 @@ def test_persist_current_profile_history_cleans_tmp_when_replace_fails(
         temp_eta_plugin,
         _member("persist_current_profile_history"),
     )
-    assert not (tmp_path / "history_default.json.tmp").exists()
+    assert not (tmp_path / "history_default.bin.tmp").exists()
 
 
 def test_persist_current_profile_history_ignores_unlink_errors(
@@ -663,12 +700,9 @@ def test_on_printer_add_temperature_uses_idle_debug_interval_when_no_samples_rec
     _set_attr(plugin_any, _member("calculate_and_broadcast_eta"), lambda _data: None)
 
     # Make threshold impossible to meet so recorded_count stays 0.
-    _set_attr(plugin_any, _member("threshold_start_c"), 1000.0)
-    # Prevent periodic cache refresh from resetting threshold from settings.
     cast(DummySettings, _get_attr(plugin_any, _member("settings"))).set(
         ["threshold_start"], 1000.0
     )
-    _set_attr(plugin_any, _member("last_runtime_cache_refresh_time"), 100.0)
 
     intervals: list[float] = []
 
@@ -848,22 +882,19 @@ def test_persist_current_profile_history_trims_to_size_cap_and_writes_atomically
         _member("persist_current_profile_history"),
     )
 
-    history_path = tmp_path / "history_default.json"
+    history_path = tmp_path / "history_default.bin"
     assert history_path.exists()
-    assert not (tmp_path / "history_default.json.tmp").exists()
+    assert not (tmp_path / "history_default.bin.tmp").exists()
 
     raw = history_path.read_bytes()
     assert len(raw) <= int(_get_attr(plugin_any, _member("persist_max_json_bytes")))
 
-    payload = json.loads(raw.decode("utf-8"))
-    assert payload["profile_id"] == "default"
-    samples = payload["samples"]
+    samples = read_history_file(history_path)
     assert "tool0" in samples
     assert "bed" in samples
 
-    # Optional heaters may be present but empty.
-    if "chamber" in samples:
-        assert samples["chamber"] == []
+    # Heaters without samples are not written.
+    assert "chamber" not in samples
 
     # Trim logic guarantees at least 2 points per heater.
     assert len(samples["tool0"]) >= 2
@@ -1402,11 +1433,7 @@ def test_switch_active_profile_non_forced_clears_live_history_and_sends_clear(
     assert _get_attr(temp_eta_plugin, _member("temp_history")) == {}
     assert any("Cleared live (RAM) history" in m for m in logs)
 
-    cleared = [
-        m["payload"].get("heater")
-        for m in pm.messages
-        if m["payload"].get("eta") is None
-    ]
+    cleared = [u["heater"] for u in pm.heater_updates() if u["eta"] is None]
     assert set(cleared) >= {"tool0", "bed"}
 
 
@@ -1495,11 +1522,13 @@ def test_get_cooldown_ambient_c_prefers_user_then_baseline_then_history(
     _set_time(monkeypatch, 100.0)
 
     _get_attr(plugin_any, _member("settings")).set(["cooldown_ambient_temp"], 21.0)
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
     assert (
         _call_attr(temp_eta_plugin, _member("get_cooldown_ambient_c"), "tool0") == 21.0
     )
 
     _get_attr(plugin_any, _member("settings")).set(["cooldown_ambient_temp"], None)
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
     _get_attr(plugin_any, _member("cooldown_ambient_baseline"))["tool0"] = 19.5
     assert (
         _call_attr(temp_eta_plugin, _member("get_cooldown_ambient_c"), "tool0") == 19.5
@@ -1508,8 +1537,8 @@ def test_get_cooldown_ambient_c_prefers_user_then_baseline_then_history(
     # With no baseline, derive a conservative estimate from history
     # (requires a min notably below current).
     _get_attr(plugin_any, _member("cooldown_ambient_baseline")).pop("tool0", None)
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 60.0), (95.0, 40.0), (100.0, 50.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 60.0), (95.0, 40.0), (100.0, 50.0)]
     )
     amb = _call_attr(temp_eta_plugin, _member("get_cooldown_ambient_c"), "tool0")
     assert amb is not None
@@ -1561,10 +1590,11 @@ def test_calculate_cooldown_linear_eta_paths(
     _set_attr(plugin_any, _member("debug_logging_enabled"), True)
     _set_time(monkeypatch, 100.0)
     _get_attr(plugin_any, _member("settings")).set(["cooldown_fit_window_seconds"], 120)
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
 
     # Happy path: negative slope.
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 60.0), (100.0, 50.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 60.0), (100.0, 50.0)]
     )
     eta = _call_attr(
         temp_eta_plugin, _member("calculate_cooldown_linear_eta"), "tool0", goal_c=40.0
@@ -1578,8 +1608,9 @@ def test_calculate_cooldown_linear_eta_paths(
         plugin_any, _member("debug_log"), lambda msg, *args: logged.append(str(msg))
     )
     _get_attr(plugin_any, _member("settings")).set(["cooldown_fit_window_seconds"], 10)
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(0.0, 60.0), (1.0, 59.0)], maxlen=60
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(0.0, 60.0), (1.0, 59.0)]
     )
     assert (
         _call_attr(
@@ -1596,8 +1627,9 @@ def test_calculate_cooldown_linear_eta_paths(
     logged.clear()
     _set_time(monkeypatch, 200.0)
     _get_attr(plugin_any, _member("settings")).set(["cooldown_fit_window_seconds"], 120)
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 50.0), (100.0, 55.0)], maxlen=60
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 50.0), (100.0, 55.0)]
     )
     assert (
         _call_attr(
@@ -1611,6 +1643,70 @@ def test_calculate_cooldown_linear_eta_paths(
     assert logged
 
 
+def _scan_cooldown(
+    rows: list[tuple[float, float]], now: float, window: float, goal_c: float
+) -> tuple[Optional[float], Optional[float]]:
+    """Ambient estimate and linear cooldown ETA from a full scan of *rows*."""
+    ambient = None
+    ambient_cutoff = now - max(window, 60.0)
+    recent = [t for ts, t in rows if ts > ambient_cutoff and math.isfinite(t)]
+    if len(recent) >= 3 and min(recent) < recent[-1] - 2.0:
+        ambient = min(recent) - 0.5
+    fit_rows = deque(
+        (ts, t) for ts, t in rows if ts > now - window and math.isfinite(t)
+    )
+    eta = None
+    if len(fit_rows) >= 2:
+        eta = calc_module.calculate_cooldown_linear_eta(fit_rows, goal_c, window)
+    return ambient, eta
+
+
+def test_cooldown_fit_matches_full_scan(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """The incremental cooldown fit matches a full scan of the history."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    _get_attr(plugin_any, _member("settings")).set(["cooldown_fit_window_seconds"], 30)
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    state = _get_attr(plugin_any, _member("heaters")).state("tool0")
+    state.cooldown_history = _cooldown_rows(temp_eta_plugin, [])
+    window = 30.0
+
+    temp = 180.0
+    rows: list[tuple[float, float]] = []
+    seen: list[Any] = []
+    for i in range(200):
+        now = 1000.0 + 0.5 * i
+        # Cool down, then warm up again so the ambient estimate kicks in.
+        temp = temp + 0.5 if i >= 160 else 25.0 + (temp - 25.0) * 0.99
+        row = (now, temp if i % 11 else float("nan"))
+        state.cooldown_history.append(row)
+        rows = (rows + [row])[-state.cooldown_history.maxlen :]
+        if i == 120:
+            # A smaller fit window replaces the fit.
+            _get_attr(plugin_any, _member("settings")).set(
+                ["cooldown_fit_window_seconds"], 10
+            )
+            _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+            window = 10.0
+        _set_time(monkeypatch, now + 0.25)
+        result = (
+            _call_attr(temp_eta_plugin, _member("get_cooldown_ambient_c"), "tool0"),
+            _call_attr(
+                temp_eta_plugin,
+                _member("calculate_cooldown_linear_eta"),
+                "tool0",
+                goal_c=40.0,
+            ),
+        )
+        assert result == _scan_cooldown(rows, now + 0.25, window, 40.0)
+        seen.append(result)
+
+    assert state.cooldown_fit.window_seconds == 10.0
+    assert any(ambient is not None for ambient, _ in seen)
+    assert any(eta is not None for _, eta in seen)
+
+
 def test_calculate_cooldown_eta_seconds_ambient_mode_calls_exponential(
     temp_eta_plugin: Any,
 ) -> None:
@@ -1945,10 +2041,7 @@ def test_on_settings_save_toggles_debug_updates_history_and_handles_non_dict_sav
     assert _get_attr(temp_eta_plugin, _member("temp_history"))["tool0"].maxlen == 50
 
     pm = cast(DummyPluginManager, _get_attr(p_any, _member("plugin_manager")))
-    assert any(
-        m["payload"].get("type") == "eta_update" and m["payload"].get("eta") is None
-        for m in pm.messages
-    )
+    assert any(u["eta"] is None for u in pm.heater_updates())
 
 
 def test_on_settings_save_sanitizes_numeric_payload_before_delegating(
@@ -1989,7 +2082,7 @@ def test_on_settings_save_sanitizes_numeric_payload_before_delegating(
     )
 
     assert captured["threshold_start"] == 1.0
-    assert captured["update_interval"] == 5.0
+    assert captured["update_interval"] == 30.0
     assert captured["history_size"] == 10
     assert captured["historical_graph_window_seconds"] == 1800
     assert captured["sound_volume"] == 0.0
@@ -2329,6 +2422,28 @@ def test_on_printer_add_temperature_respects_update_interval(
     assert not called
 
 
+def test_on_printer_add_temperature_restarts_history_when_clock_steps_back(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """Test a backward wall-clock step restarts heating and cooldown history."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    _get_attr(plugin_any, _member("settings")).set(["enabled"], True)
+    _get_attr(plugin_any, _member("settings")).set(["enable_cooldown_eta"], True)
+    _get_attr(plugin_any, _member("settings")).set(["update_interval"], 999.0)
+    _set_attr(plugin_any, _member("calculate_and_broadcast_eta"), lambda data: None)
+    _set_attr(plugin_any, _member("maybe_persist_history"), lambda now: None)
+
+    sample = {"tool0": {"actual": 20.0, "target": 200.0}, "bed": {"actual": 50.0, "target": 0.0}}
+    for now in (100.0, 101.0, 50.0):
+        _set_time(monkeypatch, now)
+        temp_eta_plugin.on_printer_add_temperature(sample)
+
+    history = _get_attr(plugin_any, _member("temp_history"))["tool0"]
+    cooldown = _get_attr(plugin_any, _member("cooldown_history"))["bed"]
+    assert list(history) == [(50.0, 20.0, 200.0)]
+    assert list(cooldown) == [(50.0, 50.0)]
+
+
 def test_calculate_and_broadcast_eta_skips_non_dict_and_unsupported(
     temp_eta_plugin: Any,
 ) -> None:
@@ -2337,11 +2452,11 @@ def test_calculate_and_broadcast_eta_skips_non_dict_and_unsupported(
 
     _get_attr(plugin_any, _member("plugin_manager")).messages.clear()
 
-    def _supported(heater: str) -> bool:
+    def _supported(state: Any) -> bool:
         """Provide a local test helper."""
-        return heater == "bed"
+        return state.name == "bed"
 
-    _set_attr(plugin_any, _member("is_heater_supported"), _supported)
+    _set_attr(plugin_any, _member("is_state_supported"), _supported)
 
     _call_attr(
         temp_eta_plugin,
@@ -2355,10 +2470,209 @@ def test_calculate_and_broadcast_eta_skips_non_dict_and_unsupported(
 
     pm = cast(DummyPluginManager, _get_attr(plugin_any, _member("plugin_manager")))
     assert pm.messages
-    last = pm.messages[-1]["payload"]
+    last = pm.heater_updates()[-1]
     assert last["heater"] == "bed"
 
 
+def test_calculate_and_broadcast_eta_keeps_heater_state_on_one_object(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """Broadcast caches the ETA and fit on the heater's registry entry."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    _set_time(monkeypatch, 104.0)
+    _set_attr(
+        plugin_any,
+        _member("temp_history"),
+        {"tool0": deque([(100.0 + i, 20.0 + 2.0 * i, 60.0) for i in range(5)], maxlen=60)},
+    )
+
+    _call_attr(
+        temp_eta_plugin,
+        _member("calculate_and_broadcast_eta"),
+        {"tool0": {"actual": 28.0, "target": 60.0}},
+    )
+
+    state = _get_attr(plugin_any, _member("heaters")).get("tool0")
+    payload = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
+    assert payload["eta"] == pytest.approx(16.0)
+    assert state.last_eta == payload["eta"]
+    assert state.last_eta_kind == "heating"
+    assert state.supported is True
+    assert state.fit is not None
+    assert _get_attr(plugin_any, _member("temp_history"))["tool0"] is state.history
+
+
+def test_calculate_and_broadcast_eta_sends_one_batch_message(
+    temp_eta_plugin: Any,
+) -> None:
+    """All heaters of a tick go out as a single eta_batch message."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    pm = cast(DummyPluginManager, _get_attr(plugin_any, _member("plugin_manager")))
+    pm.messages.clear()
+
+    _call_attr(
+        temp_eta_plugin,
+        _member("calculate_and_broadcast_eta"),
+        {
+            "tool0": {"actual": 20.0, "target": 200.0},
+            "bed": {"actual": 60.0, "target": 60.0},
+            "chamber": {"actual": 30.0, "target": 0.0},
+        },
+    )
+
+    assert len(pm.messages) == 1
+    payload = pm.messages[0]["payload"]
+    assert payload["type"] == "eta_batch"
+    assert payload["cooldown_mode"] is None
+    assert list(payload["heaters"]) == ["tool0", "bed"]
+    assert payload["heaters"]["bed"] == {
+        "eta": None,
+        "eta_kind": None,
+        "eta_ts": None,
+        "target": 60.0,
+        "actual": 60.0,
+        "cooldown_target": None,
+    }
+
+
+def test_calculate_and_broadcast_eta_sends_only_changed_fields(
+    temp_eta_plugin: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Steady heaters are left out until the next keyframe."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    pm = cast(DummyPluginManager, _get_attr(plugin_any, _member("plugin_manager")))
+    broadcast = _get_attr(plugin_any, _member("calculate_and_broadcast_eta"))
+    pm.messages.clear()
+
+    _set_time(monkeypatch, 1000.0)
+    broadcast(
+        {"tool0": {"actual": 20.0, "target": 0.0}, "bed": {"actual": 60.0, "target": 60.0}}
+    )
+    assert pm.messages[-1]["payload"]["keyframe"] is True
+    assert pm.messages[-1]["payload"]["ts"] == 1000.0
+
+    # Noise below the display resolution and unchanged heaters send nothing.
+    _set_time(monkeypatch, 1001.0)
+    broadcast(
+        {"tool0": {"actual": 20.04, "target": 0.0}, "bed": {"actual": 60.0, "target": 60.0}}
+    )
+    assert len(pm.messages) == 1
+
+    # Only the changed field of the changed heater is sent, plus the actual
+    # temperature of the idle heater for its history graph.
+    _set_time(monkeypatch, 1002.0)
+    broadcast(
+        {"tool0": {"actual": 20.5, "target": 0.0}, "bed": {"actual": 60.04, "target": 60.0}}
+    )
+    payload = pm.messages[-1]["payload"]
+    assert payload["keyframe"] is False
+    assert "ts" not in payload
+    assert payload["heaters"] == {"tool0": {"actual": 20.5}, "bed": {"actual": 60.04}}
+    assert pm.heater_updates()[-2]["heater"] == "tool0"
+    assert pm.heater_updates()[-2]["target"] == 0.0
+
+    # The keyframe interval resends everything.
+    _set_time(monkeypatch, 1032.0)
+    broadcast(
+        {"tool0": {"actual": 20.5, "target": 0.0}, "bed": {"actual": 60.0, "target": 60.0}}
+    )
+    payload = pm.messages[-1]["payload"]
+    assert payload["keyframe"] is True
+    assert payload["ts"] == 1032.0
+    assert set(payload["heaters"]) == {"tool0", "bed"}
+    assert payload["heaters"]["bed"]["target"] == 60.0
+
+
+def test_calculate_and_broadcast_eta_idle_heater_gets_a_point_per_message(
+    temp_eta_plugin: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An idle heater's actual rides along every message another heater causes."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    pm = cast(DummyPluginManager, _get_attr(plugin_any, _member("plugin_manager")))
+    broadcast = _get_attr(plugin_any, _member("calculate_and_broadcast_eta"))
+    pm.messages.clear()
+
+    _set_time(monkeypatch, 1000.0)
+    broadcast(
+        {"tool0": {"actual": 20.0, "target": 0.0}, "bed": {"actual": 25.0, "target": 0.0}}
+    )
+    for second in range(1, 6):
+        _set_time(monkeypatch, 1000.0 + second)
+        broadcast(
+            {
+                "tool0": {"actual": 20.0 + second, "target": 0.0},
+                "bed": {"actual": 25.0, "target": 0.0},
+            }
+        )
+
+    assert len(pm.messages) == 6
+    bed_points = [m["payload"]["heaters"]["bed"]["actual"] for m in pm.messages]
+    assert bed_points == [25.0] * 6
+
+
+def test_calculate_and_broadcast_eta_resends_eta_only_off_countdown(
+    temp_eta_plugin: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """ETAs following the client-side countdown are not sent again."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    pm = cast(DummyPluginManager, _get_attr(plugin_any, _member("plugin_manager")))
+    broadcast = _get_attr(plugin_any, _member("calculate_and_broadcast_eta"))
+    etas = {"tool0": 100.0}
+    _set_attr(
+        plugin_any,
+        _member("calculate_heating_etas"),
+        lambda targets, _algorithm: dict(etas),
+    )
+    data = {"tool0": {"actual": 20.0, "target": 200.0}}
+    pm.messages.clear()
+
+    _set_time(monkeypatch, 1000.0)
+    broadcast(data)
+    entry = pm.messages[-1]["payload"]["heaters"]["tool0"]
+    assert entry["eta"] == 100.0
+    assert entry["eta_ts"] == 1000.0
+
+    etas["tool0"] = 98.5
+    _set_time(monkeypatch, 1001.0)
+    broadcast(data)
+    assert len(pm.messages) == 1
+
+    etas["tool0"] = 120.0
+    _set_time(monkeypatch, 1002.0)
+    broadcast(data)
+    assert pm.messages[-1]["payload"]["heaters"] == {
+        "tool0": {"eta": 120.0, "eta_ts": 1002.0, "actual": 20.0}
+    }
+
+
+def test_eta_keyframe_after_client_opened_and_clear(
+    temp_eta_plugin: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """New clients and cleared heaters get every field on the next tick."""
+    plugin_any = cast(Any, temp_eta_plugin)
+    pm = cast(DummyPluginManager, _get_attr(plugin_any, _member("plugin_manager")))
+    broadcast = _get_attr(plugin_any, _member("calculate_and_broadcast_eta"))
+    data = {"bed": {"actual": 60.0, "target": 60.0}}
+
+    _set_time(monkeypatch, 1000.0)
+    broadcast(data)
+    pm.messages.clear()
+
+    temp_eta_plugin.on_event("ClientOpened", {})
+    broadcast(data)
+    assert pm.messages[-1]["payload"]["keyframe"] is True
+
+    broadcast(data)
+    assert len(pm.messages) == 1
+
+    _call_attr(temp_eta_plugin, _member("send_clear_messages"), ["bed"])
+    assert pm.heater_updates()[-1]["target"] is None
+    broadcast(data)
+    payload = pm.messages[-1]["payload"]
+    assert payload["keyframe"] is True
+    assert pm.heater_updates()[-1]["target"] == 60.0
+
+
 def test_calculate_and_broadcast_eta_auto_creates_history_for_new_heater(
     temp_eta_plugin: Any,
 ) -> None:
@@ -2368,7 +2682,7 @@ def test_calculate_and_broadcast_eta_auto_creates_history_for_new_heater(
 
     # Force support for tool1 and ensure it's not already tracked.
     _set_attr(
-        plugin_any, _member("is_heater_supported"), lambda heater: heater == "tool1"
+        plugin_any, _member("is_state_supported"), lambda state: state.name == "tool1"
     )
     _get_attr(temp_eta_plugin, _member("temp_history")).pop("tool1", None)
 
@@ -2408,7 +2722,7 @@ def test_calculate_and_broadcast_eta_cooldown_threshold_skips_when_below_hystere
         },
     )
 
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
     assert msg["cooldown_mode"] == "threshold"
@@ -2440,7 +2754,7 @@ def test_calculate_and_broadcast_eta_cooldown_ambient_computes_and_sends_kind(
         },
     )
 
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] == 5.0
     assert msg["eta_kind"] == "cooling"
@@ -2479,7 +2793,7 @@ def test_calculate_and_broadcast_eta_cooldown_threshold_under_one_second_logs_in
     )
 
     assert any("insufficient fit" in str(args[2]) for (args, _kwargs) in debug_calls)
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
 
@@ -2510,7 +2824,7 @@ def test_calculate_and_broadcast_eta_cooldown_target_none_triggers_debug_log(
     )
 
     assert calls
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
     assert msg["cooldown_target"] is None
@@ -2539,8 +2853,8 @@ def test_calculate_and_broadcast_eta_cooldown_eta_under_one_second_logs_insuffic
         _member("calculate_cooldown_eta_seconds"),
         lambda *args, **kwargs: 0.5,
     )
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 60.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 60.0)]
     )
 
     _get_attr(plugin_any, _member("plugin_manager")).messages.clear()
@@ -2551,7 +2865,7 @@ def test_calculate_and_broadcast_eta_cooldown_eta_under_one_second_logs_insuffic
     )
 
     assert any("insufficient fit" in str(args[2]) for (args, _kwargs) in debug_calls)
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
 
@@ -2587,7 +2901,7 @@ def test_calculate_and_broadcast_eta_cooldown_forced_target_under_one_second_hit
     )
 
     assert any("insufficient fit" in str(args[2]) for (args, _kwargs) in debug_calls)
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
     assert msg["cooldown_target"] == 40.0
@@ -2604,7 +2918,9 @@ def test_calculate_and_broadcast_eta_heating_exponential_and_hide_under_one_seco
 
     _get_attr(plugin_any, _member("plugin_manager")).messages.clear()
     _set_attr(
-        plugin_any, _member("calculate_exponential_eta"), lambda heater, target: 0.5
+        plugin_any,
+        _member("calculate_heating_etas"),
+        lambda targets, algorithm: dict.fromkeys(targets, 0.5),
     )
     _call_attr(
         temp_eta_plugin,
@@ -2612,21 +2928,23 @@ def test_calculate_and_broadcast_eta_heating_exponential_and_hide_under_one_seco
         {"tool0": {"actual": 20.0, "target": 40.0}},
     )
 
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
     assert msg["eta_kind"] is None
 
     _get_attr(plugin_any, _member("plugin_manager")).messages.clear()
     _set_attr(
-        plugin_any, _member("calculate_exponential_eta"), lambda heater, target: 10.0
+        plugin_any,
+        _member("calculate_heating_etas"),
+        lambda targets, algorithm: dict.fromkeys(targets, 10.0),
     )
     _call_attr(
         temp_eta_plugin,
         _member("calculate_and_broadcast_eta"),
         {"tool0": {"actual": 20.0, "target": 40.0}},
     )
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["eta"] == 10.0
     assert msg["eta_kind"] == "heating"
 
@@ -2646,7 +2964,7 @@ def test_calculate_and_broadcast_eta_handles_non_numeric_values_and_close_to_tar
         _member("calculate_and_broadcast_eta"),
         {"tool0": {"actual": "bad", "target": "bad"}},
     )
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["heater"] == "tool0"
     assert msg["eta"] is None
 
@@ -2657,7 +2975,7 @@ def test_calculate_and_broadcast_eta_handles_non_numeric_values_and_close_to_tar
         _member("calculate_and_broadcast_eta"),
         {"tool0": {"actual": 39.0, "target": 40.0}},
     )
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["eta"] is None
     assert msg["eta_kind"] is None
 
@@ -2673,8 +2991,8 @@ def test_calculate_and_broadcast_eta_cooldown_insufficient_fit_logs_history_len(
     _get_attr(plugin_any, _member("settings")).set(["cooldown_target_tool0"], 50.0)
 
     # Ensure there is some history so hist_len path is meaningful.
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(0.0, 70.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(0.0, 70.0)]
     )
 
     debug: list[str] = []
@@ -2698,15 +3016,23 @@ def test_calculate_and_broadcast_eta_cooldown_insufficient_fit_logs_history_len(
     )
 
     assert any("insufficient fit" in m for m in debug)
-    msg = _get_attr(plugin_any, _member("plugin_manager")).messages[-1]["payload"]
+    msg = _get_attr(plugin_any, _member("plugin_manager")).heater_updates()[-1]
     assert msg["eta"] is None
     assert msg["cooldown_target"] == 50.0
 
 
-def test_calculate_exponential_eta_happy_path_returns_number(
+def _heating_eta(plugin: Any, target: float, algorithm: str) -> Optional[float]:
+    """Return tool0's heating ETA from one _calculate_heating_etas batch."""
+    etas = _call_attr(
+        plugin, _member("calculate_heating_etas"), {"tool0": target}, algorithm
+    )
+    return etas.get("tool0")
+
+
+def test_calculate_heating_etas_exponential_happy_path_returns_number(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate exponential eta happy path returns number."""
+    """Test exponential heating ETA happy path returns number."""
     target = 200.0
     _set_time(monkeypatch, 100.0)
 
@@ -2724,9 +3050,7 @@ def test_calculate_exponential_eta_happy_path_returns_number(
         maxlen=60,
     )
 
-    eta = _call_attr(
-        temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", target
-    )
+    eta = _heating_eta(temp_eta_plugin, target, "exponential")
     assert eta is not None
     assert float(eta) >= 0.0
 
@@ -2740,7 +3064,8 @@ def test_calculate_cooldown_exponential_eta_happy_path(
     _set_time(monkeypatch, 200.0)
 
     # Construct an exponential-ish cooldown curve with 6 points.
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any,
         [
             (150.0, 80.0),
             (160.0, 65.0),
@@ -2749,7 +3074,6 @@ def test_calculate_cooldown_exponential_eta_happy_path(
             (190.0, 40.0),
             (200.0, 35.0),
         ],
-        maxlen=60,
     )
 
     eta = _call_attr(
@@ -2800,16 +3124,16 @@ def test_cooldown_helpers_early_return_paths(
     _set_time(monkeypatch, 100.0)
     _get_attr(plugin_any, _member("settings")).set(["cooldown_ambient_temp"], None)
     _get_attr(plugin_any, _member("settings")).set(["cooldown_fit_window_seconds"], 120)
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 30.0), (95.0, 29.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 30.0), (95.0, 29.0)]
     )
     assert (
         _call_attr(temp_eta_plugin, _member("get_cooldown_ambient_c"), "tool0") is None
     )
 
     # Ambient helper: minimum is too close to current -> None.
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 50.0), (95.0, 49.5), (100.0, 49.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 50.0), (95.0, 49.5), (100.0, 49.0)]
     )
     assert (
         _call_attr(temp_eta_plugin, _member("get_cooldown_ambient_c"), "tool0") is None
@@ -2864,8 +3188,8 @@ def test_calculate_cooldown_linear_eta_dt_nonpositive_and_remaining_nonpositive(
     _set_time(monkeypatch, 100.0)
 
     # dt <= 0
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(100.0, 60.0), (100.0, 50.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(100.0, 60.0), (100.0, 50.0)]
     )
     assert (
         _call_attr(
@@ -2878,8 +3202,8 @@ def test_calculate_cooldown_linear_eta_dt_nonpositive_and_remaining_nonpositive(
     )
 
     # remaining <= 0
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
-        [(90.0, 60.0), (100.0, 50.0)], maxlen=60
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any, [(90.0, 60.0), (100.0, 50.0)]
     )
     assert (
         _call_attr(
@@ -2900,7 +3224,8 @@ def test_calculate_cooldown_exponential_eta_invalid_inputs_return_none(
     _get_attr(plugin_any, _member("settings")).set(["cooldown_fit_window_seconds"], 120)
     _set_time(monkeypatch, 200.0)
 
-    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = deque(
+    _get_attr(plugin_any, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        plugin_any,
         [
             (150.0, 80.0),
             (160.0, 65.0),
@@ -2909,7 +3234,6 @@ def test_calculate_cooldown_exponential_eta_invalid_inputs_return_none(
             (190.0, 40.0),
             (200.0, 35.0),
         ],
-        maxlen=60,
     )
 
     assert (
@@ -2994,20 +3318,20 @@ def test_reset_profile_history_handles_path_resolution_exception(
     assert not _get_attr(plugin_any, _member("temp_history"))["tool0"]
 
 
-def test_calculate_linear_eta_returns_none_with_insufficient_history(
+def test_calculate_heating_etas_linear_returns_none_with_insufficient_history(
     temp_eta_plugin: Any,
 ) -> None:
-    """Test calculate linear eta returns none with insufficient history."""
+    """Test linear heating ETA returns none with insufficient history."""
     _get_attr(temp_eta_plugin, _member("temp_history"))["tool0"] = deque(
         [(1.0, 20.0, 200.0)], maxlen=60
     )
     assert (
-        _call_attr(temp_eta_plugin, _member("calculate_linear_eta"), "tool0", 200.0)
+        _heating_eta(temp_eta_plugin, 200.0, "linear")
         is None
     )
 
 
-def test_calculate_linear_eta_simple(
+def test_calculate_heating_etas_linear_simple(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
     """Linear ETA uses last 10 seconds and returns remaining/rate."""
@@ -3017,15 +3341,15 @@ def test_calculate_linear_eta_simple(
         [(95.0, 20.0, 50.0), (100.0, 30.0, 50.0)], maxlen=60
     )
 
-    eta = _call_attr(temp_eta_plugin, _member("calculate_linear_eta"), "tool0", 50.0)
+    eta = _heating_eta(temp_eta_plugin, 50.0, "linear")
     assert eta is not None
     assert abs(eta - 10.0) < 1e-6
 
 
-def test_calculate_linear_eta_edge_cases(
+def test_calculate_heating_etas_linear_edge_cases(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate linear eta edge cases."""
+    """Test linear heating ETA edge cases."""
     _set_time(monkeypatch, 100.0)
 
     # time_diff <= 0
@@ -3033,7 +3357,7 @@ def test_calculate_linear_eta_edge_cases(
         [(100.0, 20.0, 50.0), (100.0, 30.0, 50.0)], maxlen=60
     )
     assert (
-        _call_attr(temp_eta_plugin, _member("calculate_linear_eta"), "tool0", 50.0)
+        _heating_eta(temp_eta_plugin, 50.0, "linear")
         is None
     )
 
@@ -3042,7 +3366,7 @@ def test_calculate_linear_eta_edge_cases(
         [(95.0, 30.0, 50.0), (100.0, 20.0, 50.0)], maxlen=60
     )
     assert (
-        _call_attr(temp_eta_plugin, _member("calculate_linear_eta"), "tool0", 50.0)
+        _heating_eta(temp_eta_plugin, 50.0, "linear")
         is None
     )
 
@@ -3051,29 +3375,27 @@ def test_calculate_linear_eta_edge_cases(
         [(95.0, 20.0, 50.0), (100.0, 30.0, 50.0)], maxlen=60
     )
     assert (
-        _call_attr(temp_eta_plugin, _member("calculate_linear_eta"), "tool0", 25.0)
+        _heating_eta(temp_eta_plugin, 25.0, "linear")
         is None
     )
 
 
-def test_calculate_exponential_eta_falls_back_to_linear_when_not_enough_points(
+def test_calculate_heating_etas_exponential_falls_back_to_linear_when_not_enough_points(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate exponential eta falls back to linear when not enough points."""
+    """Test exponential heating ETA falls back to linear when not enough points."""
     _set_time(monkeypatch, 30.0)
     _get_attr(temp_eta_plugin, _member("temp_history"))["tool0"] = deque(
         [(15.0, 20.0, 100.0), (25.0, 30.0, 100.0), (30.0, 40.0, 100.0)], maxlen=60
     )
     # < 6 points in window => exponential falls back to linear, which needs 2 recent points.
     assert (
-        _call_attr(
-            temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", 100.0
-        )
+        _heating_eta(temp_eta_plugin, 100.0, "exponential")
         is not None
     )
 
 
-def test_calculate_exponential_eta_returns_number_for_reasonable_curve(
+def test_calculate_heating_etas_exponential_returns_number_for_reasonable_curve(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
     """Exponential ETA should return a positive number for a smooth heating curve."""
@@ -3094,17 +3416,15 @@ def test_calculate_exponential_eta_returns_number_for_reasonable_curve(
         points, maxlen=60
     )
 
-    eta = _call_attr(
-        temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", target
-    )
+    eta = _heating_eta(temp_eta_plugin, target, "exponential")
     assert eta is not None
     assert eta > 0
 
 
-def test_calculate_exponential_eta_returns_zero_when_within_epsilon(
+def test_calculate_heating_etas_exponential_returns_zero_when_within_epsilon(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate exponential eta returns zero when within epsilon."""
+    """Test exponential heating ETA returns zero when within epsilon."""
     target = 100.0
     _set_time(monkeypatch, 100.0)
     # 6+ points, last is within 0.5C of target.
@@ -3120,16 +3440,14 @@ def test_calculate_exponential_eta_returns_zero_when_within_epsilon(
         ],
         maxlen=60,
     )
-    eta = _call_attr(
-        temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", target
-    )
+    eta = _heating_eta(temp_eta_plugin, target, "exponential")
     assert eta == 0.0
 
 
-def test_calculate_exponential_eta_returns_none_when_not_heating(
+def test_calculate_heating_etas_exponential_returns_none_when_not_heating(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate exponential eta returns none when not heating."""
+    """Test exponential heating ETA returns none when not heating."""
     target = 100.0
     _set_time(monkeypatch, 100.0)
     # Temperatures essentially flat -> not heating in window.
@@ -3146,17 +3464,15 @@ def test_calculate_exponential_eta_returns_none_when_not_heating(
         maxlen=60,
     )
     assert (
-        _call_attr(
-            temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", target
-        )
+        _heating_eta(temp_eta_plugin, target, "exponential")
         is None
     )
 
 
-def test_calculate_exponential_eta_valueerror_falls_back_to_linear(
+def test_calculate_heating_etas_exponential_valueerror_falls_back_to_linear(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate exponential eta valueerror falls back to linear."""
+    """Test exponential heating ETA valueerror falls back to linear."""
     target = 100.0
     _set_time(monkeypatch, 100.0)
 
@@ -3192,22 +3508,20 @@ def test_calculate_exponential_eta_valueerror_falls_back_to_linear(
     monkeypatch.setattr(calc_module.math, "log", _fake_log)
     monkeypatch.setattr(
         calc_module,
-        "calculate_linear_eta",
-        lambda history, target, window_seconds=10.0: 123.0,
+        "calculate_linear_eta_from_fit",
+        lambda fit, target: 123.0,
     )
 
     assert (
-        _call_attr(
-            temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", target
-        )
+        _heating_eta(temp_eta_plugin, target, "exponential")
         == 123.0
     )
 
 
-def test_calculate_exponential_eta_spike_protection_returns_linear_eta(
+def test_calculate_heating_etas_exponential_spike_protection_returns_linear_eta(
     monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
 ) -> None:
-    """Test calculate exponential eta spike protection returns linear eta."""
+    """Test exponential heating ETA spike protection returns linear eta."""
     target = 100.0
     _set_time(monkeypatch, 100.0)
 
@@ -3227,13 +3541,11 @@ def test_calculate_exponential_eta_spike_protection_returns_linear_eta(
     # Force the final comparison to trigger.
     monkeypatch.setattr(
         calc_module,
-        "calculate_linear_eta",
-        lambda history, target, window_seconds=10.0: 0.1,
+        "calculate_linear_eta_from_fit",
+        lambda fit, target: 0.1,
     )
     assert (
-        _call_attr(
-            temp_eta_plugin, _member("calculate_exponential_eta"), "tool0", target
-        )
+        _heating_eta(temp_eta_plugin, target, "exponential")
         == 0.1
     )
 
@@ -3329,10 +3641,13 @@ def test_broadcast_publishes_to_mqtt_when_configured(
         def __init__(self) -> None:
             """Initialize test helper state."""
             self.calls: list[dict[str, Any]] = []
+            self.batches = 0
 
-        def publish_eta_update(self, **kwargs: Any) -> None:
+        def publish_eta_batch(self, entries: dict[str, Any]) -> None:
             """Provide a test stub implementation."""
-            self.calls.append(dict(kwargs))
+            self.batches += 1
+            for heater, entry in entries.items():
+                self.calls.append({"heater": heater, **entry})
 
     mqtt_client = RecordingMQTT()
     _set_attr(temp_eta_plugin, _member("mqtt_client"), mqtt_client)
@@ -3340,6 +3655,7 @@ def test_broadcast_publishes_to_mqtt_when_configured(
     _call_attr(temp_eta_plugin, _member("calculate_and_broadcast_eta"), data)
 
     heaters = {c.get("heater") for c in mqtt_client.calls}
+    assert mqtt_client.batches == 1
     assert "tool0" in heaters
     assert "bed" in heaters
     assert "chamber" not in heaters
@@ -3378,7 +3694,7 @@ def test_broadcast_mqtt_publish_connection_errors_are_logged(
     class FailingMQTT:
         """Raise errors intentionally for failure-path tests."""
 
-        def publish_eta_update(self, **_kwargs: Any) -> None:
+        def publish_eta_batch(self, _entries: dict[str, Any]) -> None:
             """Provide a test stub implementation."""
             raise ConnectionError("offline")
 
@@ -3426,7 +3742,7 @@ def test_broadcast_mqtt_publish_other_errors_are_logged_debug(
     class FailingMQTT:
         """Raise errors intentionally for failure-path tests."""
 
-        def publish_eta_update(self, **_kwargs: Any) -> None:
+        def publish_eta_batch(self, _entries: dict[str, Any]) -> None:
             """Provide a test stub implementation."""
             raise RuntimeError("boom")
 
@@ -3462,11 +3778,7 @@ def test_broadcast_filters_unsupported_heaters(
     _call_attr(temp_eta_plugin, _member("calculate_and_broadcast_eta"), data)
 
     pm = cast(DummyPluginManager, _get_attr(temp_eta_plugin, _member("plugin_manager")))
-    heaters = [
-        m["payload"].get("heater")
-        for m in pm.messages
-        if m["payload"].get("type") == "eta_update"
-    ]
+    heaters = [u["heater"] for u in pm.heater_updates()]
     assert "tool0" in heaters
     assert "bed" in heaters
     assert "chamber" not in heaters
@@ -3491,7 +3803,7 @@ def test_suppress_while_printing_clears_once(
 
     pm = cast(DummyPluginManager, _get_attr(p_any, _member("plugin_manager")))
     # Should have emitted clear messages for known heaters.
-    clears = [m for m in pm.messages if m["payload"].get("eta") is None]
+    clears = [u for u in pm.heater_updates() if u["eta"] is None]
     assert clears
 
     before = len(pm.messages)
@@ -3555,7 +3867,7 @@ def test_persist_and_restore_profile_history(
     )
     _set_attr(p1_any, _member("history_dirty"), True)
     _call_attr(p1, _member("persist_current_profile_history"))
-    assert (tmp_path / "history_default.json").exists()
+    assert (tmp_path / "history_default.bin").exists()
 
     # Restore in a new instance.
     p2 = TempETAPlugin()
@@ -3600,11 +3912,7 @@ def test_reset_all_profile_histories_deletes_files_and_clears_ui(
     assert deleted == 2
 
     pm = cast(DummyPluginManager, _get_attr(temp_eta_plugin, _member("plugin_manager")))
-    heaters = [
-        m["payload"].get("heater")
-        for m in pm.messages
-        if m["payload"].get("type") == "eta_update"
-    ]
+    heaters = [u["heater"] for u in pm.heater_updates()]
     assert set(heaters) == {"tool0", "bed"}
 
 
@@ -3634,8 +3942,7 @@ def test_reset_all_profile_histories_handles_delete_failure(
 
     pm = cast(DummyPluginManager, _get_attr(temp_eta_plugin, _member("plugin_manager")))
     assert any(
-        m["payload"].get("heater") == "tool0" and m["payload"].get("eta") is None
-        for m in pm.messages
+        u["heater"] == "tool0" and u["eta"] is None for u in pm.heater_updates()
     )
 
 
@@ -3710,8 +4017,7 @@ def test_on_settings_save_disabling_plugin_clears_frontend(
 
     pm = cast(DummyPluginManager, _get_attr(p_any, _member("plugin_manager")))
     assert any(
-        m["payload"].get("heater") == "tool0" and m["payload"].get("eta") is None
-        for m in pm.messages
+        u["heater"] == "tool0" and u["eta"] is None for u in pm.heater_updates()
     )
 
 
@@ -3784,6 +4090,136 @@ def test_load_profile_history_filters_old_and_future(
     assert list(loaded["tool0"]) == [(95.0, 20.0, 50.0)]
 
 
+def test_load_profile_history_migrates_legacy_json(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Legacy JSON history should be rewritten as a binary file once."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_time(monkeypatch, 100.0)
+
+    payload = {
+        "version": 1,
+        "saved_at": 100.0,
+        "profile_id": "default",
+        "history_size": 60,
+        "samples": {"tool0": [[95.0, 20.0, 50.0], [99.0, 30.0, 50.0]]},
+    }
+    legacy_path = tmp_path / "history_default.json"
+    legacy_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    loaded = _call_attr(temp_eta_plugin, _member("load_profile_history"), "default")
+    assert list(loaded["tool0"]) == [(95.0, 20.0, 50.0), (99.0, 30.0, 50.0)]
+    assert not legacy_path.exists()
+    assert read_history_file(tmp_path / "history_default.bin") == {
+        "tool0": [(95.0, 20.0, 50.0), (99.0, 30.0, 50.0)]
+    }
+
+    reloaded = _call_attr(temp_eta_plugin, _member("load_profile_history"), "default")
+    assert list(reloaded["tool0"]) == list(loaded["tool0"])
+
+
+def test_persist_current_profile_history_appends_new_samples(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """A second persist should only append the samples recorded since the first."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_attr(temp_eta_plugin, _member("active_profile_id"), "default")
+    _set_time(monkeypatch, 100.0)
+
+    history = deque([(90.0 + i, 20.0 + i, 50.0) for i in range(10)], maxlen=60)
+    _set_attr(temp_eta_plugin, _member("temp_history"), {"tool0": history})
+    _set_attr(temp_eta_plugin, _member("history_dirty"), True)
+    _call_attr(temp_eta_plugin, _member("persist_current_profile_history"))
+
+    path = tmp_path / "history_default.bin"
+    size_after_compact = path.stat().st_size
+
+    history.extend([(100.0, 30.0, 50.0), (101.0, 31.0, 50.0)])
+    _set_attr(temp_eta_plugin, _member("history_dirty"), True)
+    _call_attr(temp_eta_plugin, _member("persist_current_profile_history"))
+
+    assert path.stat().st_size == size_after_compact + 2 * RECORD_SIZE
+    assert read_history_file(path) == {"tool0": list(history)}
+    assert _get_attr(temp_eta_plugin, _member("history_dirty")) is False
+
+
+def test_persist_current_profile_history_checkpoints_periodically(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Journal entries should be folded into a checkpoint every N persists."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_attr(temp_eta_plugin, _member("active_profile_id"), "default")
+    _set_attr(temp_eta_plugin, _member("persist_checkpoint_entries"), 2)
+    _set_time(monkeypatch, 100.0)
+
+    history = deque([(90.0, 20.0, 50.0)], maxlen=3)
+    _set_attr(temp_eta_plugin, _member("temp_history"), {"tool0": history})
+    path = tmp_path / "history_default.bin"
+
+    sizes = []
+    for i in range(4):
+        if i:
+            history.append((90.0 + i, 20.0 + i, 50.0))
+        _set_attr(temp_eta_plugin, _member("history_dirty"), True)
+        _call_attr(temp_eta_plugin, _member("persist_current_profile_history"))
+        sizes.append(path.stat().st_size)
+
+    # compact, append, append, checkpoint (maxlen dropped the oldest row).
+    assert sizes[1] == sizes[0] + RECORD_SIZE
+    assert sizes[2] == sizes[1] + RECORD_SIZE
+    assert sizes[3] == sizes[0] + 2 * RECORD_SIZE
+    assert read_history_file(path) == {"tool0": list(history)}
+    assert _get_attr(temp_eta_plugin, _member("history_file")).entries == 0
+
+
+def test_restored_history_resumes_journal(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """After a restart the first persist should append instead of rewriting."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_time(monkeypatch, 100.0)
+    path = tmp_path / "history_default.bin"
+    persistence.HistoryFile(path).compact(
+        {"tool0": [(95.0, 20.0, 50.0), (99.0, 30.0, 50.0)]}
+    )
+    size_before = path.stat().st_size
+
+    _call_attr(temp_eta_plugin, _member("switch_active_profile_if_needed"), force=True)
+    assert _get_attr(temp_eta_plugin, _member("history_file")) is not None
+
+    history = _get_attr(temp_eta_plugin, _member("temp_history"))["tool0"]
+    history.append((100.0, 35.0, 50.0))
+    _set_attr(temp_eta_plugin, _member("history_dirty"), True)
+    _call_attr(temp_eta_plugin, _member("persist_current_profile_history"))
+
+    assert path.stat().st_size == size_before + RECORD_SIZE
+    assert read_history_file(path)["tool0"][-1] == (100.0, 35.0, 50.0)
+
+
+def test_restored_history_with_future_rows_checkpoints(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Rows dropped as future on load must not block journaling new samples."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_time(monkeypatch, 100.0)
+    path = tmp_path / "history_default.bin"
+    persistence.HistoryFile(path).compact(
+        {"tool0": [(95.0, 20.0, 50.0), (500.0, 30.0, 50.0)]}
+    )
+
+    _call_attr(temp_eta_plugin, _member("switch_active_profile_if_needed"), force=True)
+    assert _get_attr(temp_eta_plugin, _member("history_file")) is None
+
+    history = _get_attr(temp_eta_plugin, _member("temp_history"))["tool0"]
+    history.append((100.0, 35.0, 50.0))
+    _set_attr(temp_eta_plugin, _member("history_dirty"), True)
+    _call_attr(temp_eta_plugin, _member("persist_current_profile_history"))
+
+    assert read_history_file(path) == {
+        "tool0": [(95.0, 20.0, 50.0), (100.0, 35.0, 50.0)]
+    }
+
+
 def test_reset_profile_history_deletes_file_and_clears(
     tmp_path: Path, temp_eta_plugin: Any
 ) -> None:
@@ -3802,8 +4238,7 @@ def test_reset_profile_history_deletes_file_and_clears(
 
     pm = cast(DummyPluginManager, _get_attr(temp_eta_plugin, _member("plugin_manager")))
     assert any(
-        m["payload"].get("heater") == "tool0" and m["payload"].get("eta") is None
-        for m in pm.messages
+        u["heater"] == "tool0" and u["eta"] is None for u in pm.heater_updates()
     )
 
 
@@ -3821,7 +4256,7 @@ def test_persist_current_profile_history_early_returns(
         temp_eta_plugin,
         _member("persist_current_profile_history"),
     )
-    assert not (tmp_path / "history_default.json").exists()
+    assert not (tmp_path / "history_default.bin").exists()
 
     # Dirty but no samples.
     _set_attr(plugin_any, _member("active_profile_id"), "default")
@@ -3831,7 +4266,7 @@ def test_persist_current_profile_history_early_returns(
         temp_eta_plugin,
         _member("persist_current_profile_history"),
     )
-    assert not (tmp_path / "history_default.json").exists()
+    assert not (tmp_path / "history_default.bin").exists()
 
 
 def test_on_event_disconnect_persists_then_clears(
@@ -3856,7 +4291,7 @@ def test_on_event_disconnect_persists_then_clears(
     _set_time(monkeypatch, 100.0)
     temp_eta_plugin.on_event("Disconnected", {})
 
-    assert (tmp_path / "history_default.json").exists()
+    assert (tmp_path / "history_default.bin").exists()
     assert len(_get_attr(temp_eta_plugin, _member("temp_history"))["tool0"]) == 0
     assert len(_get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"]) == 0
 
@@ -3883,11 +4318,78 @@ def test_on_event_error_persists_then_clears(
     _set_time(monkeypatch, 100.0)
     temp_eta_plugin.on_event("Error", {})
 
-    assert (tmp_path / "history_default.json").exists()
+    assert (tmp_path / "history_default.bin").exists()
     assert len(_get_attr(temp_eta_plugin, _member("temp_history"))["tool0"]) == 0
     assert len(_get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"]) == 0
 
 
+def test_on_event_disconnect_does_not_wait_for_persist_worker(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Disconnect hands the history to a busy persist worker without blocking."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    p_any = cast(Any, temp_eta_plugin)
+    _set_attr(p_any, _member("active_profile_id"), "default")
+    rows = [(95.0, 20.0, 50.0), (96.0, 21.0, 50.0)]
+    _set_attr(
+        temp_eta_plugin, _member("temp_history"), {"tool0": deque(rows, maxlen=60)}
+    )
+    _set_attr(temp_eta_plugin, _member("history_dirty"), True)
+    _set_time(monkeypatch, 100.0)
+
+    release = threading.Event()
+    process = _get_attr(p_any, _member("process_persist_request"))
+
+    def slow_disk(request: Any) -> None:
+        release.wait(5.0)
+        process(request)
+
+    worker = octoprint_temp_eta.CoalescingWorker(slow_disk, maxsize=1)
+    _set_attr(p_any, _member("persist_worker"), worker)
+    worker.start()
+    try:
+        temp_eta_plugin.on_event("Disconnected", {})
+        # Returned while the write is still pending, with the heaters cleared.
+        assert not (tmp_path / "history_default.bin").exists()
+        assert len(_get_attr(temp_eta_plugin, _member("temp_history"))["tool0"]) == 0
+        release.set()
+        assert worker.flush(5.0)
+    finally:
+        release.set()
+        worker.stop()
+
+    assert read_history_file(tmp_path / "history_default.bin") == {"tool0": rows}
+
+
+def test_reconnect_journals_fresh_history_despite_detached_marks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Samples after Disconnected/Connected are persisted, even at old timestamps."""
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    p_any = cast(Any, temp_eta_plugin)
+    persist = _get_attr(p_any, _member("persist_current_profile_history"))
+
+    for ts, actual in ((95.0, 20.0), (96.0, 21.0)):
+        _set_time(monkeypatch, ts)
+        temp_eta_plugin.on_printer_add_temperature(
+            {"tool0": {"actual": actual, "target": 50.0}}
+        )
+    persist()
+    profile_id = _get_attr(p_any, _member("active_profile_id"))
+    path = tmp_path / f"history_{profile_id}.bin"
+    assert read_history_file(path)["tool0"][-1] == (96.0, 21.0, 50.0)
+
+    temp_eta_plugin.on_event("Disconnected", {})
+    temp_eta_plugin.on_event("Connected", {})
+    # Same wall-clock second as the last journaled row of the old history.
+    temp_eta_plugin.on_printer_add_temperature(
+        {"tool0": {"actual": 22.0, "target": 50.0}}
+    )
+    persist()
+
+    assert (96.0, 22.0, 50.0) in read_history_file(path)["tool0"]
+
+
 def test_on_event_print_started_resets_suppression_flag(temp_eta_plugin: Any) -> None:
     """Test on event print started resets suppression flag."""
     p_any = cast(Any, temp_eta_plugin)
@@ -3947,8 +4449,8 @@ def test_calculate_cooldown_linear_eta_simple(
 
     # Cooling: 100C -> 90C over 10s => -1 C/s. Goal 80C => remaining 10C => 10s.
     _set_time(monkeypatch, 10.0)
-    _get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"] = deque(
-        [(0.0, 100.0), (10.0, 90.0)], maxlen=60
+    _get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        temp_eta_plugin, [(0.0, 100.0), (10.0, 90.0)]
     )
 
     eta = _call_attr(
@@ -3981,8 +4483,8 @@ def test_calculate_cooldown_exponential_eta_returns_number_for_reasonable_curve(
         (60.0, 41.0),
     ]
     _set_time(monkeypatch, 60.0)
-    _get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"] = deque(
-        points, maxlen=60
+    _get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        temp_eta_plugin, points
     )
 
     eta = _call_attr(
@@ -4010,8 +4512,8 @@ def test_broadcast_includes_cooldown_eta_when_target_is_zero(
 
     # Provide cooldown history for a falling temperature.
     _set_time(monkeypatch, 10.0)
-    _get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"] = deque(
-        [(0.0, 80.0), (10.0, 70.0)], maxlen=60
+    _get_attr(temp_eta_plugin, _member("cooldown_history"))["tool0"] = _cooldown_rows(
+        temp_eta_plugin, [(0.0, 80.0), (10.0, 70.0)]
     )
 
     pm = cast(DummyPluginManager, _get_attr(temp_eta_plugin, _member("plugin_manager")))
@@ -4022,10 +4524,9 @@ def test_broadcast_includes_cooldown_eta_when_target_is_zero(
         {"tool0": {"actual": 70.0, "target": 0.0}},
     )
 
-    msgs = [m["payload"] for m in pm.messages if m["payload"].get("heater") == "tool0"]
+    msgs = [u for u in pm.heater_updates() if u["heater"] == "tool0"]
     assert msgs
     payload = msgs[-1]
-    assert payload.get("type") == "eta_update"
     assert payload.get("eta_kind") in ("cooling", None)
     # When cooling ETA is available, cooldown_target should be provided.
     if payload.get("eta_kind") == "cooling":
@@ -4085,11 +4586,7 @@ def test_broadcast_sends_only_supported_heaters(
         }
     )
 
-    heaters = [
-        m["payload"]["heater"]
-        for m in pm.messages
-        if m["payload"].get("type") == "eta_update"
-    ]
+    heaters = [u["heater"] for u in pm.heater_updates()]
     assert "tool0" in heaters
     assert "bed" in heaters
     assert "tool1" not in heaters
@@ -4174,3 +4671,419 @@ def test_on_api_get_connected_false_when_client_missing_but_enabled(
     assert resp["mqtt_available"] is True
     assert resp["mqtt_enabled"] is True
     assert resp["mqtt_connected"] is False
+    assert resp["mqtt_queue"] is None
+    assert resp["mqtt_connection"] is None
+
+
+def test_on_api_get_reports_mqtt_queue_stats(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """MQTT queue and connection counters are reported by the Simple API."""
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+    client = octoprint_temp_eta.MQTTClientWrapper(DummyLogger(), "temp_eta")
+    _set_attr(cast(Any, temp_eta_plugin), _member("mqtt_client"), client)
+
+    resp = temp_eta_plugin.on_api_get(None)
+    stats = resp["mqtt_queue"]
+
+    assert stats["running"] is False
+    assert stats["queue_depth"] == 0
+    assert stats["dropped"] == 0
+    connection = resp["mqtt_connection"]
+    assert connection["reconnects"] == 0
+    assert connection["next_attempt_in_s"] is None
+    assert connection["offline_buffer"]["depth"] == 0
+
+
+def test_temperature_callback_hands_ticks_to_worker(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """With the worker running, ETA ticks are computed off the callback thread."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_time(monkeypatch, 100.0)
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+
+    ticks: list[tuple[Any, str]] = []
+    done = threading.Event()
+
+    def record_tick(tick: Any) -> None:
+        ticks.append((tick, threading.current_thread().name))
+        done.set()
+
+    worker = octoprint_temp_eta.CoalescingWorker(record_tick, name="test-eta")
+    _set_attr(p_any, _member("eta_worker"), worker)
+    worker.start()
+    try:
+        temp_eta_plugin.on_printer_add_temperature(
+            {"tool0": {"actual": 20.0, "target": 200.0}}
+        )
+        assert done.wait(5.0)
+    finally:
+        temp_eta_plugin.on_event("Shutdown", {})
+
+    (data, now), thread_name = ticks[0]
+    assert data == {"tool0": {"actual": 20.0, "target": 200.0}}
+    assert now == 100.0
+    assert thread_name == "test-eta"
+    assert worker.running is False
+
+    stats = temp_eta_plugin.on_api_get(None)["eta_worker"]
+    assert stats["submitted"] == 1
+    assert stats["processed"] == 1
+    assert stats["queue_depth"] == 0
+
+
+class CountingPrinterProfileManager(DummyPrinterProfileManager):
+    """Profile manager stub counting profile lookups."""
+
+    def __init__(self, profile: dict[str, Any]) -> None:
+        """Initialize test helper state."""
+        super().__init__(profile)
+        self.lookups = 0
+
+    def get_current_or_default(self) -> dict[str, Any]:
+        """Return the profile and count the call."""
+        self.lookups += 1
+        return super().get_current_or_default()
+
+
+def test_temperature_callback_checks_profile_only_after_events(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Profile lookups happen once per profile event, not on every tick."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_attr(p_any, _member("calculate_and_broadcast_eta"), lambda _data: None)
+    profile = {
+        "id": "default",
+        "name": "Default",
+        "heatedBed": True,
+        "heatedChamber": False,
+        "extruder": {"count": 1},
+    }
+    ppm = CountingPrinterProfileManager(profile)
+    _set_attr(p_any, _member("printer_profile_manager"), ppm)
+
+    def tick(t: float) -> None:
+        _set_time(monkeypatch, t)
+        temp_eta_plugin.on_printer_add_temperature(
+            {"tool0": {"actual": 20.0, "target": 200.0}}
+        )
+
+    tick(100.0)
+    assert _call_attr(temp_eta_plugin, _member("is_heater_supported"), "bed") is True
+    lookups = ppm.lookups
+    for i in range(1, 5):
+        tick(100.0 + i)
+        assert _call_attr(temp_eta_plugin, _member("is_heater_supported"), "bed") is True
+    assert ppm.lookups == lookups
+
+    # Same profile id, but the bed was removed: the support cache must reset.
+    profile["heatedBed"] = False
+    temp_eta_plugin.on_event("PrinterProfileModified", {"identifier": "default"})
+    tick(110.0)
+    assert ppm.lookups == lookups + 1
+    assert _call_attr(temp_eta_plugin, _member("is_heater_supported"), "bed") is False
+    assert _get_attr(p_any, _member("active_profile_id")) == "default"
+
+
+def test_connected_event_switches_profile_on_next_tick(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Connecting with another profile swaps the active profile history."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_attr(p_any, _member("calculate_and_broadcast_eta"), lambda _data: None)
+    _set_time(monkeypatch, 100.0)
+    temp_eta_plugin.on_printer_add_temperature(
+        {"tool0": {"actual": 20.0, "target": 200.0}}
+    )
+    assert _get_attr(p_any, _member("active_profile_id")) == "default"
+
+    _set_attr(
+        p_any,
+        _member("printer_profile_manager"),
+        DummyPrinterProfileManager(
+            {"id": "other", "name": "Other", "heatedBed": True, "extruder": {"count": 2}}
+        ),
+    )
+    temp_eta_plugin.on_printer_add_temperature(
+        {"tool0": {"actual": 21.0, "target": 200.0}}
+    )
+    assert _get_attr(p_any, _member("active_profile_id")) == "default"
+
+    temp_eta_plugin.on_event("Connected", {"printer_profile": "other"})
+    temp_eta_plugin.on_printer_add_temperature(
+        {"tool1": {"actual": 21.0, "target": 200.0}}
+    )
+    assert _get_attr(p_any, _member("active_profile_id")) == "other"
+    assert _call_attr(temp_eta_plugin, _member("is_heater_supported"), "tool1") is True
+
+
+def test_temperature_callback_does_not_read_settings(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """After the snapshot is built, ticks never touch the settings tree."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_time(monkeypatch, 100.0)
+    settings = cast(DummySettings, _get_attr(p_any, _member("settings")))
+    settings.set(["enable_cooldown_eta"], True)
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    config = _get_attr(p_any, _member("runtime_config"))
+
+    def _boom(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("settings read on the hot path")
+
+    for name in ("get", "get_boolean", "get_float", "get_int"):
+        monkeypatch.setattr(settings, name, _boom)
+
+    for i in range(3):
+        _set_time(monkeypatch, 100.0 + i)
+        temp_eta_plugin.on_printer_add_temperature(
+            {
+                "tool0": {"actual": 20.0 + i, "target": 200.0},
+                "bed": {"actual": 80.0 - i, "target": 0.0},
+            }
+        )
+
+    assert _get_attr(p_any, _member("runtime_config")) is config
+    assert len(_get_attr(p_any, _member("temp_history"))["tool0"]) == 3
+
+
+def test_settings_apply_on_refresh_only(temp_eta_plugin: Any) -> None:
+    """Settings changes take effect when the snapshot is rebuilt (save/startup)."""
+    p_any = cast(Any, temp_eta_plugin)
+    settings = cast(DummySettings, _get_attr(p_any, _member("settings")))
+    before = _call_attr(temp_eta_plugin, _member("get_runtime_config"))
+    assert before.algorithm == "linear"
+
+    settings.set(["algorithm"], "exponential")
+    settings.set(["enabled"], False)
+    assert _call_attr(temp_eta_plugin, _member("get_runtime_config")) is before
+
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    after = _call_attr(temp_eta_plugin, _member("get_runtime_config"))
+    assert after is not before
+    assert after.algorithm == "exponential"
+    assert after.enabled is False
+
+
+def test_persist_requests_run_on_persist_worker(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, temp_eta_plugin: Any
+) -> None:
+    """Due persists are written by the persistence worker; Shutdown flushes it."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    _set_attr(p_any, _member("active_profile_id"), "default")
+    _set_time(monkeypatch, 100.0)
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+
+    threads: list[str] = []
+    persist = octoprint_temp_eta.TempETAPlugin._persist_current_profile_history
+
+    def record_persist(self: Any) -> None:
+        threads.append(threading.current_thread().name)
+        persist(self)
+
+    monkeypatch.setattr(
+        octoprint_temp_eta.TempETAPlugin,
+        "_persist_current_profile_history",
+        record_persist,
+    )
+
+    worker = octoprint_temp_eta.CoalescingWorker(
+        _get_attr(p_any, _member("process_persist_request")),
+        name="test-persist",
+        maxsize=1,
+    )
+    _set_attr(p_any, _member("persist_worker"), worker)
+    worker.start()
+
+    _set_attr(
+        p_any,
+        _member("temp_history"),
+        {"tool0": deque([(99.0, 20.0, 50.0), (100.0, 21.0, 50.0)], maxlen=60)},
+    )
+    _set_attr(p_any, _member("history_dirty"), True)
+    _set_attr(p_any, _member("next_persist_time"), 50.0)
+    _call_attr(temp_eta_plugin, _member("maybe_persist_history"), 100.0)
+    assert worker.flush(5.0)
+    assert threads == ["test-persist"]
+    assert (tmp_path / "history_default.bin").exists()
+
+    temp_eta_plugin.on_event("Shutdown", {})
+    assert threads == ["test-persist", "test-persist"]
+    assert worker.running is False
+    stats = temp_eta_plugin.on_api_get(None)["persist_worker"]
+    assert stats["processed"] == 2
+
+
+def test_flush_history_times_out_with_warning(temp_eta_plugin: Any) -> None:
+    """A stuck persistence worker must not block disconnect handling forever."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_attr(p_any, _member("logger"), WarningRecordingLogger())
+    release = threading.Event()
+    worker = octoprint_temp_eta.CoalescingWorker(lambda _item: release.wait(5.0))
+    _set_attr(p_any, _member("persist_worker"), worker)
+    worker.start()
+    try:
+        assert _call_attr(temp_eta_plugin, _member("flush_history"), 0.05) is False
+    finally:
+        release.set()
+        worker.stop()
+    logger = _get_attr(p_any, _member("logger"))
+    assert any("did not finish" in msg for msg in logger.warning_calls)
+
+
+def test_refresh_runtime_caches_reads_fsync_policy(temp_eta_plugin: Any) -> None:
+    """Only known durability policies are applied."""
+    p_any = cast(Any, temp_eta_plugin)
+    settings = cast(DummySettings, _get_attr(p_any, _member("settings")))
+
+    settings.set(["persist_fsync"], "File+Dir")
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    assert _get_attr(p_any, _member("persist_fsync")) == "file+dir"
+
+    settings.set(["persist_fsync"], "always")
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+    assert _get_attr(p_any, _member("persist_fsync")) == "file+dir"
+
+
+def test_on_api_get_reports_stage_metrics(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """Instrumented hot-path stages show up under the metrics key."""
+    _set_time(monkeypatch, 100.0)
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+    settings = _get_attr(cast(Any, temp_eta_plugin), _member("settings"))
+    settings.set(["enable_heating_eta"], True)
+
+    temp_eta_plugin.on_printer_add_temperature(
+        {"tool0": {"actual": 20.0, "target": 200.0}}
+    )
+    metrics = temp_eta_plugin.on_api_get(None)["metrics"]
+
+    assert metrics["on_printer_add_temperature"]["count"] == 1
+    assert metrics["calculate_and_broadcast_eta"]["count"] == 1
+    assert metrics["calculator.batch"]["count"] == 1
+    stage = metrics["on_printer_add_temperature"]
+    assert 0.0 <= stage["p50_ms"] <= stage["p99_ms"] <= stage["max_ms"]
+
+
+def test_on_api_get_reports_heater_snapshots(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """The last broadcast ETA per heater is reported under the heaters key."""
+    _set_time(monkeypatch, 100.0)
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+
+    temp_eta_plugin.on_printer_add_temperature(
+        {"tool0": {"actual": 20.0, "target": 200.0}}
+    )
+    heaters = temp_eta_plugin.on_api_get(None)["heaters"]
+
+    assert heaters["tool0"] == {
+        "target": 200.0,
+        "eta": None,
+        "eta_kind": None,
+        "samples": 1,
+        "cooldown_samples": 0,
+    }
+    assert heaters["bed"]["samples"] == 0
+
+
+def test_calculate_heating_etas_evaluates_fit_copies_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any
+) -> None:
+    """All heaters go through one calculate_batch call on copies of their fits."""
+    p_any = cast(Any, temp_eta_plugin)
+    batches: list[dict] = []
+    original = calc_module.calculate_batch
+
+    def _recording(histories: Any, targets: Any, config: Any = None) -> Any:
+        batches.append(dict(histories))
+        return original(histories, targets, config)
+
+    monkeypatch.setattr(calc_module, "calculate_batch", _recording)
+    heaters = _get_attr(p_any, _member("heaters"))
+    for name, rate in (("tool0", 2.0), ("bed", 1.0)):
+        state = heaters.state(name)
+        state.history = _call_attr(temp_eta_plugin, _member("new_heater_history"))
+        for i in range(10):
+            state.history.append((float(i), 20.0 + rate * i, 200.0))
+    calculate = _get_attr(p_any, _member("calculate_heating_etas"))
+
+    etas = calculate({"tool0": 200.0, "bed": 60.0, "chamber": 40.0}, "linear")
+
+    assert etas == {
+        "tool0": pytest.approx(81.0),
+        "bed": pytest.approx(31.0),
+    }
+    assert len(batches) == 1
+    assert set(batches[0]) == {"tool0", "bed"}
+    for name, fit in batches[0].items():
+        assert isinstance(fit, calc_module.RollingFit)
+        assert fit is not heaters.state(name).fit
+
+
+def test_concurrent_callbacks_events_and_api_requests(
+    monkeypatch: pytest.MonkeyPatch, temp_eta_plugin: Any, tmp_path: Path
+) -> None:
+    """Callbacks, events, persists and API reads can run concurrently."""
+    p_any = cast(Any, temp_eta_plugin)
+    _set_plugin_data_folder(temp_eta_plugin, tmp_path)
+    monkeypatch.setattr(octoprint_temp_eta, "jsonify", lambda payload: payload)
+    settings = cast(DummySettings, _get_attr(p_any, _member("settings")))
+    settings.set(["update_interval"], 0.0)
+    settings.set(["enable_cooldown_eta"], True)
+    _call_attr(temp_eta_plugin, _member("refresh_runtime_caches"))
+
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def _run(fn: Any) -> None:
+        try:
+            while not stop.is_set():
+                fn()
+        except BaseException as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    def _callback() -> None:
+        for target in (200.0, 0.0):
+            temp_eta_plugin.on_printer_add_temperature(
+                {
+                    "tool0": {"actual": 25.0, "target": target},
+                    "bed": {"actual": 30.0, "target": target / 3},
+                }
+            )
+
+    threads = [
+        threading.Thread(target=_run, args=(_callback,)),
+        threading.Thread(target=_run, args=(_callback,)),
+        threading.Thread(
+            target=_run,
+            args=(lambda: temp_eta_plugin.on_event("PrinterProfileModified", {}),),
+        ),
+        threading.Thread(
+            target=_run, args=(lambda: temp_eta_plugin.on_event("Disconnected", {}),)
+        ),
+        threading.Thread(
+            target=_run,
+            args=(lambda: _call_attr(temp_eta_plugin, _member("request_persist")),),
+        ),
+        threading.Thread(target=_run, args=(lambda: temp_eta_plugin.on_api_get(None),)),
+    ]
+    for thread in threads:
+        thread.start()
+    stop.wait(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=10.0)
+
+    assert not errors
+    assert not any(thread.is_alive() for thread in threads)
+    heaters = temp_eta_plugin.on_api_get(None)["heaters"]
+    assert {"tool0", "bed"} <= set(heaters)
+    history_path = tmp_path / "history_default.bin"
+    if history_path.exists():
+        read_history_file(history_path)
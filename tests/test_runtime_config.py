@@ -0,0 +1,76 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the runtime_config module."""
+
+from unittest import TestCase
+
+from octoprint_temp_eta.runtime_config import RuntimeConfig
+
+
+class TestRuntimeConfig(TestCase):
+    """Test cases for the immutable hot-path settings snapshot."""
+
+    def test_defaults_match_plugin_fallbacks(self):
+        """Test defaults are the values used when settings are unavailable."""
+        config = RuntimeConfig()
+        self.assertTrue(config.enabled)
+        self.assertTrue(config.suppress_while_printing)
+        self.assertEqual(config.algorithm, "linear")
+        self.assertEqual(config.threshold_start_c, 5.0)
+        self.assertEqual(config.update_interval_s, 1.0)
+        self.assertTrue(config.heating_enabled)
+        self.assertFalse(config.cooldown_enabled)
+        self.assertEqual(config.cooldown_mode, "threshold")
+        self.assertEqual(config.cooldown_hysteresis_c, 1.0)
+        self.assertEqual(config.cooldown_fit_window_s, 120.0)
+        self.assertIsNone(config.cooldown_ambient_c)
+
+    def test_is_immutable_and_slotted(self):
+        """Test attributes cannot be set, deleted or added."""
+        config = RuntimeConfig()
+        with self.assertRaises(AttributeError):
+            config.enabled = False
+        with self.assertRaises(AttributeError):
+            del config.enabled
+        with self.assertRaises(AttributeError):
+            config.extra = 1
+        self.assertFalse(hasattr(config, "__dict__"))
+
+    def test_normalizes_enumerations(self):
+        """Test unknown algorithm and cooldown mode fall back to defaults."""
+        config = RuntimeConfig(algorithm="cubic", cooldown_mode="nope")
+        self.assertEqual(config.algorithm, "linear")
+        self.assertEqual(config.cooldown_mode, "threshold")
+        config = RuntimeConfig(algorithm="exponential", cooldown_mode="ambient")
+        self.assertEqual(config.algorithm, "exponential")
+        self.assertEqual(config.cooldown_mode, "ambient")
+
+    def test_replace_returns_updated_copy(self):
+        """Test replace leaves the original untouched and rejects unknown fields."""
+        config = RuntimeConfig()
+        updated = config.replace(threshold_start_c=7, cooldown_enabled=True)
+        self.assertEqual(updated.threshold_start_c, 7.0)
+        self.assertTrue(updated.cooldown_enabled)
+        self.assertEqual(config.threshold_start_c, 5.0)
+        self.assertFalse(config.cooldown_enabled)
+        with self.assertRaises(TypeError):
+            config.replace(nope=1)
+
+    def test_cooldown_target_by_heater(self):
+        """Test threshold-mode goals map tools, bed and chamber."""
+        config = RuntimeConfig(
+            cooldown_target_tool_c=50,
+            cooldown_target_bed_c=40,
+            cooldown_target_chamber_c=None,
+        )
+        self.assertEqual(config.cooldown_target_c("tool0"), 50.0)
+        self.assertEqual(config.cooldown_target_c("tool1"), 50.0)
+        self.assertEqual(config.cooldown_target_c("bed"), 40.0)
+        self.assertIsNone(config.cooldown_target_c("chamber"))
+        self.assertIsNone(config.cooldown_target_c("W"))
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()
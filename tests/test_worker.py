@@ -0,0 +1,141 @@
+# flake8: noqa
+# pylint: disable=line-too-long
+"""Unit tests for the worker module."""
+
+import threading
+from unittest import TestCase
+
+from octoprint_temp_eta.worker import CoalescingWorker
+
+
+class TestCoalescingWorker(TestCase):
+    """Test cases for the coalescing ETA worker."""
+
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.done = threading.Event()
+        self.seen = []
+
+    def _blocking_handler(self, item):
+        """Record *item*, then block the first call until released."""
+        self.seen.append(item)
+        if len(self.seen) == 1:
+            self.started.set()
+            self.release.wait(5.0)
+        else:
+            self.done.set()
+
+    def test_coalesces_to_newest_item(self):
+        """Test ticks queued while busy collapse into the newest one."""
+        worker = CoalescingWorker(self._blocking_handler)
+        worker.start()
+        try:
+            self.assertTrue(worker.submit(0))
+            self.assertTrue(self.started.wait(5.0))
+            for item in range(1, 5):
+                worker.submit(item)
+            self.assertEqual(worker.stats()["queue_depth"], 4)
+            self.release.set()
+            self.assertTrue(self.done.wait(5.0))
+        finally:
+            worker.stop()
+
+        self.assertEqual(self.seen, [0, 4])
+        stats = worker.stats()
+        self.assertEqual(stats["submitted"], 5)
+        self.assertEqual(stats["processed"], 2)
+        self.assertEqual(stats["dropped"], 3)
+        self.assertEqual(stats["max_queue_depth"], 4)
+
+    def test_full_queue_drops_oldest(self):
+        """Test a full queue evicts its oldest item."""
+        worker = CoalescingWorker(self._blocking_handler, maxsize=2)
+        worker.start()
+        try:
+            worker.submit(0)
+            self.assertTrue(self.started.wait(5.0))
+            for item in range(1, 4):
+                worker.submit(item)
+            self.assertEqual(worker.stats()["queue_depth"], 2)
+            self.assertEqual(worker.dropped, 1)
+            self.release.set()
+            self.assertTrue(self.done.wait(5.0))
+        finally:
+            worker.stop()
+        self.assertEqual(self.seen, [0, 3])
+
+    def test_submit_requires_running_worker(self):
+        """Test submit refuses items before start and after stop."""
+        worker = CoalescingWorker(self.seen.append)
+        self.assertFalse(worker.running)
+        self.assertFalse(worker.submit(1))
+        worker.start()
+        self.assertTrue(worker.running)
+        worker.stop()
+        self.assertFalse(worker.running)
+        self.assertFalse(worker.submit(2))
+        self.assertEqual(worker.stats()["submitted"], 0)
+
+    def test_handler_errors_do_not_kill_worker(self):
+        """Test a failing tick is logged and later ticks still run."""
+        errors = []
+
+        def handler(item):
+            self.seen.append(item)
+            if item == "bad":
+                self.started.set()
+                raise ValueError("boom")
+            self.done.set()
+
+        class Logger:
+            def error(self, msg, *args):
+                errors.append(msg % args)
+
+        worker = CoalescingWorker(handler, Logger())
+        worker.start()
+        try:
+            worker.submit("bad")
+            self.assertTrue(self.started.wait(5.0))
+            worker.submit("good")
+            self.assertTrue(self.done.wait(5.0))
+        finally:
+            worker.stop()
+        self.assertEqual(self.seen, ["bad", "good"])
+        self.assertEqual(errors, ["ETA worker tick failed: boom"])
+
+    def test_flush_waits_for_in_flight_item(self):
+        """Test flush returns once the queue is drained and the handler is done."""
+        worker = CoalescingWorker(self._blocking_handler)
+        worker.start()
+        try:
+            worker.submit(0)
+            self.assertTrue(self.started.wait(5.0))
+            worker.submit(1)
+            self.assertFalse(worker.flush(0.05))
+            self.release.set()
+            self.assertTrue(worker.flush(5.0))
+            self.assertEqual(self.seen, [0, 1])
+            self.assertEqual(worker.stats()["queue_depth"], 0)
+        finally:
+            worker.stop()
+
+    def test_flush_on_stopped_worker(self):
+        """Test flush on an idle or stopped worker returns immediately."""
+        worker = CoalescingWorker(self.seen.append)
+        self.assertTrue(worker.flush(0.0))
+        worker.start()
+        self.assertTrue(worker.flush(1.0))
+        worker.stop()
+        self.assertTrue(worker.flush(1.0))
+
+    def test_rejects_non_positive_maxsize(self):
+        """Test the queue bound must be positive."""
+        with self.assertRaises(ValueError):
+            CoalescingWorker(self.seen.append, maxsize=0)
+
+
+if __name__ == "__main__":
+    import unittest
+
+    unittest.main()